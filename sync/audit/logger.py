@@ -1,11 +1,11 @@
 """Comprehensive audit logging for sync operations."""
 
-import json
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
+import orjson
 import structlog
 from pydantic import BaseModel, Field
 
@@ -298,6 +298,38 @@ class AuditLogger:
                 error=str(e),
             )
     
+    def log_events(self, events: List[AuditEvent]) -> None:
+        """Log a batch of audit events with a single file write and flush.
+        
+        Args:
+            events: AuditEvents to log, in order
+        """
+        if not events:
+            return
+        
+        try:
+            # Add to summary if available
+            if self.current_summary:
+                for event in events:
+                    self.current_summary.add_event(event)
+            
+            # Write to audit file
+            self._write_events_to_file(events)
+            
+            # Log to structured logger
+            for event in events:
+                self._logger.info(
+                    "Audit event",
+                    **event.to_log_record(),
+                )
+            
+        except Exception as e:
+            self._logger.error(
+                "Failed to log audit events",
+                event_count=len(events),
+                error=str(e),
+            )
+    
     def log_sync_plan_item(
         self,
         plan_item: SyncPlanItem,
@@ -311,7 +343,34 @@ class AuditLogger:
             execution_id: Current execution ID
             phase: Current phase (planning, execution)
         """
-        event = AuditEvent(
+        self.log_event(self._sync_plan_item_event(plan_item, execution_id, phase))
+    
+    def log_sync_plan_items(
+        self,
+        plan_items: Iterable[SyncPlanItem],
+        execution_id: str,
+        phase: str = "planning",
+    ) -> None:
+        """Log several sync plan items as one batch.
+        
+        Args:
+            plan_items: SyncPlanItems to log
+            execution_id: Current execution ID
+            phase: Current phase (planning, execution)
+        """
+        self.log_events([
+            self._sync_plan_item_event(plan_item, execution_id, phase)
+            for plan_item in plan_items
+        ])
+    
+    def _sync_plan_item_event(
+        self,
+        plan_item: SyncPlanItem,
+        execution_id: str,
+        phase: str,
+    ) -> AuditEvent:
+        """Build the audit event for a sync plan item."""
+        return AuditEvent(
             event_id=f"{execution_id}_{plan_item.okta_resource_id}_{phase}",
             event_type=f"sync_plan_{phase}",
             execution_id=execution_id,
@@ -329,8 +388,6 @@ class AuditLogger:
                 "plan_metadata": plan_item.metadata,
             },
         )
-        
-        self.log_event(event)
     
     def log_sync_result(
         self,
@@ -345,7 +402,24 @@ class AuditLogger:
             okta_resource_data: Optional Okta resource data for before_state
             braintrust_resource_data: Optional Braintrust resource data for after_state
         """
-        event = AuditEvent(
+        self.log_event(self._sync_result_event(result, okta_resource_data, braintrust_resource_data))
+    
+    def log_sync_results(self, results: List[SyncResult]) -> None:
+        """Log several sync operation results as one batch.
+        
+        Args:
+            results: SyncResults to log
+        """
+        self.log_events([self._sync_result_event(result) for result in results])
+    
+    def _sync_result_event(
+        self,
+        result: SyncResult,
+        okta_resource_data: Optional[Dict[str, Any]] = None,
+        braintrust_resource_data: Optional[Dict[str, Any]] = None,
+    ) -> AuditEvent:
+        """Build the audit event for a sync operation result."""
+        return AuditEvent(
             event_id=f"{result.operation_id}_result",
             event_type="sync_result",
             execution_id=result.operation_id.split("_")[0],  # Extract execution ID
@@ -360,8 +434,6 @@ class AuditLogger:
             before_state=okta_resource_data,
             after_state=braintrust_resource_data,
         )
-        
-        self.log_event(event)
     
     def log_sync_operation(
         self,
@@ -420,28 +492,19 @@ class AuditLogger:
         Args:
             event: AuditEvent to write
         """
+        self._write_events_to_file([event])
+    
+    def _write_events_to_file(self, events: List[AuditEvent]) -> None:
+        """Write events to current audit file with one write and one flush.
+        
+        Args:
+            events: AuditEvents to write, in order
+        """
         if not self.file_handle:
             return
         
         try:
-            if self.structured_logging:
-                # Write as JSON Lines format
-                json_record = event.to_log_record()
-                self.file_handle.write(json.dumps(json_record) + "\n")
-            else:
-                # Write as plain text
-                timestamp = event.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
-                line = (
-                    f"[{timestamp}] {event.event_type.upper()} "
-                    f"{event.resource_type or 'system'}:{event.resource_id} "
-                    f"{event.operation} -> {event.braintrust_org} "
-                    f"{'SUCCESS' if event.success else 'FAILED'}"
-                )
-                if event.error_message:
-                    line += f" ({event.error_message})"
-                line += "\n"
-                self.file_handle.write(line)
-            
+            self.file_handle.write("".join(self._format_event_line(event) for event in events))
             self.file_handle.flush()
             
             # Check file size for rotation
@@ -451,6 +514,27 @@ class AuditLogger:
         except Exception as e:
             self._logger.error("Failed to write audit event to file", error=str(e))
     
+    def _format_event_line(self, event: AuditEvent) -> str:
+        """Format an event as one audit file line, including the newline."""
+        if self.structured_logging:
+            # Write as JSON Lines format; non-str keys are stringified like json.dumps does
+            return orjson.dumps(
+                event.to_log_record(),
+                option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        
+        # Write as plain text
+        timestamp = event.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
+        line = (
+            f"[{timestamp}] {event.event_type.upper()} "
+            f"{event.resource_type or 'system'}:{event.resource_id} "
+            f"{event.operation} -> {event.braintrust_org} "
+            f"{'SUCCESS' if event.success else 'FAILED'}"
+        )
+        if event.error_message:
+            line += f" ({event.error_message})"
+        return line + "\n"
+    
     def _write_execution_summary(self) -> None:
         """Write execution summary to separate file."""
         if not self.current_summary:
@@ -460,12 +544,7 @@ class AuditLogger:
             summary_file = self.audit_dir / f"summary_{self.current_summary.execution_id}.json"
             
             with open(summary_file, 'w', encoding='utf-8') as f:
-                json.dump(
-                    self.current_summary.model_dump(mode='json'),
-                    f,
-                    indent=2,
-                    default=str,
-                )
+                f.write(self.current_summary.model_dump_json(indent=2))
             
             self._logger.debug("Wrote execution summary", file=str(summary_file))
             
@@ -531,10 +610,7 @@ class AuditLogger:
             
             for summary_file in summary_files[:limit]:
                 try:
-                    with open(summary_file, 'r', encoding='utf-8') as f:
-                        summary_data = json.load(f)
-                    
-                    summary = AuditSummary.model_validate(summary_data)
+                    summary = AuditSummary.model_validate_json(summary_file.read_bytes())
                     summaries.append(summary)
                     
                 except Exception as e:
@@ -198,7 +198,10 @@ class ComponentFactory:
         from sync.core.enhanced_state import StateManager
         
         state_dir = config.state_management.state_directory
-        return StateManager(state_dir=state_dir)
+        return StateManager(
+            state_dir=state_dir,
+            compress=config.state_management.compress_state_files,
+        )
     
     @staticmethod
     def create_audit_logger(config: SyncConfig) -> "AuditLogger":
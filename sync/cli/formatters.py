@@ -540,7 +540,7 @@ class ProgressFormatter:
         progress_text = f"{progress.completed_items}/{progress.total_items} items ({percentage:.1f}%)"
         
         # Timing info
-        duration = (progress.completed_at - progress.started_at).total_seconds() if progress.completed_at else 0
+        duration = progress.get_duration_seconds() or 0
         timing_text = f"Duration: {duration:.1f}s" if duration > 0 else "In progress..."
         
         self.console.print(f"Status: {status_text}")
@@ -548,10 +548,10 @@ class ProgressFormatter:
         self.console.print(f"{timing_text}")
         
         if progress.errors:
-            self.console.print(f"[red]Errors: {len(progress.errors)}[/red]")
+            self.console.print(f"[red]Errors: {len(progress.errors) + progress.error_overflow}[/red]")
         
         if progress.warnings:
-            self.console.print(f"[yellow]Warnings: {len(progress.warnings)}[/yellow]")
+            self.console.print(f"[yellow]Warnings: {len(progress.warnings) + progress.warning_overflow}[/yellow]")
     
     def format_org_progress(self, progress: ExecutionProgress) -> None:
         """Display per-organization progress."""
@@ -581,12 +581,16 @@ class ProgressFormatter:
             for i, error in enumerate(progress.errors, 1):
                 sanitized_error = sanitize_log_input(error)
                 self.console.print(f"  {i}. {sanitized_error}")
+            if progress.error_overflow:
+                self.console.print(f"  ... and {progress.error_overflow} more")
         
         if progress.warnings:
             self.console.print("\n[yellow]Warnings:[/yellow]")
             for i, warning in enumerate(progress.warnings, 1):
                 sanitized_warning = sanitize_log_input(warning)
                 self.console.print(f"  {i}. {sanitized_warning}")
+            if progress.warning_overflow:
+                self.console.print(f"  ... and {progress.warning_overflow} more")
 
 
 class StateFormatter:
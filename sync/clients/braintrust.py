@@ -15,7 +15,11 @@ from sync.clients.exceptions import (
     ResourceNotFoundError,
     ValidationError,
 )
-from sync.config.role_project_models import RoleDefinition, RolePermission
+from sync.config.role_project_models import (
+    RoleDefinition,
+    RolePermission,
+    permissions_to_api_format,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -1028,14 +1032,7 @@ class BraintrustClient:
             self._request_count += 1
             
             # Convert RoleDefinition to API format
-            member_permissions = []
-            for perm in role_definition.member_permissions:
-                perm_dict = {"permission": perm.permission.value}
-                if perm.restrict_object_type:
-                    perm_dict["restrict_object_type"] = perm.restrict_object_type.value
-                else:
-                    perm_dict["restrict_object_type"] = None
-                member_permissions.append(perm_dict)
+            member_permissions = permissions_to_api_format(role_definition.member_permissions)
             
             payload = {
                 "name": role_definition.name,
@@ -1132,14 +1129,7 @@ class BraintrustClient:
             self._request_count += 1
             
             # Convert permissions to API format
-            api_permissions = []
-            for perm in member_permissions:
-                perm_dict = {"permission": perm.permission.value}
-                if perm.restrict_object_type:
-                    perm_dict["restrict_object_type"] = perm.restrict_object_type.value
-                else:
-                    perm_dict["restrict_object_type"] = None
-                api_permissions.append(perm_dict)
+            api_permissions = permissions_to_api_format(member_permissions)
             
             payload = {"member_permissions": api_permissions}
             if name:
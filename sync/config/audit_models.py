@@ -57,6 +57,10 @@ class StateManagementConfig(BaseModel):
         True,
         description="Create backup copies of state files before updates"
     )
+    compress_state_files: bool = Field(
+        False,
+        description="Write state files gzip-compressed (.json.gz) to cut disk I/O for large orgs"
+    )
     auto_cleanup_stale_resources: bool = Field(
         False,
         description="Automatically clean up stale resources from state (use with caution)"
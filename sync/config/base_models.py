@@ -1,10 +1,33 @@
 """Base configuration models and enums."""
 
+import os
 from enum import Enum
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from pydantic_core import PydanticUndefined
+
+
+# ========== Field Helper ==========
+# Field descriptions are only needed when generating docs or JSON schemas, but
+# Pydantic keeps them in every model's core schema. Set BTSYNC_STRIP_DOCS=1 in
+# production to drop them at import time and shrink schema memory.
+_STRIP_FIELD_DOCS = bool(os.getenv("BTSYNC_STRIP_DOCS"))
+
+
+def config_field(default: Any = PydanticUndefined, **kwargs: Any) -> Any:
+    """Drop-in replacement for pydantic.Field used by configuration models.
+    
+    Behaves exactly like Field, except that the description is omitted when
+    BTSYNC_STRIP_DOCS is set.
+    
+    Example:
+        enabled: bool = config_field(True, description="Whether sync is enabled")
+    """
+    if _STRIP_FIELD_DOCS:
+        kwargs.pop("description", None)
+    return Field(default, **kwargs)
 
 
 class LogLevel(str, Enum):
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Dict
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 # Import all specialized configuration models
 from .api_models import OktaConfig, BraintrustOrgConfig
@@ -91,6 +92,12 @@ class SyncConfig(BaseModel):
         description="State management configuration"
     )
     
+    @field_validator("braintrust_orgs")
+    @classmethod
+    def intern_org_names(cls, v: Dict[str, BraintrustOrgConfig]) -> Dict[str, BraintrustOrgConfig]:
+        """Intern org names so they share identity with mapping org lists."""
+        return {sys.intern(name): org_config for name, org_config in v.items()}
+    
     @model_validator(mode='after')
     def validate_braintrust_orgs_exist(self) -> 'SyncConfig':
         """Validate that referenced Braintrust orgs exist in configuration."""
@@ -2,10 +2,25 @@
 
 from __future__ import annotations
 
+import os
+import re
+import sys
+from collections.abc import Mapping
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional, Union
+from functools import cache, cached_property
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    PrivateAttr,
+    TypeAdapter,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
+
+from .base_models import config_field
 
 
 class BraintrustPermission(str, Enum):
@@ -56,16 +71,43 @@ class RolePermission(BaseModel):
         - Delete only experiments: {"permission": "delete", "restrict_object_type": "experiment"}
     """
     
-    permission: BraintrustPermission = Field(
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    permission: BraintrustPermission = config_field(
         ...,
         description="The permission type"
     )
-    restrict_object_type: Optional[BraintrustObjectType] = Field(
+    restrict_object_type: Optional[BraintrustObjectType] = config_field(
         None,
         description="Optional restriction to specific object types (null = all types)"
     )
 
 
+# Shared adapter for permission lists, built once at import. Reusing it
+# avoids building a separate core schema (or model_dump call) for every
+# place permission lists are converted to the API format.
+ROLE_PERMISSIONS_ADAPTER: TypeAdapter[List[RolePermission]] = TypeAdapter(List[RolePermission])
+
+
+def permissions_to_api_format(
+    permissions: List[Union[RolePermission, Dict[str, Any]]],
+) -> List[Dict[str, Optional[str]]]:
+    """Convert role permissions to the Braintrust API payload format.
+    
+    Args:
+        permissions: RolePermission instances or equivalent dicts
+        
+    Returns:
+        List of {"permission": ..., "restrict_object_type": ...} dicts
+        
+    Example:
+        permissions_to_api_format([shared_permission("read")])
+        # -> [{"permission": "read", "restrict_object_type": None}]
+    """
+    validated = ROLE_PERMISSIONS_ADAPTER.validate_python(permissions)
+    return ROLE_PERMISSIONS_ADAPTER.dump_python(validated, mode="json")
+
+
 class RoleDefinition(BaseModel):
     """Complete role definition with permissions and metadata.
     
@@ -86,17 +128,19 @@ class RoleDefinition(BaseModel):
         }
     """
     
-    name: str = Field(
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    name: str = config_field(
         ...,
         description="Role name (must be unique within organization)",
         min_length=1,
         max_length=255
     )
-    description: str = Field(
+    description: str = config_field(
         "",
         description="Human-readable description of the role's purpose"
     )
-    member_permissions: List[RolePermission] = Field(
+    member_permissions: List[RolePermission] = config_field(
         ...,
         description="List of permissions included in this role",
         min_length=1
@@ -105,10 +149,45 @@ class RoleDefinition(BaseModel):
     @field_validator("member_permissions")
     @classmethod
     def validate_permissions_not_empty(cls, v: List[RolePermission]) -> List[RolePermission]:
-        """Ensure at least one permission is provided."""
+        """Ensure at least one permission is provided.
+        
+        Permissions are frozen, so equal permissions across roles are
+        replaced with one shared instance (see shared_permission).
+        """
         if not v:
             raise ValueError("Role must have at least one permission")
-        return v
+        return [shared_permission(p.permission, p.restrict_object_type) for p in v]
+
+
+def shared_permission(
+    permission: BraintrustPermission,
+    restrict_object_type: Optional[BraintrustObjectType] = None,
+) -> RolePermission:
+    """Get the shared RolePermission instance for a permission/restriction pair.
+    
+    Most roles repeat the same handful of permissions (e.g. unrestricted
+    "read"), so every role references one frozen instance per pair instead of
+    allocating its own copy.
+    
+    Example:
+        shared_permission(BraintrustPermission.READ) is shared_permission("read")  # True
+    """
+    # Always pass both arguments positionally so they share one cache key
+    return _shared_permission(permission, restrict_object_type)
+
+
+@cache
+def _shared_permission(
+    permission: BraintrustPermission,
+    restrict_object_type: Optional[BraintrustObjectType],
+) -> RolePermission:
+    """Build (once) the RolePermission for a permission/restriction pair."""
+    return RolePermission.model_construct(
+        permission=BraintrustPermission(permission),
+        restrict_object_type=(
+            BraintrustObjectType(restrict_object_type) if restrict_object_type else None
+        ),
+    )
 
 
 class ProjectMatchRule(BaseModel):
@@ -118,54 +197,86 @@ class ProjectMatchRule(BaseModel):
     receive role assignments for a group.
     """
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     # ========== Explicit Project Lists ==========
-    project_names: Optional[List[str]] = Field(
+    # Configured as lists; stored as frozensets for O(1) membership checks
+    project_names: Optional[FrozenSet[str]] = config_field(
         None,
         description="Explicit list of project names"
     )
-    project_ids: Optional[List[str]] = Field(
+    project_ids: Optional[FrozenSet[str]] = config_field(
         None,
         description="Explicit list of project UUIDs"
     )
     
     # ========== Pattern-Based Matching ==========
-    name_pattern: Optional[str] = Field(
+    name_pattern: Optional[str] = config_field(
         None,
         description="Regex pattern to match project names"
     )
-    name_contains: Optional[List[str]] = Field(
+    name_contains: Optional[Tuple[str, ...]] = config_field(
         None,
         description="List of strings that project names must contain (OR logic)"
     )
-    name_starts_with: Optional[str] = Field(
+    name_starts_with: Optional[str] = config_field(
         None,
         description="String that project names must start with"
     )
-    name_ends_with: Optional[str] = Field(
+    name_ends_with: Optional[str] = config_field(
         None,
         description="String that project names must end with"
     )
     
     # ========== Tag-Based Matching ==========
-    # Note: This would require project tagging functionality
-    required_tags: Optional[Dict[str, str]] = Field(
+    # Note: This would require project tagging functionality.
+    # Configured as a mapping but stored as sorted (key, value) pairs so the
+    # value is hashable and can be compared without building a dict.
+    required_tags: Optional[Tuple[Tuple[str, str], ...]] = config_field(
         None,
         description="Project tags that must match (key-value pairs)"
     )
     
     # ========== Special Selectors ==========
-    all_projects: bool = Field(
+    all_projects: bool = config_field(
         False,
         description="Whether to match ALL projects in the organization"
     )
-    exclude_patterns: Optional[List[str]] = Field(
+    exclude_patterns: Optional[List[str]] = config_field(
         None,
         description="Regex patterns for projects to exclude"
     )
     
+    @field_validator("required_tags", mode="before")
+    @classmethod
+    def normalize_required_tags(cls, v: Any) -> Any:
+        """Accept the documented mapping form and store it as sorted pairs."""
+        if isinstance(v, Mapping):
+            return tuple(sorted((str(key), str(value)) for key, value in v.items()))
+        return v
+    
+    @field_serializer("required_tags")
+    def serialize_required_tags(
+        self, v: Optional[Tuple[Tuple[str, str], ...]]
+    ) -> Optional[Dict[str, str]]:
+        """Dump required_tags back to the mapping form used in configuration."""
+        return dict(v) if v is not None else None
+    
+    # ========== Compiled Patterns ==========
+    # Regexes are compiled once when the rule is validated so matching a rule
+    # against every project in an org does not recompile them per project.
+    # Invalid patterns compile to nothing and are reported via invalid_patterns.
+    _compiled_name_pattern: Optional[CompiledPattern] = PrivateAttr(default=None)
+    _compiled_exclude_patterns: List[CompiledPattern] = PrivateAttr(default_factory=list)
+    
     @model_validator(mode='after')
-    def validate_at_least_one_rule(self) -> 'ProjectMatchRule':
-        """Ensure at least one matching rule is specified."""
+    def validate_and_compile(self) -> 'ProjectMatchRule':
+        """Ensure at least one matching rule is specified and compile patterns.
+        
+        Both steps share one post-validator so each rule costs a single
+        Python callback during config validation.
+        """
+        # ========== At least one criterion ==========
         has_explicit = bool(self.project_names or self.project_ids)
         has_pattern = bool(self.name_pattern or self.name_contains or 
                           self.name_starts_with or self.name_ends_with)
@@ -178,7 +289,252 @@ class ProjectMatchRule(BaseModel):
                 "project_names, project_ids, patterns, tags, or all_projects"
             )
         
+        # ========== Compile name_pattern and exclude_patterns ==========
+        if self.name_pattern:
+            self._compiled_name_pattern = compile_project_pattern(self.name_pattern)
+        
+        if self.exclude_patterns:
+            self._compiled_exclude_patterns = [
+                compiled
+                for compiled in map(compile_project_pattern, self.exclude_patterns)
+                if compiled is not None
+            ]
+        
         return self
+    
+    @property
+    def invalid_patterns(self) -> List[str]:
+        """Configured regex patterns that failed to compile."""
+        invalid = []
+        if self.name_pattern and self._compiled_name_pattern is None:
+            invalid.append(self.name_pattern)
+        
+        valid_excludes = {compiled.source for compiled in self._compiled_exclude_patterns}
+        invalid.extend(
+            pattern for pattern in self.exclude_patterns or []
+            if pattern not in valid_excludes
+        )
+        return invalid
+    
+    @property
+    def backtracking_patterns(self) -> List[str]:
+        """Configured regex patterns with nested quantifiers like ``(a+)+``.
+        
+        These still match, but can backtrack catastrophically on long names.
+        """
+        compiled = [self._compiled_name_pattern, *self._compiled_exclude_patterns]
+        return [c.source for c in compiled if c is not None and c.nested_quantifier]
+    
+    def matches_tags(self, project_tags: Mapping[str, str]) -> bool:
+        """Check whether a project carries every required tag.
+        
+        Args:
+            project_tags: Tags set on the project
+            
+        Returns:
+            True if required_tags is set and all pairs are present on the project
+        """
+        if not self.required_tags:
+            return False
+        return all(project_tags.get(key) == value for key, value in self.required_tags)
+    
+    def matches_name_pattern(self, project_name: str) -> bool:
+        """Check a project name against the compiled name_pattern.
+        
+        Args:
+            project_name: Name of the project to check
+            
+        Returns:
+            True if name_pattern is valid and matches the start of the name
+        """
+        if self._compiled_name_pattern is None:
+            return False
+        return self._compiled_name_pattern.matches(project_name)
+    
+    def find_exclude_pattern(self, project_name: str) -> Optional[str]:
+        """Find the first exclude pattern matching a project name.
+        
+        Args:
+            project_name: Name of the project to check
+            
+        Returns:
+            The matching exclude pattern, or None if the project is not excluded
+        """
+        for compiled in self._compiled_exclude_patterns:
+            if compiled.matches(project_name):
+                return compiled.source
+        return None
+
+
+# ========== Project Pattern Compilation ==========
+# Project patterns are applied with re.match semantics (anchored at the start
+# of the name). Patterns written as ".*foo.*" make the engine retry the
+# leading ".*" from every position, so they are rewritten to the equivalent
+# unanchored search for "foo" before compiling.
+
+# google-re2 (optional, ``pip install okta-braintrust-sync[re2]``) matches in
+# linear time, which rules out catastrophic backtracking on user-supplied
+# patterns. Patterns RE2 cannot express (backreferences, lookaround) still
+# compile with the standard library engine.
+try:
+    import re2 as _re2
+except ImportError:  # pragma: no cover - depends on optional dependency
+    _re2 = None
+
+# Leading global flag groups such as "(?i)" that must stay at the front
+_FLAG_PREFIX = re.compile(r"^(?:\(\?[aiLmsux]+\))*")
+
+# Heuristic for nested quantifiers such as "(a+)+" or "(\w*)*"
+_NESTED_QUANTIFIER = re.compile(r"\((?:[^()\\]|\\.)*[*+}]\)[*+{]")
+
+
+class CompiledPattern(NamedTuple):
+    """A user-supplied project pattern compiled for repeated matching.
+    
+    Attributes:
+        source: Pattern exactly as written in configuration
+        regex: Compiled (possibly rewritten) pattern, from re2 when available
+        use_search: Whether to use search instead of match (leading ".*" removed)
+        nested_quantifier: Whether the pattern looks prone to catastrophic
+            backtracking (always False when compiled with re2)
+    """
+    source: str
+    regex: Any
+    use_search: bool
+    nested_quantifier: bool
+    
+    def matches(self, text: str) -> bool:
+        """Check text with the same result as ``re.match(source, text)``."""
+        if self.use_search:
+            return self.regex.search(text) is not None
+        return self.regex.match(text) is not None
+
+
+def compile_project_pattern(pattern: str) -> Optional[CompiledPattern]:
+    """Compile a user-supplied project regex, returning None if it is invalid.
+    
+    Example:
+        "(?i).*ml.*|.*machine.learning.*" compiles to "(?i)ml|machine.learning"
+        and is applied with search instead of match.
+    """
+    try:
+        re.compile(pattern)
+    except re.error:
+        return None
+    
+    rewritten, use_search = _strip_wildcards(pattern)
+    try:
+        re.compile(rewritten)
+    except re.error:
+        # The rewrite is purely syntactic; fall back if it ever misfires
+        rewritten, use_search = pattern, False
+    
+    regex = _compile_linear_time(rewritten)
+    if regex is not None:
+        return CompiledPattern(pattern, regex, use_search, False)
+    
+    nested_quantifier = bool(_NESTED_QUANTIFIER.search(pattern))
+    return CompiledPattern(pattern, re.compile(rewritten), use_search, nested_quantifier)
+
+
+def _compile_linear_time(pattern: str) -> Any:
+    """Compile a pattern with re2, or return None if re2 is unavailable or rejects it."""
+    if _re2 is None:
+        return None
+    try:
+        return _re2.compile(pattern)
+    except Exception:
+        # re2 raises its own error type for syntax it does not support
+        return None
+
+
+def _strip_wildcards(pattern: str) -> Tuple[str, bool]:
+    """Drop redundant ".*" from the ends of each top-level alternative.
+    
+    A trailing ".*" never affects whether match/search succeeds, so it is
+    always removed. A leading ".*" is only removed when every alternative has
+    one, since the rewritten pattern is then applied with search.
+    
+    Returns:
+        Tuple of (rewritten pattern, whether to use search)
+    """
+    flags = _FLAG_PREFIX.match(pattern).group(0)
+    branches = _split_alternatives(pattern[len(flags):])
+    if branches is None:
+        return pattern, False
+    
+    branches = [_strip_trailing_wildcard(branch) for branch in branches]
+    
+    stripped = [_strip_leading_wildcard(branch) for branch in branches]
+    use_search = all(branch is not None for branch in stripped)
+    if use_search:
+        branches = stripped
+    
+    return flags + "|".join(branches), use_search
+
+
+def _split_alternatives(body: str) -> Optional[List[str]]:
+    """Split a pattern on its top-level "|" alternations.
+    
+    Returns:
+        List of alternatives, or None if the pattern is not balanced
+    """
+    branches = []
+    depth = 0
+    start = 0
+    index = 0
+    while index < len(body):
+        char = body[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == "[":
+            # Skip the character class; "]" right after "[" or "[^" is literal
+            index += 1
+            if index < len(body) and body[index] == "^":
+                index += 1
+            if index < len(body) and body[index] == "]":
+                index += 1
+            while index < len(body) and body[index] != "]":
+                index += 2 if body[index] == "\\" else 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            branches.append(body[start:index])
+            start = index + 1
+        index += 1
+    
+    if depth != 0:
+        return None
+    branches.append(body[start:])
+    return branches
+
+
+def _strip_leading_wildcard(branch: str) -> Optional[str]:
+    """Remove a leading ".*" or ".*?" from an alternative, or return None."""
+    for prefix in (".*?", ".*"):
+        if branch.startswith(prefix):
+            rest = branch[len(prefix):]
+            # A following quantifier ("+", "?", "{") would change meaning
+            if rest[:1] in ("+", "?", "{"):
+                return None
+            return rest
+    return None
+
+
+def _strip_trailing_wildcard(branch: str) -> str:
+    """Remove a trailing ".*" or ".*?" from an alternative when it is unescaped."""
+    for suffix in (".*?", ".*"):
+        if branch.endswith(suffix):
+            head = branch[:-len(suffix)]
+            # An odd run of backslashes means the "." is an escaped literal
+            backslashes = len(head) - len(head.rstrip("\\"))
+            if backslashes % 2 == 0:
+                return head
+            return branch
+    return branch
 
 
 class GroupRoleAssignment(BaseModel):
@@ -199,28 +555,36 @@ class GroupRoleAssignment(BaseModel):
         }
     """
     
-    group_name: str = Field(
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    group_name: str = config_field(
         ...,
         description="Name of the group to assign the role to",
         min_length=1
     )
-    role_name: str = Field(
+    role_name: str = config_field(
         ...,
         description="Name of the role to assign",
         min_length=1
     )
-    project_match: ProjectMatchRule = Field(
+    project_match: ProjectMatchRule = config_field(
         ...,
         description="Rules for determining which projects to assign the role on"
     )
-    enabled: bool = Field(
+    enabled: bool = config_field(
         True,
         description="Whether this assignment is active"
     )
-    priority: int = Field(
+    priority: int = config_field(
         0,
         description="Priority for assignment order (higher = processed first)"
     )
+    
+    @field_validator("group_name", "role_name")
+    @classmethod
+    def intern_names(cls, v: str) -> str:
+        """Intern names so repeated lookups compare by identity first."""
+        return sys.intern(v)
 
 
 class RoleProjectConfig(BaseModel):
@@ -236,33 +600,35 @@ class RoleProjectConfig(BaseModel):
     3. Create ACLs granting the group the role on those projects
     """
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     # ========== Role Management ==========
-    standard_roles: Optional[List[RoleDefinition]] = Field(
+    standard_roles: Optional[List[RoleDefinition]] = config_field(
         None,
         description="Standard roles to ensure exist in the organization"
     )
-    auto_create_roles: bool = Field(
+    auto_create_roles: bool = config_field(
         True,
         description="Whether to automatically create missing roles"
     )
-    update_existing_roles: bool = Field(
+    update_existing_roles: bool = config_field(
         False,
         description="Whether to update existing roles if permissions differ"
     )
     
     # ========== Group → Role → Project Assignments ==========
-    group_assignments: List[GroupRoleAssignment] = Field(
+    group_assignments: List[GroupRoleAssignment] = config_field(
         ...,
         description="Rules for assigning groups to roles on projects",
         min_length=1
     )
     
     # ========== Sync Behavior ==========
-    remove_unmanaged_acls: bool = Field(
+    remove_unmanaged_acls: bool = config_field(
         False,
         description="Whether to remove ACLs not defined in configuration (DANGEROUS)"
     )
-    dry_run: bool = Field(
+    dry_run: bool = config_field(
         False,
         description="Preview changes without applying them"
     )
@@ -274,6 +640,108 @@ class RoleProjectConfig(BaseModel):
         # Note: This is a simplified validation - full validation would need
         # to resolve project matches to detect overlaps
         return v
+    
+    @cached_property
+    def project_name_index(self) -> ProjectNameIndex:
+        """Name-matching index over all group assignments, built on first use."""
+        return ProjectNameIndex(self.group_assignments)
+    
+    def match_project(self, project_name: str) -> List[GroupRoleAssignment]:
+        """Find the assignments whose name criteria match a project.
+        
+        Covers all_projects, name_pattern, name_contains, name_starts_with and
+        name_ends_with. Explicit project lists and exclude_patterns are applied
+        separately when resolving an assignment's projects.
+        
+        Args:
+            project_name: Name of the project to check
+            
+        Returns:
+            Matching assignments in configuration order
+        """
+        return self.project_name_index.match(project_name)
+
+
+class ProjectNameIndex:
+    """Literal name criteria of many assignments grouped for one pass per project.
+    
+    Matching a project against each assignment separately repeats the same
+    lower-casing and prefix/suffix/substring checks once per assignment. The
+    index groups identical literals across assignments so every distinct
+    prefix length, suffix length and substring is checked once per project:
+    
+    - prefixes/suffixes are looked up by slicing the name to each configured length
+    - duplicate name_contains strings across assignments are checked once
+    - only assignments with all_projects or name_pattern are evaluated one by one
+    
+    Example:
+        index = ProjectNameIndex(config.group_assignments)
+        index.match("ml-training")  # -> assignments matching by name
+    """
+    
+    def __init__(self, assignments: List[GroupRoleAssignment]) -> None:
+        """Build the index.
+        
+        Args:
+            assignments: Group role assignments to index
+        """
+        self._assignments = list(assignments)
+        self._prefixes: Dict[str, List[int]] = {}
+        self._suffixes: Dict[str, List[int]] = {}
+        self._substrings: Dict[str, List[int]] = {}
+        self._per_rule: List[int] = []
+        
+        for position, assignment in enumerate(self._assignments):
+            match = assignment.project_match
+            if match.name_starts_with:
+                self._prefixes.setdefault(match.name_starts_with.lower(), []).append(position)
+            if match.name_ends_with:
+                self._suffixes.setdefault(match.name_ends_with.lower(), []).append(position)
+            for contains_str in match.name_contains or []:
+                self._substrings.setdefault(contains_str.lower(), []).append(position)
+            if match.all_projects or match.name_pattern:
+                self._per_rule.append(position)
+        
+        # Distinct literal lengths, so a name is sliced once per length
+        self._prefix_lengths = sorted({len(prefix) for prefix in self._prefixes})
+        self._suffix_lengths = sorted({len(suffix) for suffix in self._suffixes})
+    
+    def match(self, project_name: str) -> List[GroupRoleAssignment]:
+        """Find the indexed assignments whose name criteria match a project.
+        
+        Args:
+            project_name: Name of the project to check
+            
+        Returns:
+            Matching assignments in their original order
+        """
+        lowered_name = project_name.lower()
+        name_length = len(lowered_name)
+        hits = set()
+        
+        for length in self._prefix_lengths:
+            if length > name_length:
+                break
+            hits.update(self._prefixes.get(lowered_name[:length], ()))
+        
+        for length in self._suffix_lengths:
+            if length > name_length:
+                break
+            hits.update(self._suffixes.get(lowered_name[name_length - length:], ()))
+        
+        for substring, positions in self._substrings.items():
+            if substring in lowered_name:
+                hits.update(positions)
+        
+        # Regex and all_projects criteria still need a per-assignment check
+        for position in self._per_rule:
+            if position in hits:
+                continue
+            match = self._assignments[position].project_match
+            if match.all_projects or match.matches_name_pattern(project_name):
+                hits.add(position)
+        
+        return [self._assignments[position] for position in sorted(hits)]
 
 
 class BraintrustOrgRoleConfig(BaseModel):
@@ -282,19 +750,27 @@ class BraintrustOrgRoleConfig(BaseModel):
     Allows per-organization customization of roles and project assignments.
     """
     
-    braintrust_org: str = Field(
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    braintrust_org: str = config_field(
         ...,
         description="Braintrust organization name",
         min_length=1
     )
-    role_project_config: RoleProjectConfig = Field(
+    role_project_config: RoleProjectConfig = config_field(
         ...,
         description="Role and project configuration for this org"
     )
-    enabled: bool = Field(
+    enabled: bool = config_field(
         True,
         description="Whether role-project management is enabled for this org"
     )
+    
+    @field_validator("braintrust_org")
+    @classmethod
+    def intern_org_name(cls, v: str) -> str:
+        """Intern the org name so org lookups compare by identity first."""
+        return sys.intern(v)
 
 
 class RoleProjectRules(BaseModel):
@@ -307,11 +783,13 @@ class RoleProjectRules(BaseModel):
     Similar structure to GroupAssignmentRules but for role-project workflow.
     """
     
-    global_config: Optional[RoleProjectConfig] = Field(
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    global_config: Optional[RoleProjectConfig] = config_field(
         None,
         description="Global role-project config (can be overridden per org)"
     )
-    org_configs: Optional[List[BraintrustOrgRoleConfig]] = Field(
+    org_configs: Optional[List[BraintrustOrgRoleConfig]] = config_field(
         None,
         description="Per-organization role-project configurations"
     )
@@ -334,84 +812,97 @@ class RoleProjectRules(BaseModel):
         Returns:
             RoleProjectConfig if found, None otherwise
         """
-        # Check for org-specific config first
-        if self.org_configs:
-            for org_config in self.org_configs:
-                if org_config.braintrust_org == org_name and org_config.enabled:
-                    return org_config.role_project_config
+        # Org-specific config first, falling back to the global config
+        return self._org_config_map.get(org_name, self.global_config)
+    
+    @cached_property
+    def _org_config_map(self) -> Dict[str, RoleProjectConfig]:
+        """Enabled org-specific configs keyed by org name, built on first lookup.
         
-        # Fall back to global config
-        return self.global_config
+        When an org is listed more than once, the first enabled entry wins.
+        """
+        org_map: Dict[str, RoleProjectConfig] = {}
+        for org_config in self.org_configs or []:
+            if org_config.enabled:
+                org_map.setdefault(org_config.braintrust_org, org_config.role_project_config)
+        return org_map
 
 
 # ========== Predefined Common Roles ==========
-# These can be used as templates or defaults
+# These can be used as templates or defaults.
+#
+# The predefined roles are authored in-source with known-valid data, so they
+# are built with ``model_construct`` to skip the validation pipeline at import
+# time, and their permissions come from shared_permission() so identical
+# permissions are one shared instance. Set BTSYNC_VALIDATE_PREDEFINED_ROLES=1
+# (e.g. in tests or debug builds) to re-validate them and catch authoring
+# mistakes.
 
 # Administrative role with full permissions
-ADMIN_ROLE = RoleDefinition(
+ADMIN_ROLE = RoleDefinition.model_construct(
     name="Admin",
     description="Full administrative access including ACL management",
     member_permissions=[
-        RolePermission(permission=BraintrustPermission.CREATE, restrict_object_type=None),
-        RolePermission(permission=BraintrustPermission.READ, restrict_object_type=None),
-        RolePermission(permission=BraintrustPermission.UPDATE, restrict_object_type=None),
-        RolePermission(permission=BraintrustPermission.DELETE, restrict_object_type=None),
-        RolePermission(permission=BraintrustPermission.CREATE_ACLS, restrict_object_type=None),
-        RolePermission(permission=BraintrustPermission.READ_ACLS, restrict_object_type=None),
-        RolePermission(permission=BraintrustPermission.UPDATE_ACLS, restrict_object_type=None),
-        RolePermission(permission=BraintrustPermission.DELETE_ACLS, restrict_object_type=None),
+        shared_permission(BraintrustPermission.CREATE),
+        shared_permission(BraintrustPermission.READ),
+        shared_permission(BraintrustPermission.UPDATE),
+        shared_permission(BraintrustPermission.DELETE),
+        shared_permission(BraintrustPermission.CREATE_ACLS),
+        shared_permission(BraintrustPermission.READ_ACLS),
+        shared_permission(BraintrustPermission.UPDATE_ACLS),
+        shared_permission(BraintrustPermission.DELETE_ACLS),
     ]
 )
 
 # Standard engineer role with CRUD but no ACL management
-ENGINEER_ROLE = RoleDefinition(
+ENGINEER_ROLE = RoleDefinition.model_construct(
     name="Engineer",
     description="Standard engineering permissions - CRUD operations without ACL management",
     member_permissions=[
-        RolePermission(permission=BraintrustPermission.CREATE, restrict_object_type=None),
-        RolePermission(permission=BraintrustPermission.READ, restrict_object_type=None),
-        RolePermission(permission=BraintrustPermission.UPDATE, restrict_object_type=None),
-        RolePermission(permission=BraintrustPermission.DELETE, restrict_object_type=None),
+        shared_permission(BraintrustPermission.CREATE),
+        shared_permission(BraintrustPermission.READ),
+        shared_permission(BraintrustPermission.UPDATE),
+        shared_permission(BraintrustPermission.DELETE),
     ]
 )
 
 # Data scientist role with focus on experiments and datasets
-DATA_SCIENTIST_ROLE = RoleDefinition(
+DATA_SCIENTIST_ROLE = RoleDefinition.model_construct(
     name="DataScientist",
     description="Data science permissions - read all, create/modify experiments and datasets",
     member_permissions=[
-        RolePermission(permission=BraintrustPermission.READ, restrict_object_type=None),
-        RolePermission(permission=BraintrustPermission.CREATE, restrict_object_type=BraintrustObjectType.EXPERIMENT),
-        RolePermission(permission=BraintrustPermission.CREATE, restrict_object_type=BraintrustObjectType.DATASET),
-        RolePermission(permission=BraintrustPermission.UPDATE, restrict_object_type=BraintrustObjectType.EXPERIMENT),
-        RolePermission(permission=BraintrustPermission.UPDATE, restrict_object_type=BraintrustObjectType.DATASET),
-        RolePermission(permission=BraintrustPermission.DELETE, restrict_object_type=BraintrustObjectType.EXPERIMENT),
-        RolePermission(permission=BraintrustPermission.DELETE, restrict_object_type=BraintrustObjectType.DATASET),
+        shared_permission(BraintrustPermission.READ),
+        shared_permission(BraintrustPermission.CREATE, BraintrustObjectType.EXPERIMENT),
+        shared_permission(BraintrustPermission.CREATE, BraintrustObjectType.DATASET),
+        shared_permission(BraintrustPermission.UPDATE, BraintrustObjectType.EXPERIMENT),
+        shared_permission(BraintrustPermission.UPDATE, BraintrustObjectType.DATASET),
+        shared_permission(BraintrustPermission.DELETE, BraintrustObjectType.EXPERIMENT),
+        shared_permission(BraintrustPermission.DELETE, BraintrustObjectType.DATASET),
     ]
 )
 
 # Read-only viewer role
-VIEWER_ROLE = RoleDefinition(
+VIEWER_ROLE = RoleDefinition.model_construct(
     name="Viewer",
     description="Read-only access to all content",
     member_permissions=[
-        RolePermission(permission=BraintrustPermission.READ, restrict_object_type=None),
+        shared_permission(BraintrustPermission.READ),
     ]
 )
 
 # Project manager role with project-level permissions
-PROJECT_MANAGER_ROLE = RoleDefinition(
+PROJECT_MANAGER_ROLE = RoleDefinition.model_construct(
     name="ProjectManager",
     description="Project management permissions - full project control including team management",
     member_permissions=[
-        RolePermission(permission=BraintrustPermission.CREATE, restrict_object_type=None),
-        RolePermission(permission=BraintrustPermission.READ, restrict_object_type=None),
-        RolePermission(permission=BraintrustPermission.UPDATE, restrict_object_type=None),
-        RolePermission(permission=BraintrustPermission.DELETE, restrict_object_type=None),
-        RolePermission(permission=BraintrustPermission.CREATE_ACLS, restrict_object_type=BraintrustObjectType.PROJECT),
-        RolePermission(permission=BraintrustPermission.READ_ACLS, restrict_object_type=BraintrustObjectType.PROJECT),
-        RolePermission(permission=BraintrustPermission.UPDATE_ACLS, restrict_object_type=BraintrustObjectType.PROJECT),
-        RolePermission(permission=BraintrustPermission.DELETE_ACLS, restrict_object_type=BraintrustObjectType.PROJECT),
+        shared_permission(BraintrustPermission.CREATE),
+        shared_permission(BraintrustPermission.READ),
+        shared_permission(BraintrustPermission.UPDATE),
+        shared_permission(BraintrustPermission.DELETE),
+        shared_permission(BraintrustPermission.CREATE_ACLS, BraintrustObjectType.PROJECT),
+        shared_permission(BraintrustPermission.READ_ACLS, BraintrustObjectType.PROJECT),
+        shared_permission(BraintrustPermission.UPDATE_ACLS, BraintrustObjectType.PROJECT),
+        shared_permission(BraintrustPermission.DELETE_ACLS, BraintrustObjectType.PROJECT),
     ]
 )
 
@@ -422,4 +913,21 @@ STANDARD_ROLES = [
     DATA_SCIENTIST_ROLE,
     VIEWER_ROLE,
     PROJECT_MANAGER_ROLE,
-]
\ No newline at end of file
+]
+
+
+def validate_predefined_roles() -> None:
+    """Run full validation over the predefined roles.
+    
+    The predefined roles skip validation on construction, so this re-validates
+    them from their dumped form to surface authoring errors.
+    
+    Raises:
+        ValidationError: If any predefined role is not a valid RoleDefinition
+    """
+    for role in STANDARD_ROLES:
+        RoleDefinition.model_validate(role.model_dump())
+
+
+if os.getenv("BTSYNC_VALIDATE_PREDEFINED_ROLES"):
+    validate_predefined_roles()
\ No newline at end of file
@@ -1,33 +1,42 @@
 """Synchronization configuration models."""
 
-from pathlib import Path
-from typing import List, Literal
+import os
+import sys
+from typing import List
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
 
-from .base_models import IdentityMappingStrategy
+from .base_models import IdentityMappingStrategy, config_field
 
 
 class IdentityMappingConfig(BaseModel):
     """Identity mapping configuration."""
     
-    strategy: IdentityMappingStrategy = Field(
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    strategy: IdentityMappingStrategy = config_field(
         IdentityMappingStrategy.EMAIL,
         description="Strategy for mapping Okta users to Braintrust users"
     )
-    custom_field: str | None = Field(
+    custom_field: str | None = config_field(
         None,
         description="Custom Okta profile field for identity mapping (when strategy=custom_field)"
     )
-    mapping_file: Path | None = Field(
+    mapping_file: str | None = config_field(
         None,
         description="Path to mapping file (when strategy=mapping_file)"
     )
-    case_sensitive: bool = Field(
+    case_sensitive: bool = config_field(
         False,
         description="Whether identity mapping should be case sensitive"
     )
     
+    @field_validator("mapping_file", mode="before")
+    @classmethod
+    def coerce_mapping_file(cls, v: object) -> object:
+        """Accept Path objects for mapping_file and store them as strings."""
+        return os.fspath(v) if isinstance(v, os.PathLike) else v
+    
     @model_validator(mode='after')
     def validate_strategy_config(self) -> 'IdentityMappingConfig':
         """Validate strategy-specific configuration."""
@@ -43,70 +52,88 @@ class IdentityMappingConfig(BaseModel):
 class UserSyncMapping(BaseModel):
     """User sync mapping rule."""
     
-    okta_filter: str = Field(
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    okta_filter: str = config_field(
         ...,
         description="SCIM filter expression for selecting Okta users",
         min_length=1
     )
-    braintrust_orgs: List[str] = Field(
+    braintrust_orgs: List[str] = config_field(
         ...,
         description="List of Braintrust organization names to sync to",
         min_length=1
     )
-    enabled: bool = Field(
+    enabled: bool = config_field(
         True,
         description="Whether this mapping is enabled"
     )
+    
+    @field_validator("braintrust_orgs")
+    @classmethod
+    def intern_org_names(cls, v: List[str]) -> List[str]:
+        """Intern org names so membership checks compare by identity first."""
+        return [sys.intern(org) for org in v]
 
 
 class GroupSyncMapping(BaseModel):
     """Group sync mapping rule."""
     
-    okta_group_filter: str = Field(
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    okta_group_filter: str = config_field(
         ...,
         description="SCIM filter expression for selecting Okta groups",
         min_length=1
     )
-    braintrust_orgs: List[str] = Field(
+    braintrust_orgs: List[str] = config_field(
         ...,
         description="List of Braintrust organization names to sync to",
         min_length=1
     )
-    name_transform: str = Field(
+    name_transform: str = config_field(
         "{group.name}",
         description="Template for transforming group names (supports {group.name} placeholder)"
     )
-    enabled: bool = Field(
+    enabled: bool = config_field(
         True,
         description="Whether this mapping is enabled"
     )
+    
+    @field_validator("braintrust_orgs")
+    @classmethod
+    def intern_org_names(cls, v: List[str]) -> List[str]:
+        """Intern org names so membership checks compare by identity first."""
+        return [sys.intern(org) for org in v]
 
 
 class UserSyncConfig(BaseModel):
     """User synchronization configuration."""
     
-    enabled: bool = Field(
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    enabled: bool = config_field(
         True,
         description="Whether user sync is enabled"
     )
-    mappings: List[UserSyncMapping] = Field(
+    mappings: List[UserSyncMapping] = config_field(
         ...,
         description="User sync mapping rules",
         min_length=1
     )
-    identity_mapping: IdentityMappingConfig = Field(
+    identity_mapping: IdentityMappingConfig = config_field(
         default_factory=IdentityMappingConfig,
         description="Identity mapping configuration"
     )
-    create_missing: bool = Field(
+    create_missing: bool = config_field(
         True,
         description="Whether to create users that don't exist in Braintrust"
     )
-    update_existing: bool = Field(
+    update_existing: bool = config_field(
         True,
         description="Whether to update existing users in Braintrust"
     )
-    sync_profile_fields: List[str] = Field(
+    sync_profile_fields: List[str] = config_field(
         ["firstName", "lastName", "email", "login"],
         description="Okta profile fields to sync to Braintrust"
     )
@@ -115,27 +142,29 @@ class UserSyncConfig(BaseModel):
 class GroupSyncConfig(BaseModel):
     """Group synchronization configuration."""
     
-    enabled: bool = Field(
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    enabled: bool = config_field(
         True,
         description="Whether group sync is enabled"
     )
-    mappings: List[GroupSyncMapping] = Field(
+    mappings: List[GroupSyncMapping] = config_field(
         default_factory=list,
         description="Group sync mapping rules"
     )
-    create_missing: bool = Field(
+    create_missing: bool = config_field(
         True,
         description="Whether to create groups that don't exist in Braintrust"
     )
-    update_existing: bool = Field(
+    update_existing: bool = config_field(
         True,
         description="Whether to update existing groups in Braintrust"
     )
-    sync_members: bool = Field(
+    sync_members: bool = config_field(
         True,
         description="Whether to sync group memberships"
     )
-    sync_description: bool = Field(
+    sync_description: bool = config_field(
         True,
         description="Whether to sync group descriptions"
     )
@@ -151,11 +180,13 @@ class GroupSyncConfig(BaseModel):
 class SyncRulesConfig(BaseModel):
     """Sync rules configuration."""
     
-    users: UserSyncConfig | None = Field(
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    users: UserSyncConfig | None = config_field(
         None,
         description="User sync configuration"
     )
-    groups: GroupSyncConfig | None = Field(
+    groups: GroupSyncConfig | None = config_field(
         None,
         description="Group sync configuration"
     )
@@ -175,31 +206,33 @@ class SyncRulesConfig(BaseModel):
 class SyncOptionsConfig(BaseModel):
     """General sync options configuration."""
     
-    dry_run: bool = Field(
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    dry_run: bool = config_field(
         False,
         description="Whether to run in dry-run mode (no actual changes)"
     )
-    batch_size: int = Field(
+    batch_size: int = config_field(
         50,
         description="Number of resources to process in each batch",
         ge=1,
         le=1000
     )
-    max_retries: int = Field(
+    max_retries: int = config_field(
         3,
         description="Maximum number of retry attempts for failed operations",
         ge=0
     )
-    retry_delay_seconds: float = Field(
+    retry_delay_seconds: float = config_field(
         1.0,
         description="Initial delay between retries in seconds",
         ge=0.1
     )
-    remove_extra: bool = Field(
+    remove_extra: bool = config_field(
         False,
         description="Whether to remove users/groups not present in Okta (SCIM delete)"
     )
-    continue_on_error: bool = Field(
+    continue_on_error: bool = config_field(
         True,
         description="Whether to continue processing after individual errors"
     )
\ No newline at end of file
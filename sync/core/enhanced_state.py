@@ -1,18 +1,204 @@
 """Enhanced state management with managed resource tracking."""
 
+import gzip
 import hashlib
-import json
+import os
+import shutil
 import time
+from collections import deque
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Union
 from pathlib import Path
 
-from pydantic import BaseModel, Field, field_validator
+import orjson
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    computed_field,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Module-level UTC binding shared by every timestamp in state
+_UTC = timezone.utc
+
+# Timestamps within this many seconds share one datetime instance
+_CLOCK_RESOLUTION = 0.05
+# (monotonic tick, datetime) of the last clock read
+_clock_cache: Tuple[float, datetime] = (float("-inf"), datetime.fromtimestamp(0, _UTC))
+
+
+def _now() -> datetime:
+    """Return the current time as an aware UTC datetime.
+    
+    Used directly as ``default_factory`` so models do not allocate a lambda
+    per field and every timestamp shares one tzinfo instance. Reads within
+    ``_CLOCK_RESOLUTION`` seconds of each other reuse the cached datetime, so
+    bursts of state mutations do not allocate one datetime each.
+    """
+    global _clock_cache
+    tick = time.monotonic()
+    cached_tick, cached_now = _clock_cache
+    if tick - cached_tick < _CLOCK_RESOLUTION:
+        return cached_now
+    
+    now = datetime.fromtimestamp(time.time(), _UTC)
+    _clock_cache = (tick, now)
+    return now
+
+
+# (datetime, isoformat string) of the last _now_iso() call
+_iso_cache: Tuple[Optional[datetime], str] = (None, "")
+
+
+def _now_iso() -> str:
+    """Return ``_now().isoformat()``, formatting each clock tick only once."""
+    global _iso_cache
+    now = _now()
+    cached_now, cached_iso = _iso_cache
+    if cached_now is now:
+        return cached_iso
+    
+    iso = now.isoformat()
+    _iso_cache = (now, iso)
+    return iso
+
+
+# Most recent failure records kept in stats['failed_operations']; the
+# failed_<type>s counters still count every failure
+_MAX_FAILED_OPERATIONS = 1000
+
+
+# ========== Config Hashing ==========
+
+# Marks canonicalised mappings so a dict never collides with a list of pairs
+_MAPPING_TAG = "__mapping__"
+
+
+def _digest(data: bytes) -> str:
+    """Digest bytes into the 16 character hex form stored as config_hash.
+    
+    Every persisted hash goes through here, so swapping the algorithm is a
+    one-line change (followed by a state migration).
+    """
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _canonicalize(value: Any) -> Any:
+    """Convert a JSON-like value into a hashable, order-independent form.
+    
+    Mappings become tagged tuples of key-sorted pairs and sequences become
+    tuples, so equal configs produce equal keys regardless of dict ordering.
+    
+    Args:
+        value: Config value (dicts, lists and JSON scalars)
+        
+    Returns:
+        Hashable canonical representation of the value
+    """
+    if isinstance(value, Mapping):
+        return (
+            _MAPPING_TAG,
+            tuple(sorted(
+                ((str(k), _canonicalize(v)) for k, v in value.items()),
+                key=lambda item: item[0],
+            )),
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonicalize(v) for v in value)
+    return value
+
+
+@lru_cache(maxsize=4096)
+def _hash_canonical(canonical: Any) -> str:
+    """Hash a canonicalised config; repeated configs are served from cache.
+    
+    Keys are already sorted by ``_canonicalize`` so orjson output is stable,
+    and an 8 byte BLAKE2b digest keeps the 16 character hex width.
+    """
+    return _digest(orjson.dumps(canonical))
+
+
+def hash_config(config: Any) -> str:
+    """Calculate a short, stable hash of a configuration for drift detection.
+    
+    Args:
+        config: Configuration (dict, list or scalar) to hash
+        
+    Returns:
+        16 character hex digest
+    """
+    return _hash_canonical(_canonicalize(config))
+
+
+def _permission_token(permission: Any) -> bytes:
+    """Encode one role permission as bytes for hashing.
+    
+    API entries are ``{"permission", "restrict_object_type"}`` dicts where a
+    missing and a null restriction mean the same thing.
+    """
+    if isinstance(permission, Mapping):
+        restrict = permission.get("restrict_object_type") or ""
+        return f"{permission.get('permission', '')}\0{restrict}".encode()
+    return str(permission).encode()
+
+
+def hash_role_permissions(permissions: Optional[List[Any]]) -> str:
+    """Hash a role's member permissions without JSON serialization.
+    
+    Permissions are compared as a set, so ordering differences between the
+    stored definition and the API response do not register as drift.
+    
+    Args:
+        permissions: member_permissions list (dicts or plain strings)
+        
+    Returns:
+        16 character hex digest
+    """
+    return _hash_permission_tokens(tuple(sorted(_permission_token(p) for p in permissions or ())))
+
+
+@lru_cache(maxsize=4096)
+def _hash_permission_tokens(tokens: Tuple[bytes, ...]) -> str:
+    """Digest sorted permission tokens; roles sharing a permission set hit the cache."""
+    return _digest(b"\n".join(tokens))
+
+
+def _to_epoch(value: Union[datetime, str, float, int]) -> float:
+    """Convert a stored timestamp into epoch seconds.
+    
+    Args:
+        value: Datetime, ISO 8601 string or epoch seconds (naive values are UTC)
+        
+    Returns:
+        Seconds since the epoch
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=_UTC)
+    return value.timestamp()
+
+
+def _migrate_timestamp(data: Any, epoch_field: str, datetime_field: str) -> Any:
+    """Move a legacy datetime field into its epoch field before validation."""
+    if isinstance(data, dict) and datetime_field in data:
+        data = dict(data)
+        legacy_value = data.pop(datetime_field)
+        if epoch_field not in data and legacy_value is not None:
+            data[epoch_field] = _to_epoch(legacy_value)
+    return data
+
 
 class ResourceType(str, Enum):
     """Types of resources tracked in state."""
@@ -24,6 +210,24 @@ class ResourceType(str, Enum):
     GROUP_ASSIGNMENT = "group_assignment"
 
 
+def _lookup_resource_type(resource_type: Union[ResourceType, str]) -> Optional[ResourceType]:
+    """Resolve a resource type string to its enum member.
+    
+    Validated models always hold the enum singletons, so callers can compare
+    with ``is`` instead of reading ``.value`` for every resource.
+    
+    Args:
+        resource_type: Enum member or its string value
+        
+    Returns:
+        Matching ResourceType, or None for unknown types
+    """
+    try:
+        return ResourceType(resource_type)
+    except ValueError:
+        return None
+
+
 class ManagementStatus(str, Enum):
     """How a resource is managed."""
     SYNC_MANAGED = "sync_managed"      # Created and managed by sync
@@ -31,6 +235,54 @@ class ManagementStatus(str, Enum):
     EXTERNAL = "external"              # Created externally, not managed
 
 
+# ========== State Keys ==========
+
+# (resource_type, resource_id, braintrust_org) for managed_resources
+ResourceKey = Tuple[str, str, str]
+# (resource_id, braintrust_org) for roles, ACLs and projects
+OrgScopedKey = Tuple[str, str]
+# (resource_type, resource_id, drift_type) identifying one drift issue
+DriftKey = Tuple[str, str, str]
+
+
+def _format_state_key(key: Tuple[str, ...]) -> str:
+    """Format a tuple key as the colon-joined string used in state files."""
+    return ":".join(key)
+
+
+def _raw_field(item: Any, name: str) -> Any:
+    """Read a field from either a raw dict or an already built model."""
+    return item[name] if isinstance(item, dict) else getattr(item, name)
+
+
+def _rekey_from_values(data: Any, key_func: Callable[[Any], Tuple[str, ...]]) -> Any:
+    """Replace string keys from a state file with tuple keys derived from the values.
+    
+    Keys are rebuilt from each entry rather than split, since older state files
+    used differing key formats (e.g. "ResourceType.USER:id:org").
+    
+    Args:
+        data: Raw dict to validate
+        key_func: Builds the tuple key from a raw entry
+        
+    Returns:
+        Re-keyed dict, or the input unchanged if it cannot be re-keyed
+    """
+    if not isinstance(data, dict):
+        return data
+    
+    rekeyed = {}
+    for key, item in data.items():
+        if not isinstance(key, tuple):
+            try:
+                key = key_func(item)
+            except (KeyError, AttributeError, TypeError, ValueError):
+                # Leave malformed entries for pydantic to report
+                pass
+        rekeyed[key] = item
+    return rekeyed
+
+
 class ManagedResource(BaseModel):
     """Enhanced resource tracking with management metadata."""
     
@@ -43,8 +295,9 @@ class ManagedResource(BaseModel):
     # Management metadata
     management_status: ManagementStatus
     created_by_sync: bool = False
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    last_synced_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_now)
+    # Stored as epoch seconds so sync updates and stale cleanup avoid datetime churn
+    last_synced_epoch: float = Field(default_factory=time.time)
     
     # Configuration tracking
     config_hash: Optional[str] = None  # Hash of the config that created this
@@ -59,18 +312,36 @@ class ManagedResource(BaseModel):
     parent_resource_id: Optional[str] = None  # E.g., role that created this ACL
     child_resource_ids: List[str] = Field(default_factory=list)
     
+    @model_validator(mode='before')
+    @classmethod
+    def migrate_last_synced_at(cls, data: Any) -> Any:
+        """Accept state files written before last_synced_epoch existed."""
+        return _migrate_timestamp(data, 'last_synced_epoch', 'last_synced_at')
+    
+    @computed_field
+    @property
+    def last_synced_at(self) -> datetime:
+        """Last sync time as a UTC datetime (serialized for compatibility)."""
+        return datetime.fromtimestamp(self.last_synced_epoch, _UTC)
+    
+    @last_synced_at.setter
+    def last_synced_at(self, value: datetime) -> None:
+        self.last_synced_epoch = _to_epoch(value)
+    
     def calculate_config_hash(self, config: Dict[str, Any]) -> str:
         """Calculate hash of configuration for drift detection."""
-        config_str = json.dumps(config, sort_keys=True)
-        return hashlib.sha256(config_str.encode()).hexdigest()[:16]
+        return hash_config(config)
     
     def update_sync_time(self) -> None:
         """Update the last synced timestamp."""
-        self.last_synced_at = datetime.now(timezone.utc)
+        self.last_synced_epoch = time.time()
     
     def mark_drift(self, details: List[str]) -> None:
-        """Mark that drift has been detected."""
-        self.management_status = ManagementStatus.DRIFT_DETECTED
+        """Mark that drift has been detected.
+        
+        The management status is kept, since it records who owns the
+        resource rather than whether it drifted.
+        """
         self.external_modifications_detected = True
         self.drift_details = details
 
@@ -81,7 +352,12 @@ class RoleState(ManagedResource):
     role_definition: Dict[str, Any] = Field(default_factory=dict)
     assigned_groups: List[str] = Field(default_factory=list)
     assigned_projects: List[str] = Field(default_factory=list)
-    acl_ids: List[str] = Field(default_factory=list)
+    acl_ids: Set[str] = Field(default_factory=set)
+    
+    @field_serializer('acl_ids')
+    def serialize_acl_ids(self, v: Set[str]) -> List[str]:
+        # Sorted so state files are stable between runs
+        return sorted(v)
 
 
 class ACLState(ManagedResource):
@@ -98,6 +374,22 @@ class ACLState(ManagedResource):
     # Track the assignment rule that created this
     assignment_rule: Optional[Dict[str, Any]] = None
     priority: Optional[int] = None
+    
+    # Cached frozenset of permissions, rebuilt when the list is reassigned
+    _permission_set: FrozenSet[str] = PrivateAttr(default=frozenset())
+    _permission_source: Optional[List[str]] = PrivateAttr(default=None)
+    
+    @property
+    def permission_set(self) -> FrozenSet[str]:
+        """Permissions as a frozenset for drift comparisons.
+        
+        Cached until ``permissions`` is reassigned; in-place edits of the list
+        are not tracked, so replace the list when permissions change.
+        """
+        if self._permission_source is not self.permissions:
+            self._permission_set = frozenset(self.permissions)
+            self._permission_source = self.permissions
+        return self._permission_set
 
 
 class ProjectState(BaseModel):
@@ -106,8 +398,8 @@ class ProjectState(BaseModel):
     project_id: str
     project_name: str
     braintrust_org: str
-    discovered_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    last_seen_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    discovered_at: datetime = Field(default_factory=_now)
+    last_seen_epoch: float = Field(default_factory=time.time)
     
     # Track which ACLs we've applied
     managed_acl_ids: List[str] = Field(default_factory=list)
@@ -115,6 +407,22 @@ class ProjectState(BaseModel):
     # Pattern matches (for debugging)
     matched_patterns: List[Any] = Field(default_factory=list)
     
+    @model_validator(mode='before')
+    @classmethod
+    def migrate_last_seen_at(cls, data: Any) -> Any:
+        """Accept state files written before last_seen_epoch existed."""
+        return _migrate_timestamp(data, 'last_seen_epoch', 'last_seen_at')
+    
+    @computed_field
+    @property
+    def last_seen_at(self) -> datetime:
+        """Last time the project was seen as a UTC datetime."""
+        return datetime.fromtimestamp(self.last_seen_epoch, _UTC)
+    
+    @last_seen_at.setter
+    def last_seen_at(self, value: datetime) -> None:
+        self.last_seen_epoch = _to_epoch(value)
+    
     @field_validator('matched_patterns', mode='before')
     @classmethod
     def flatten_matched_patterns(cls, v):
@@ -144,7 +452,7 @@ class DriftWarning(BaseModel):
     resource_name: Optional[str] = None
     drift_type: str  # "modified", "deleted", "permission_changed"
     details: str
-    detected_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    detected_at: datetime = Field(default_factory=_now)
     
     # Suggested action
     suggested_action: Optional[str] = None
@@ -156,21 +464,23 @@ class EnhancedSyncState(BaseModel):
     
     # Existing fields (backward compatible)
     sync_id: str
-    started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: datetime = Field(default_factory=_now)
     completed_at: Optional[datetime] = None
     status: str = "in_progress"
     
-    # Legacy mappings (keep for compatibility)
+    # Legacy mappings (keep for compatibility):
+    # resource_mappings[org][resource_type][okta_id] = mapping
     resource_mappings: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
     
     # Enhanced resource tracking
-    managed_resources: Dict[str, ManagedResource] = Field(default_factory=dict)
-    managed_roles: Dict[str, RoleState] = Field(default_factory=dict)
-    managed_acls: Dict[str, ACLState] = Field(default_factory=dict)
-    discovered_projects: Dict[str, ProjectState] = Field(default_factory=dict)
+    # Keyed by tuples; serialized as "a:b[:c]" strings for the on-disk format
+    managed_resources: Dict[ResourceKey, ManagedResource] = Field(default_factory=dict)
+    managed_roles: Dict[OrgScopedKey, RoleState] = Field(default_factory=dict)
+    managed_acls: Dict[OrgScopedKey, ACLState] = Field(default_factory=dict)
+    discovered_projects: Dict[OrgScopedKey, ProjectState] = Field(default_factory=dict)
     
-    # Drift detection
-    drift_warnings: List[DriftWarning] = Field(default_factory=list)
+    # Drift detection, one warning per distinct issue (serialized as a list)
+    drift_warnings: Dict[DriftKey, DriftWarning] = Field(default_factory=dict)
     last_drift_check: Optional[datetime] = None
     
     # Statistics
@@ -180,6 +490,185 @@ class EnhancedSyncState(BaseModel):
     config_snapshot: Dict[str, Any] = Field(default_factory=dict)
     config_version: Optional[str] = None
     
+    # Per-org views of managed_roles/managed_acls so drift scans skip other orgs.
+    # Private so they are never serialized; rebuilt on load by model_post_init.
+    _roles_by_org: Dict[str, Dict[OrgScopedKey, RoleState]] = PrivateAttr(default_factory=dict)
+    _acls_by_org: Dict[str, Dict[OrgScopedKey, ACLState]] = PrivateAttr(default_factory=dict)
+    # Per-type shards of managed_resources keyed by (resource_id, org)
+    _resources_by_type: Dict[ResourceType, Dict[OrgScopedKey, ManagedResource]] = PrivateAttr(
+        default_factory=dict
+    )
+    # (resource_type, org, resource_name) -> first resource with that name
+    _resources_by_name: Dict[Tuple[ResourceType, str, str], ManagedResource] = PrivateAttr(
+        default_factory=dict
+    )
+    # (resource_type, resource_name) -> first resource with that name in any org
+    _resources_by_type_name: Dict[Tuple[ResourceType, str], ManagedResource] = PrivateAttr(
+        default_factory=dict
+    )
+    
+    # Memoized get_managed_resource_summary result; None means it must be rebuilt
+    _summary_cache: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    
+    @field_validator('managed_resources', mode='before')
+    @classmethod
+    def key_managed_resources(cls, v: Any) -> Any:
+        """Rebuild tuple keys for managed resources loaded from disk."""
+        return _rekey_from_values(v, lambda r: (
+            ResourceType(_raw_field(r, 'resource_type')),
+            _raw_field(r, 'resource_id'),
+            _raw_field(r, 'braintrust_org'),
+        ))
+    
+    @field_validator('managed_roles', 'managed_acls', mode='before')
+    @classmethod
+    def key_managed_roles_and_acls(cls, v: Any) -> Any:
+        """Rebuild (resource_id, org) keys for roles and ACLs loaded from disk."""
+        return _rekey_from_values(v, lambda r: (
+            _raw_field(r, 'resource_id'),
+            _raw_field(r, 'braintrust_org'),
+        ))
+    
+    @field_validator('discovered_projects', mode='before')
+    @classmethod
+    def key_discovered_projects(cls, v: Any) -> Any:
+        """Rebuild (project_id, org) keys for projects loaded from disk."""
+        return _rekey_from_values(v, lambda p: (
+            _raw_field(p, 'project_id'),
+            _raw_field(p, 'braintrust_org'),
+        ))
+    
+    @field_validator('resource_mappings', mode='before')
+    @classmethod
+    def key_resource_mappings(cls, v: Any) -> Any:
+        """Convert per-type mapping lists from older state files to okta_id-keyed dicts."""
+        if not isinstance(v, dict):
+            return v
+        
+        migrated = {}
+        for org_name, org_mappings in v.items():
+            if isinstance(org_mappings, dict) and any(isinstance(m, list) for m in org_mappings.values()):
+                org_mappings = {
+                    resource_type: (
+                        {m['okta_id']: m for m in type_mappings if isinstance(m, dict) and 'okta_id' in m}
+                        if isinstance(type_mappings, list) else type_mappings
+                    )
+                    for resource_type, type_mappings in org_mappings.items()
+                }
+            migrated[org_name] = org_mappings
+        return migrated
+    
+    def _lookup_mapping(self, okta_id: str, braintrust_org: str, resource_type: str) -> Optional[Dict[str, Any]]:
+        """Find the nested mapping for an Okta resource with chained dict lookups."""
+        org_mappings = self.resource_mappings.get(braintrust_org)
+        if not isinstance(org_mappings, dict):
+            return None
+        type_mappings = org_mappings.get(resource_type)
+        if not isinstance(type_mappings, dict):
+            return None
+        return type_mappings.get(okta_id)
+    
+    @field_validator('drift_warnings', mode='before')
+    @classmethod
+    def key_drift_warnings(cls, v: Any) -> Any:
+        """Key warnings loaded as a list by the issue they describe."""
+        if not isinstance(v, list):
+            return v
+        return _rekey_from_values(dict(enumerate(v)), lambda w: (
+            ResourceType(_raw_field(w, 'resource_type')),
+            _raw_field(w, 'resource_id'),
+            _raw_field(w, 'drift_type'),
+        ))
+    
+    @field_serializer('drift_warnings')
+    def serialize_drift_warnings(self, v: Dict[DriftKey, DriftWarning]) -> List[DriftWarning]:
+        return list(v.values())
+    
+    @property
+    def drift_warning_list(self) -> List[DriftWarning]:
+        """Current drift warnings in first-detected order."""
+        return list(self.drift_warnings.values())
+    
+    def _record_drift_warning(self, warning: DriftWarning) -> None:
+        """Insert or refresh the warning for its (type, id, drift_type) issue."""
+        key = (warning.resource_type, warning.resource_id, warning.drift_type)
+        self.drift_warnings[key] = warning
+    
+    @field_serializer('managed_resources')
+    def serialize_managed_resources(self, v: Dict[ResourceKey, ManagedResource]) -> Dict[str, ManagedResource]:
+        return {_format_state_key(k): resource for k, resource in v.items()}
+    
+    @field_serializer('managed_roles')
+    def serialize_managed_roles(self, v: Dict[OrgScopedKey, RoleState]) -> Dict[str, RoleState]:
+        return {_format_state_key(k): role for k, role in v.items()}
+    
+    @field_serializer('managed_acls')
+    def serialize_managed_acls(self, v: Dict[OrgScopedKey, ACLState]) -> Dict[str, ACLState]:
+        return {_format_state_key(k): acl for k, acl in v.items()}
+    
+    @field_serializer('discovered_projects')
+    def serialize_discovered_projects(self, v: Dict[OrgScopedKey, ProjectState]) -> Dict[str, ProjectState]:
+        return {_format_state_key(k): project for k, project in v.items()}
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Build the per-org and per-type indexes from loaded state."""
+        for role_key, role in self.managed_roles.items():
+            self._roles_by_org.setdefault(role.braintrust_org, {})[role_key] = role
+        for acl_key, acl in self.managed_acls.items():
+            self._acls_by_org.setdefault(acl.braintrust_org, {})[acl_key] = acl
+        self._rebuild_resource_index()
+    
+    def _rebuild_resource_index(self) -> None:
+        """Rebuild the per-type and name indexes after managed_resources is replaced."""
+        self._resources_by_type = {}
+        self._resources_by_name = {}
+        self._resources_by_type_name = {}
+        for resource in self.managed_resources.values():
+            self._index_managed_resource(resource)
+    
+    def iter_managed_resources(self, resource_type: Union[ResourceType, str]) -> Iterator[ManagedResource]:
+        """Iterate managed resources of one type without scanning other types.
+        
+        Args:
+            resource_type: Resource type (enum member or string value)
+            
+        Returns:
+            Iterator over the matching ManagedResource entries
+        """
+        return iter(self._resources_by_type.get(_lookup_resource_type(resource_type), {}).values())
+    
+    def _index_managed_resource(self, resource: ManagedResource) -> None:
+        """Add a managed resource to its type shard and name index."""
+        self._resources_by_type.setdefault(resource.resource_type, {})[
+            (resource.resource_id, resource.braintrust_org)
+        ] = resource
+        if resource.resource_name is not None:
+            # setdefault keeps the earliest match, as the old linear scan did
+            self._resources_by_name.setdefault(
+                (resource.resource_type, resource.braintrust_org, resource.resource_name),
+                resource,
+            )
+            self._resources_by_type_name.setdefault(
+                (resource.resource_type, resource.resource_name),
+                resource,
+            )
+    
+    def get_managed_resource_by_name(
+        self,
+        resource_type: Union[ResourceType, str],
+        resource_name: str,
+    ) -> Optional[ManagedResource]:
+        """Find the first managed resource of a type with the given name, in any org.
+        
+        Args:
+            resource_type: Resource type (enum member or string value)
+            resource_name: Resource name (the Okta ID for synced resources)
+            
+        Returns:
+            Matching ManagedResource or None
+        """
+        return self._resources_by_type_name.get((_lookup_resource_type(resource_type), resource_name))
+    
     def update_stats(self, stats_dict: Optional[Dict[str, Any]] = None, **kwargs) -> None:
         """Update statistics for the sync state.
         
@@ -192,10 +681,10 @@ class EnhancedSyncState(BaseModel):
             self.stats.update(stats_dict)
             # Check status in the provided dict
             if stats_dict.get('status') == 'completed':
-                self.completed_at = datetime.now(timezone.utc)
+                self.completed_at = _now()
                 self.status = 'completed'
             elif stats_dict.get('status') == 'failed':
-                self.completed_at = datetime.now(timezone.utc)
+                self.completed_at = _now()
                 self.status = 'failed'
         
         # Also handle kwargs
@@ -203,10 +692,10 @@ class EnhancedSyncState(BaseModel):
             self.stats.update(kwargs)
             # Check status in kwargs
             if kwargs.get('status') == 'completed':
-                self.completed_at = datetime.now(timezone.utc)
+                self.completed_at = _now()
                 self.status = 'completed'
             elif kwargs.get('status') == 'failed':
-                self.completed_at = datetime.now(timezone.utc)
+                self.completed_at = _now()
                 self.status = 'failed'
     
     def add_managed_resource(
@@ -219,7 +708,7 @@ class EnhancedSyncState(BaseModel):
         **kwargs
     ) -> ManagedResource:
         """Add or update a managed resource."""
-        resource_key = f"{resource_type}:{resource_id}:{braintrust_org}"
+        resource_key = (resource_type, resource_id, braintrust_org)
         
         if resource_key in self.managed_resources:
             # Update existing
@@ -241,6 +730,8 @@ class EnhancedSyncState(BaseModel):
                 resource.config_hash = resource.calculate_config_hash(config)
             
             self.managed_resources[resource_key] = resource
+            self._index_managed_resource(resource)
+            self._summary_cache = None
         
         return resource
     
@@ -253,14 +744,16 @@ class EnhancedSyncState(BaseModel):
         created_by_sync: bool = False
     ) -> RoleState:
         """Add or update role state."""
-        role_key = f"{role_id}:{braintrust_org}"
+        role_key = (role_id, braintrust_org)
         
         if role_key in self.managed_roles:
             role = self.managed_roles[role_key]
             role.update_sync_time()
             role.role_definition = role_definition
+            role.config_hash = hash_role_permissions(role_definition.get("member_permissions"))
         else:
-            role = RoleState(
+            # Inputs come from our own role configuration, so skip validation
+            role = RoleState.model_construct(
                 resource_id=role_id,
                 resource_type=ResourceType.ROLE,
                 resource_name=role_name,
@@ -268,11 +761,12 @@ class EnhancedSyncState(BaseModel):
                 created_by_sync=created_by_sync,
                 management_status=ManagementStatus.SYNC_MANAGED if created_by_sync else ManagementStatus.SYNC_MODIFIED,
                 role_definition=role_definition,
-                config_hash=hashlib.sha256(
-                    json.dumps(role_definition, sort_keys=True).encode()
-                ).hexdigest()[:16]
+                # Hash only the permissions so detect_drift compares like with like
+                config_hash=hash_role_permissions(role_definition.get("member_permissions"))
             )
             self.managed_roles[role_key] = role
+            self._roles_by_org.setdefault(braintrust_org, {})[role_key] = role
+            self._summary_cache = None
         
         return role
     
@@ -291,14 +785,15 @@ class EnhancedSyncState(BaseModel):
         created_by_sync: bool = True
     ) -> ACLState:
         """Add or update ACL state."""
-        acl_key = f"{acl_id}:{braintrust_org}"
+        acl_key = (acl_id, braintrust_org)
         
         if acl_key in self.managed_acls:
             acl = self.managed_acls[acl_key]
             acl.update_sync_time()
             acl.permissions = permissions
         else:
-            acl = ACLState(
+            # Inputs come from the assignment being applied, so skip validation
+            acl = ACLState.model_construct(
                 resource_id=acl_id,
                 resource_type=ResourceType.ACL,
                 resource_name=f"{group_name}:{role_name}:{project_name}",
@@ -309,18 +804,19 @@ class EnhancedSyncState(BaseModel):
                 role_name=role_name,
                 project_id=project_id,
                 project_name=project_name,
-                permissions=permissions,
+                permissions=list(permissions),
                 assignment_rule=assignment_rule,
                 created_by_sync=created_by_sync,
                 management_status=ManagementStatus.SYNC_MANAGED if created_by_sync else ManagementStatus.SYNC_MODIFIED
             )
             self.managed_acls[acl_key] = acl
+            self._acls_by_org.setdefault(braintrust_org, {})[acl_key] = acl
+            self._summary_cache = None
             
             # Update role's ACL list
-            role_key = f"{role_id}:{braintrust_org}"
+            role_key = (role_id, braintrust_org)
             if role_key in self.managed_roles:
-                if acl_id not in self.managed_roles[role_key].acl_ids:
-                    self.managed_roles[role_key].acl_ids.append(acl_id)
+                self.managed_roles[role_key].acl_ids.add(acl_id)
         
         return acl
     
@@ -332,11 +828,11 @@ class EnhancedSyncState(BaseModel):
         matched_patterns: Optional[List[str]] = None
     ) -> ProjectState:
         """Track a discovered project."""
-        project_key = f"{project_id}:{braintrust_org}"
+        project_key = (project_id, braintrust_org)
         
         if project_key in self.discovered_projects:
             project = self.discovered_projects[project_key]
-            project.last_seen_at = datetime.now(timezone.utc)
+            project.last_seen_epoch = time.time()
             if matched_patterns:
                 project.matched_patterns = matched_patterns
         else:
@@ -347,6 +843,7 @@ class EnhancedSyncState(BaseModel):
                 matched_patterns=matched_patterns or []
             )
             self.discovered_projects[project_key] = project
+            self._summary_cache = None
         
         return project
     
@@ -357,23 +854,57 @@ class EnhancedSyncState(BaseModel):
         drift_type: str,
         details: str,
         resource_name: Optional[str] = None,
-        severity: str = "warning"
+        severity: str = "warning",
+        braintrust_org: Optional[str] = None,
     ) -> None:
         """Add a drift warning."""
-        warning = DriftWarning(
-            resource_type=resource_type,
+        self.add_drift_warnings_bulk([DriftWarning.model_construct(
+            resource_type=ResourceType(resource_type),
             resource_id=resource_id,
             resource_name=resource_name,
             drift_type=drift_type,
             details=details,
-            severity=severity
-        )
-        self.drift_warnings.append(warning)
+            severity=severity,
+            detected_at=_now(),
+        )], braintrust_org=braintrust_org)
+    
+    def add_drift_warnings_bulk(
+        self,
+        warnings: List[DriftWarning],
+        braintrust_org: Optional[str] = None,
+    ) -> None:
+        """Add several drift warnings at once.
         
-        # Update resource if tracked
-        resource_key = f"{resource_type}:{resource_id}:{self.sync_id}"
-        if resource_key in self.managed_resources:
-            self.managed_resources[resource_key].mark_drift([details])
+        Tracked resources are marked once with the details of all their
+        warnings, instead of once per warning.
+        
+        Args:
+            warnings: Warnings to record
+            braintrust_org: Organization the warnings belong to (matches
+                tracked resources in any organization if not provided)
+        """
+        details_by_type: Dict[ResourceType, Dict[str, List[str]]] = {}
+        for warning in warnings:
+            self._record_drift_warning(warning)
+            details_by_type.setdefault(ResourceType(warning.resource_type), {}).setdefault(
+                warning.resource_id, []
+            ).append(warning.details)
+        self._summary_cache = None
+        
+        # Update resources if tracked
+        for resource_type, details_by_id in details_by_type.items():
+            shard = self._resources_by_type.get(resource_type, {})
+            if braintrust_org is not None:
+                for resource_id, details in details_by_id.items():
+                    resource = shard.get((resource_id, braintrust_org))
+                    if resource is not None:
+                        resource.mark_drift(details)
+            else:
+                # Without an org, match the id in every org with one pass over the shard
+                for (resource_id, _), resource in shard.items():
+                    details = details_by_id.get(resource_id)
+                    if details is not None:
+                        resource.mark_drift(details)
     
     def detect_drift(
         self,
@@ -383,86 +914,94 @@ class EnhancedSyncState(BaseModel):
     ) -> List[DriftWarning]:
         """Detect drift between managed state and current state."""
         warnings = []
+        # Warnings are built from trusted values, so skip validation and share
+        # one timestamp across the scan
+        now = _now()
+        
+        # Index current resources once so each managed lookup is O(1)
+        current_roles_by_id = {r["id"]: r for r in current_roles if "id" in r}
+        current_acls_by_id = {a["id"]: a for a in current_acls if "id" in a}
         
         # Check managed roles
-        for role_key, role_state in self.managed_roles.items():
-            if not role_state.braintrust_org == braintrust_org:
-                continue
-                
-            # Find current role
-            current_role = next(
-                (r for r in current_roles if r.get("id") == role_state.resource_id),
-                None
-            )
+        for role_state in self._roles_by_org.get(braintrust_org, {}).values():
+            current_role = current_roles_by_id.get(role_state.resource_id)
             
             if not current_role:
                 if role_state.created_by_sync:
-                    warnings.append(DriftWarning(
+                    warnings.append(DriftWarning.model_construct(
                         resource_type=ResourceType.ROLE,
                         resource_id=role_state.resource_id,
                         resource_name=role_state.resource_name,
                         drift_type="deleted",
                         details=f"Managed role '{role_state.resource_name}' was deleted externally",
-                        severity="error"
+                        severity="error",
+                        detected_at=now,
                     ))
             else:
                 # Check for modifications
-                current_hash = hashlib.sha256(
-                    json.dumps(current_role.get("member_permissions", []), sort_keys=True).encode()
-                ).hexdigest()[:16]
+                current_hash = hash_role_permissions(current_role.get("member_permissions"))
                 
                 if current_hash != role_state.config_hash:
-                    warnings.append(DriftWarning(
+                    warnings.append(DriftWarning.model_construct(
                         resource_type=ResourceType.ROLE,
                         resource_id=role_state.resource_id,
                         resource_name=role_state.resource_name,
                         drift_type="modified",
                         details=f"Role '{role_state.resource_name}' permissions were modified externally",
-                        severity="warning"
+                        severity="warning",
+                        detected_at=now,
                     ))
         
         # Check managed ACLs
-        for acl_key, acl_state in self.managed_acls.items():
-            if not acl_state.braintrust_org == braintrust_org:
-                continue
-                
-            # Find current ACL
-            current_acl = next(
-                (a for a in current_acls if a.get("id") == acl_state.resource_id),
-                None
-            )
+        for acl_state in self._acls_by_org.get(braintrust_org, {}).values():
+            current_acl = current_acls_by_id.get(acl_state.resource_id)
             
             if not current_acl:
                 if acl_state.created_by_sync:
-                    warnings.append(DriftWarning(
+                    warnings.append(DriftWarning.model_construct(
                         resource_type=ResourceType.ACL,
                         resource_id=acl_state.resource_id,
                         resource_name=acl_state.resource_name,
                         drift_type="deleted",
                         details=f"Managed ACL for '{acl_state.group_name}' on '{acl_state.project_name}' was deleted",
-                        severity="warning"
+                        severity="warning",
+                        detected_at=now,
                     ))
             else:
-                # Check for permission changes
-                current_perms = set(current_acl.get("permissions", []))
-                expected_perms = set(acl_state.permissions)
+                # Check for permission changes. An identical list (the no-drift
+                # case) cannot differ as a set, so only build a set otherwise.
+                current_list = current_acl.get("permissions", [])
+                if current_list == acl_state.permissions:
+                    continue
+                
+                current_perms = frozenset(current_list)
+                expected_perms = acl_state.permission_set
                 
+                # frozenset equality already rejects on size and cached hash first
                 if current_perms != expected_perms:
-                    warnings.append(DriftWarning(
+                    warnings.append(DriftWarning.model_construct(
                         resource_type=ResourceType.ACL,
                         resource_id=acl_state.resource_id,
                         resource_name=acl_state.resource_name,
                         drift_type="permission_changed",
-                        details=f"ACL permissions changed. Expected: {expected_perms}, Found: {current_perms}",
-                        severity="warning"
+                        details=f"ACL permissions changed. Expected: {set(expected_perms)}, Found: {set(current_perms)}",
+                        severity="warning",
+                        detected_at=now,
                     ))
         
-        self.drift_warnings.extend(warnings)
-        self.last_drift_check = datetime.now(timezone.utc)
+        for warning in warnings:
+            self._record_drift_warning(warning)
+        self.last_drift_check = now
+        self._summary_cache = None
         
         return warnings
     
-    def get_braintrust_id(self, okta_resource_id: str, braintrust_org: str, resource_type: str) -> Optional[str]:
+    def get_braintrust_id(
+        self,
+        okta_resource_id: str,
+        braintrust_org: str,
+        resource_type: Union[ResourceType, str],
+    ) -> Optional[str]:
         """Get Braintrust ID for an Okta resource (legacy compatibility method).
         
         Args:
@@ -474,23 +1013,16 @@ class EnhancedSyncState(BaseModel):
             Braintrust ID if mapping exists, None otherwise
         """
         # Check legacy mappings first for backward compatibility
-        if braintrust_org in self.resource_mappings:
-            if resource_type in self.resource_mappings[braintrust_org]:
-                for mapping in self.resource_mappings[braintrust_org][resource_type]:
-                    if mapping.get('okta_id') == okta_resource_id:
-                        return mapping.get('braintrust_id')
-        
-        # Check enhanced managed resources
-        for resource in self.managed_resources.values():
-            if (resource.resource_type.value == resource_type and 
-                resource.braintrust_org == braintrust_org):
-                # Check if this resource was created from the Okta resource
-                # Use a simple mapping approach - store okta_id in resource metadata
-                resource_name = getattr(resource, 'resource_name', None)
-                if resource_name == okta_resource_id:
-                    return resource.resource_id
-        
-        return None
+        mapping = self._lookup_mapping(okta_resource_id, braintrust_org, resource_type)
+        if mapping is not None:
+            return mapping.get('braintrust_id')
+        
+        # Check enhanced managed resources. Resources created from an Okta
+        # resource store the okta_id as resource_name, so this is one lookup.
+        resource = self._resources_by_name.get(
+            (_lookup_resource_type(resource_type), braintrust_org, okta_resource_id)
+        )
+        return resource.resource_id if resource is not None else None
     
     def get_mapping(self, okta_id: str, braintrust_org: str, resource_type: str) -> Optional[Dict[str, Any]]:
         """Get mapping for an Okta resource (compatibility method).
@@ -503,19 +1035,14 @@ class EnhancedSyncState(BaseModel):
         Returns:
             Mapping dictionary with braintrust_id or None
         """
-        # Check the new structure: resource_mappings[org][type] = [list of mappings]
-        if braintrust_org in self.resource_mappings:
-            org_mappings = self.resource_mappings[braintrust_org]
-            if resource_type in org_mappings:
-                type_mappings = org_mappings[resource_type]
-                if isinstance(type_mappings, list):
-                    for mapping in type_mappings:
-                        if isinstance(mapping, dict) and mapping.get('okta_id') == okta_id:
-                            # Create a simple object with braintrust_id attribute for compatibility
-                            class MappingResult:
-                                def __init__(self, braintrust_id):
-                                    self.braintrust_id = braintrust_id
-                            return MappingResult(mapping.get('braintrust_id'))
+        # Check the new structure: resource_mappings[org][type][okta_id] = mapping
+        mapping = self._lookup_mapping(okta_id, braintrust_org, resource_type)
+        if mapping is not None:
+            # Create a simple object with braintrust_id attribute for compatibility
+            class MappingResult:
+                def __init__(self, braintrust_id):
+                    self.braintrust_id = braintrust_id
+            return MappingResult(mapping.get('braintrust_id'))
         
         # Check the legacy flat structure: resource_mappings[key] = mapping
         mapping_key = f"{okta_id}:{braintrust_org}:{resource_type}"
@@ -536,32 +1063,38 @@ class EnhancedSyncState(BaseModel):
             resource_type: Type of resource (user, group, etc.)
             **kwargs: Additional mapping metadata
         """
-        # Initialize org mappings if needed
-        if braintrust_org not in self.resource_mappings:
-            self.resource_mappings[braintrust_org] = {}
-        
-        if resource_type not in self.resource_mappings[braintrust_org]:
-            self.resource_mappings[braintrust_org][resource_type] = []
-        
-        # Add mapping
         mapping = {
             'okta_id': okta_id,
             'braintrust_id': braintrust_id,
-            'created_at': datetime.now(timezone.utc).isoformat(),
+            'created_at': _now_iso(),
             **kwargs
         }
         
-        # Check if mapping already exists and update it
-        existing_mapping = None
-        for i, existing in enumerate(self.resource_mappings[braintrust_org][resource_type]):
-            if existing.get('okta_id') == okta_id:
-                existing_mapping = i
-                break
+        # Insert or replace the mapping for this okta_id
+        self.resource_mappings.setdefault(braintrust_org, {}).setdefault(resource_type, {})[okta_id] = mapping
+    
+    def remove_mapping(self, okta_id: str, braintrust_org: str, resource_type: str) -> bool:
+        """Remove the mapping for an Okta resource.
         
-        if existing_mapping is not None:
-            self.resource_mappings[braintrust_org][resource_type][existing_mapping] = mapping
-        else:
-            self.resource_mappings[braintrust_org][resource_type].append(mapping)
+        Args:
+            okta_id: Okta resource ID
+            braintrust_org: Braintrust organization name
+            resource_type: Type of resource (user, group, etc.)
+            
+        Returns:
+            True if a mapping was removed
+        """
+        removed = False
+        type_mappings = self.resource_mappings.get(braintrust_org, {}).get(resource_type)
+        if isinstance(type_mappings, dict):
+            removed = type_mappings.pop(okta_id, None) is not None
+        
+        # Also drop the legacy flat entry if present
+        legacy_key = f"{okta_id}:{braintrust_org}:{resource_type}"
+        if self.resource_mappings.pop(legacy_key, None) is not None:
+            removed = True
+        
+        return removed
     
     def mark_failed(self, resource_id: str, resource_type: str, error_message: str) -> None:
         """Mark a resource operation as failed (legacy compatibility method).
@@ -571,25 +1104,46 @@ class EnhancedSyncState(BaseModel):
             resource_type: Type of resource
             error_message: Error message
         """
-        # Update stats to track failures
-        if 'failed_operations' not in self.stats:
-            self.stats['failed_operations'] = []
+        self._record_failure(resource_id, resource_type, error_message)
+    
+    def _record_failure(self, resource_id: str, resource_type: str, error_message: str) -> None:
+        """Count a failed operation and keep its record in a bounded buffer.
         
-        failure_record = {
+        Args:
+            resource_id: Resource ID that failed
+            resource_type: Type of resource
+            error_message: Error message
+        """
+        # Keep only the most recent records so stats stay bounded on long syncs;
+        # lists loaded from disk are wrapped on the first new failure
+        failed_operations = self.stats.get('failed_operations')
+        if not isinstance(failed_operations, deque):
+            failed_operations = deque(failed_operations or (), maxlen=_MAX_FAILED_OPERATIONS)
+            self.stats['failed_operations'] = failed_operations
+        
+        failed_operations.append({
             'resource_id': resource_id,
             'resource_type': resource_type,
             'error_message': error_message,
-            'failed_at': datetime.now(timezone.utc).isoformat()
-        }
-        
-        self.stats['failed_operations'].append(failure_record)
+            'failed_at': _now().isoformat()
+        })
         
         # Update failure counts
         failure_key = f'failed_{resource_type}s'
         self.stats[failure_key] = self.stats.get(failure_key, 0) + 1
     
     def get_managed_resource_summary(self) -> Dict[str, Any]:
-        """Get summary of managed resources."""
+        """Get summary of managed resources.
+        
+        The summary is cached and only rebuilt after a tracking method has
+        changed the counts, so polling callers avoid rescanning resources.
+        """
+        if self._summary_cache is None:
+            self._summary_cache = self._build_managed_resource_summary()
+        return dict(self._summary_cache)
+    
+    def _build_managed_resource_summary(self) -> Dict[str, Any]:
+        """Build the managed resource summary from the current state."""
         return {
             "total_managed_resources": len(self.managed_resources),
             "managed_roles": len(self.managed_roles),
@@ -605,29 +1159,27 @@ class EnhancedSyncState(BaseModel):
     
     def cleanup_stale_resources(self, max_age_days: int = 30) -> int:
         """Remove resources not seen in recent syncs."""
-        cutoff_time = datetime.now(timezone.utc).timestamp() - (max_age_days * 86400)
-        removed_count = 0
-        
-        # Clean up old managed resources
-        for key in list(self.managed_resources.keys()):
-            resource = self.managed_resources[key]
-            if resource.last_synced_at.timestamp() < cutoff_time:
-                del self.managed_resources[key]
-                removed_count += 1
-        
-        # Clean up old projects
-        for key in list(self.discovered_projects.keys()):
-            project = self.discovered_projects[key]
-            if project.last_seen_at.timestamp() < cutoff_time:
-                del self.discovered_projects[key]
-                removed_count += 1
+        cutoff_time = time.time() - (max_age_days * 86400)
+        before_count = len(self.managed_resources) + len(self.discovered_projects)
+        self._summary_cache = None
+        
+        # Rebuild each dict in one linear pass rather than deleting keys one by one
+        self.managed_resources = {
+            key: resource for key, resource in self.managed_resources.items()
+            if resource.last_synced_epoch >= cutoff_time
+        }
+        self.discovered_projects = {
+            key: project for key, project in self.discovered_projects.items()
+            if project.last_seen_epoch >= cutoff_time
+        }
+        self._rebuild_resource_index()
         
-        return removed_count
+        return before_count - len(self.managed_resources) - len(self.discovered_projects)
     
     def mark_completed(self) -> None:
         """Mark the sync state as completed."""
         self.status = "completed"
-        self.completed_at = datetime.now(timezone.utc)
+        self.completed_at = _now()
     
     def mark_failed(self, error_message: str) -> None:
         """Mark the sync state as failed.
@@ -636,27 +1188,45 @@ class EnhancedSyncState(BaseModel):
             error_message: Error message describing the failure
         """
         self.status = "failed"
-        self.completed_at = datetime.now(timezone.utc)
+        self.completed_at = _now()
         if 'error_message' not in self.stats:
             self.stats['error_message'] = error_message
 
 
+class SyncStateSummary(BaseModel):
+    """Top-level metadata of a saved sync state, without the tracked resources."""
+    
+    sync_id: str
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    status: str = "in_progress"
+    stats: Dict[str, Any] = Field(default_factory=dict)
+
+
 class StateManager:
     """Manages enhanced sync state with resource tracking and drift detection."""
     
+    # Gzip level 3 keeps most of the size win at a fraction of level 9's CPU
+    _COMPRESS_LEVEL = 3
+    
     def __init__(
         self, 
         state_dir: Path = Path("./state"),
+        compress: bool = False,
     ) -> None:
         """Initialize state manager.
         
         Args:
             state_dir: Directory to store state files
+            compress: Write state files gzip-compressed as ``<sync_id>.json.gz``
         """
         self.state_dir = Path(state_dir)
         self.state_dir.mkdir(parents=True, exist_ok=True)
+        self.compress = compress
         
         self._current_state: Optional[EnhancedSyncState] = None
+        # State object and file written by the last successful save_sync_state
+        self._last_saved: Optional[Tuple[EnhancedSyncState, Path]] = None
         self._logger = logger.bind(state_dir=str(self.state_dir))
     
     def create_sync_state(
@@ -705,24 +1275,24 @@ class StateManager:
         Returns:
             Loaded EnhancedSyncState instance or None if not found
         """
-        state_file = self.state_dir / f"{sync_id}.json"
+        state_file = self._find_state_file(sync_id)
         
-        if not state_file.exists():
-            self._logger.warning("Sync state file not found", sync_id=sync_id, file=str(state_file))
+        if state_file is None:
+            self._logger.warning("Sync state file not found", sync_id=sync_id, file=str(self._state_file(sync_id)))
             return None
         
         try:
             self._logger.debug(f"Attempting to load state file: {state_file}")
-            with open(state_file, 'r', encoding='utf-8') as f:
-                state_data = json.load(f)
+            raw_state = self._read_state_bytes(state_file)
             
-            self._logger.debug(f"Loaded JSON data, attempting model validation")
-            # Try strict validation first
+            self._logger.debug(f"Read state file, attempting model validation")
+            # Try strict validation first; parsing and validation happen in one pass
             try:
-                self._current_state = EnhancedSyncState.model_validate(state_data)
+                self._current_state = EnhancedSyncState.model_validate_json(raw_state)
             except Exception as validation_error:
                 # If strict validation fails, try to load with partial data for backward compatibility
                 self._logger.warning(f"Strict validation failed, attempting backward compatibility loading: {str(validation_error)}")
+                state_data = orjson.loads(raw_state)
                 
                 # Create a minimal state with just the essential fields for delete functionality
                 minimal_state_data = {
@@ -753,11 +1323,42 @@ class StateManager:
             self._logger.error("Failed to load sync state", sync_id=sync_id, error=str(e), traceback=traceback.format_exc())
             return None
     
-    def save_sync_state(self, state: Optional[EnhancedSyncState] = None) -> bool:
+    def load_sync_state_summary(self, sync_id: str) -> Optional[SyncStateSummary]:
+        """Load only the metadata of a saved sync state.
+        
+        Unlike load_sync_state this does not validate the managed resources,
+        roles, ACLs or drift warnings, and does not replace the current state.
+        
+        Args:
+            sync_id: Sync ID to load
+            
+        Returns:
+            SyncStateSummary or None if not found or unreadable
+        """
+        state_file = self._find_state_file(sync_id)
+        if state_file is None:
+            return None
+        
+        try:
+            # Unknown keys are ignored, so the nested collections are never validated
+            return SyncStateSummary.model_validate(orjson.loads(self._read_state_bytes(state_file)))
+        except Exception as e:
+            self._logger.error("Failed to load sync state summary", sync_id=sync_id, error=str(e))
+            return None
+    
+    def save_sync_state(
+        self,
+        state: Optional[EnhancedSyncState] = None,
+        keep_backup: bool = True,
+    ) -> bool:
         """Save enhanced sync state to disk.
         
+        The file is replaced atomically, so a crash mid-write leaves the
+        previous state in place rather than a truncated file.
+        
         Args:
             state: State to save (uses current state if not provided)
+            keep_backup: Keep the previous file alongside with a ``.backup`` suffix
             
         Returns:
             True if saved successfully, False otherwise
@@ -769,22 +1370,29 @@ class StateManager:
             self._logger.error("No sync state to save")
             return False
         
-        state_file = self.state_dir / f"{state.sync_id}.json"
+        state_file = self._state_file(state.sync_id)
         
         try:
-            # Create backup of existing file
-            if state_file.exists():
-                backup_file = state_file.with_suffix('.json.backup')
-                state_file.rename(backup_file)
+            # Keep the previous file as a backup without copying its contents
+            if keep_backup and state_file.exists():
+                self._link_backup(state_file, self._backup_file(state_file))
             
-            # Save enhanced state
-            with open(state_file, 'w', encoding='utf-8') as f:
-                json.dump(
-                    state.model_dump(mode='json'),
-                    f,
-                    indent=2,
-                    default=str,  # Handle datetime serialization
+            # Save enhanced state, serialized straight to JSON without a dict copy.
+            # Unset optional fields are omitted; every one of them defaults to
+            # None, so they come back unchanged on load. exclude_defaults is
+            # deliberately not used: pydantic compares default_factory fields
+            # against a fresh factory call, which would drop timestamps that
+            # fall in the current clock tick and re-stamp them on load.
+            if self.compress:
+                data = gzip.compress(
+                    state.model_dump_json(exclude_none=True).encode('utf-8'),
+                    compresslevel=self._COMPRESS_LEVEL,
+                    mtime=0,
                 )
+            else:
+                data = state.model_dump_json(indent=2, exclude_none=True).encode('utf-8')
+            self._write_atomic(state_file, data)
+            self._last_saved = (state, state_file)
             
             self._logger.debug(
                 "Saved enhanced sync state", 
@@ -800,6 +1408,79 @@ class StateManager:
             self._logger.error("Failed to save sync state", sync_id=state.sync_id, error=str(e))
             return False
     
+    def _state_file(self, sync_id: str) -> Path:
+        """Get the path new state for ``sync_id`` is written to."""
+        suffix = '.json.gz' if self.compress else '.json'
+        return self.state_dir / f"{sync_id}{suffix}"
+    
+    def _find_state_file(self, sync_id: str) -> Optional[Path]:
+        """Find the stored state file for ``sync_id`` in either format.
+        
+        The configured format is tried first so switching ``compress`` on
+        still loads states written before the switch.
+        """
+        preferred = self._state_file(sync_id)
+        fallback = self.state_dir / (f"{sync_id}.json" if self.compress else f"{sync_id}.json.gz")
+        for candidate in (preferred, fallback):
+            if candidate.exists():
+                return candidate
+        return None
+    
+    @staticmethod
+    def _read_state_bytes(state_file: Path) -> bytes:
+        """Read a state file, decompressing ``.json.gz`` files."""
+        raw_state = state_file.read_bytes()
+        if state_file.suffix == '.gz':
+            raw_state = gzip.decompress(raw_state)
+        return raw_state
+    
+    @staticmethod
+    def _backup_file(state_file: Path) -> Path:
+        """Get the backup path for a state file."""
+        return state_file.with_name(state_file.name + '.backup')
+    
+    @staticmethod
+    def _sync_id_from_path(state_file: Path) -> str:
+        """Strip the ``.json``/``.json.gz`` suffix from a state file name."""
+        name = state_file.name
+        return name[:-len('.json.gz')] if name.endswith('.json.gz') else name[:-len('.json')]
+    
+    def _glob_state_files(self, prefix: str) -> List[Path]:
+        """List plain and compressed state files whose name starts with ``prefix``."""
+        return [
+            *self.state_dir.glob(f"{prefix}*.json"),
+            *self.state_dir.glob(f"{prefix}*.json.gz"),
+        ]
+    
+    @staticmethod
+    def _write_atomic(target: Path, data: bytes) -> None:
+        """Write bytes to a sibling temp file and atomically swap it into place.
+        
+        Args:
+            target: Final file path
+            data: Complete file contents
+        """
+        tmp_file = target.with_suffix(target.suffix + '.tmp')
+        try:
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, target)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+    
+    @staticmethod
+    def _link_backup(source: Path, backup: Path) -> None:
+        """Point the backup at the current file's contents.
+        
+        A hard link survives the later ``os.replace`` of ``source``, so the
+        backup costs no data copy; filesystems without links fall back to one.
+        """
+        backup.unlink(missing_ok=True)
+        try:
+            os.link(source, backup)
+        except OSError:
+            shutil.copy2(source, backup)
+    
     def list_sync_states(self) -> List[str]:
         """List all available sync state IDs.
         
@@ -808,15 +1489,15 @@ class StateManager:
         """
         try:
             # Look for both sync_*.json and exec_*.json patterns
-            sync_files = list(self.state_dir.glob("sync_*.json"))
-            exec_files = list(self.state_dir.glob("exec_*.json"))
+            sync_files = self._glob_state_files("sync_")
+            exec_files = self._glob_state_files("exec_")
             
             # Filter out execution tracking files - we want only main state files
-            main_state_files = [f for f in (sync_files + exec_files) 
-                              if not f.stem.endswith('_completed') and 'execution' not in f.stem]
-            
-            sync_ids = [f.stem for f in main_state_files]
-            return sorted(sync_ids)
+            sync_ids = {self._sync_id_from_path(f) for f in (sync_files + exec_files)}
+            return sorted(
+                sync_id for sync_id in sync_ids
+                if not sync_id.endswith('_completed') and 'execution' not in sync_id
+            )
         except Exception as e:
             self._logger.error("Failed to list sync states", error=str(e))
             return []
@@ -831,19 +1512,26 @@ class StateManager:
             Number of states cleaned up
         """
         try:
-            sync_files = list(self.state_dir.glob("sync_*.json"))
+            # One directory scan gives names and (cached) mtimes for every file
+            with os.scandir(self.state_dir) as it:
+                entries = list(it)
+            names = {entry.name for entry in entries}
+            sync_files = [
+                (entry.stat().st_mtime, entry.name) for entry in entries
+                if entry.name.startswith("sync_") and entry.name.endswith(('.json', '.json.gz'))
+            ]
             
             # Sort by modification time (newest first)
-            sync_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+            sync_files.sort(reverse=True)
             
             # Remove old files
             cleaned_count = 0
-            for old_file in sync_files[keep_count:]:
-                old_file.unlink()
+            for _, old_name in sync_files[keep_count:]:
+                os.unlink(self.state_dir / old_name)
                 # Also remove backup if it exists
-                backup_file = old_file.with_suffix('.json.backup')
-                if backup_file.exists():
-                    backup_file.unlink()
+                backup_name = old_name + '.backup'
+                if backup_name in names:
+                    os.unlink(self.state_dir / backup_name)
                 cleaned_count += 1
             
             if cleaned_count > 0:
@@ -874,11 +1562,23 @@ class StateManager:
         self._logger.debug(f"Loaded state result: {result is not None}")
         return result
     
-    def create_checkpoint(self, checkpoint_name: str = "checkpoint") -> bool:
+    def create_checkpoint(
+        self,
+        checkpoint_name: str = "checkpoint",
+        pretty: bool = False,
+        from_saved: bool = False,
+    ) -> bool:
         """Create a checkpoint of the current state.
         
+        Checkpoints are only read back by the tool, so they are written as
+        compact JSON unless ``pretty`` is set.
+        
         Args:
             checkpoint_name: Name for the checkpoint
+            pretty: Indent the JSON for manual inspection
+            from_saved: The current state has not changed since it was last
+                saved, so the checkpoint may reuse the saved file instead of
+                serializing the state again
             
         Returns:
             True if checkpoint created successfully
@@ -889,13 +1589,10 @@ class StateManager:
         checkpoint_file = self.state_dir / f"{self._current_state.sync_id}_{checkpoint_name}.json"
         
         try:
-            with open(checkpoint_file, 'w', encoding='utf-8') as f:
-                json.dump(
-                    self._current_state.model_dump(mode='json'),
-                    f,
-                    indent=2,
-                    default=str,
-                )
+            if not (from_saved and self._link_saved_state(checkpoint_file)):
+                # pydantic-core writes datetimes and enums natively; no default=str fallback
+                data = self._current_state.model_dump_json(indent=2 if pretty else None).encode('utf-8')
+                self._write_atomic(checkpoint_file, data)
             
             self._logger.info(
                 "Created checkpoint",
@@ -908,6 +1605,28 @@ class StateManager:
             self._logger.error("Failed to create checkpoint", error=str(e))
             return False
     
+    def _link_saved_state(self, checkpoint_file: Path) -> bool:
+        """Hard-link the last saved plain JSON file of the current state as a checkpoint.
+        
+        Later saves swap in a new file with ``os.replace``, so the link keeps
+        pointing at this snapshot.
+        
+        Returns:
+            True if the checkpoint was linked, False if it must be serialized
+        """
+        if self._last_saved is None:
+            return False
+        saved_state, saved_file = self._last_saved
+        if saved_state is not self._current_state or saved_file.suffix != '.json':
+            return False
+        
+        checkpoint_file.unlink(missing_ok=True)
+        try:
+            os.link(saved_file, checkpoint_file)
+        except OSError:
+            return False
+        return True
+    
     def track_managed_resource(
         self,
         resource_id: str,
@@ -1100,12 +1819,12 @@ class StateManager:
         
         return self._current_state.cleanup_stale_resources(max_age_days)
     
-    def get_braintrust_id(self, okta_resource_id: str, resource_type: str) -> Optional[str]:
+    def get_braintrust_id(self, okta_resource_id: str, resource_type: Union[ResourceType, str]) -> Optional[str]:
         """Get Braintrust ID for an Okta resource.
         
         Args:
             okta_resource_id: Okta resource ID
-            resource_type: Type of resource (user, group, etc.)
+            resource_type: Type of resource (enum member or string value)
             
         Returns:
             Braintrust ID if mapping exists, None otherwise
@@ -1114,22 +1833,15 @@ class StateManager:
             return None
         
         # Check legacy mappings first for backward compatibility
-        for org_mappings in self._current_state.resource_mappings.values():
-            if resource_type in org_mappings:
-                for mapping in org_mappings[resource_type]:
-                    if mapping.get('okta_id') == okta_resource_id:
-                        return mapping.get('braintrust_id')
-        
-        # Check enhanced managed resources
-        for resource in self._current_state.managed_resources.values():
-            if resource.resource_type.value == resource_type:
-                # Check if this resource was created from the Okta resource
-                # Use a simple mapping approach - store okta_id in resource metadata
-                resource_name = getattr(resource, 'resource_name', None)
-                if resource_name == okta_resource_id:
-                    return resource.resource_id
-        
-        return None
+        for org_name in self._current_state.resource_mappings:
+            mapping = self._current_state._lookup_mapping(okta_resource_id, org_name, resource_type)
+            if mapping is not None:
+                return mapping.get('braintrust_id')
+        
+        # Check enhanced managed resources. Resources created from an Okta
+        # resource store the okta_id as resource_name, so this is one lookup.
+        resource = self._current_state.get_managed_resource_by_name(resource_type, okta_resource_id)
+        return resource.resource_id if resource is not None else None
     
     def add_mapping(self, org_name: str, resource_type: str, okta_id: str, braintrust_id: str, **kwargs) -> None:
         """Add resource mapping for tracking Okta to Braintrust relationships.
@@ -1144,32 +1856,7 @@ class StateManager:
         if not self._current_state:
             return
         
-        # Initialize org mappings if needed
-        if org_name not in self._current_state.resource_mappings:
-            self._current_state.resource_mappings[org_name] = {}
-        
-        if resource_type not in self._current_state.resource_mappings[org_name]:
-            self._current_state.resource_mappings[org_name][resource_type] = []
-        
-        # Add mapping
-        mapping = {
-            'okta_id': okta_id,
-            'braintrust_id': braintrust_id,
-            'created_at': datetime.now(timezone.utc).isoformat(),
-            **kwargs
-        }
-        
-        # Check if mapping already exists and update it
-        existing_mapping = None
-        for i, existing in enumerate(self._current_state.resource_mappings[org_name][resource_type]):
-            if existing.get('okta_id') == okta_id:
-                existing_mapping = i
-                break
-        
-        if existing_mapping is not None:
-            self._current_state.resource_mappings[org_name][resource_type][existing_mapping] = mapping
-        else:
-            self._current_state.resource_mappings[org_name][resource_type].append(mapping)
+        self._current_state.add_mapping(okta_id, braintrust_id, org_name, resource_type, **kwargs)
     
     def mark_failed(self, resource_id: str, resource_type: str, error_message: str) -> None:
         """Mark a resource operation as failed.
@@ -1182,19 +1869,4 @@ class StateManager:
         if not self._current_state:
             return
         
-        # Update stats to track failures
-        if 'failed_operations' not in self._current_state.stats:
-            self._current_state.stats['failed_operations'] = []
-        
-        failure_record = {
-            'resource_id': resource_id,
-            'resource_type': resource_type,
-            'error_message': error_message,
-            'failed_at': datetime.now(timezone.utc).isoformat()
-        }
-        
-        self._current_state.stats['failed_operations'].append(failure_record)
-        
-        # Update failure counts
-        failure_key = f'failed_{resource_type}s'
-        self._current_state.stats[failure_key] = self._current_state.stats.get(failure_key, 0) + 1
\ No newline at end of file
+        self._current_state._record_failure(resource_id, resource_type, error_message)
\ No newline at end of file
@@ -1,12 +1,13 @@
 """Sync plan execution with comprehensive error handling and progress tracking."""
 
 import asyncio
+import itertools
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Set, Callable
 
 import structlog
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from sync.audit.logger import AuditLogger, AuditSummary
 from sync.clients.braintrust import BraintrustClient
@@ -19,6 +20,13 @@ from sync.resources.groups import GroupSyncer
 
 logger = structlog.get_logger(__name__)
 
+# Sync results waiting for the audit log; producers wait when it is full
+_AUDIT_QUEUE_SIZE = 10_000
+# Most results written to the audit log in one batch
+_AUDIT_BATCH_SIZE = 256
+# Most error and warning messages kept on ExecutionProgress; later ones are only counted
+_MAX_PROGRESS_MESSAGES = 1000
+
 
 class ExecutionProgress(BaseModel):
     """Progress tracking for sync execution."""
@@ -43,9 +51,15 @@ class ExecutionProgress(BaseModel):
     phase_start_times: Dict[str, datetime] = Field(default_factory=dict)
     estimated_completion: Optional[datetime] = None
     
-    # Error tracking
+    # Error tracking (messages past the limit are only counted)
     errors: List[str] = Field(default_factory=list)
     warnings: List[str] = Field(default_factory=list)
+    error_overflow: int = 0
+    warning_overflow: int = 0
+    
+    # Monotonic clock readings for durations, immune to wall clock adjustments
+    _started_monotonic: float = PrivateAttr(default_factory=time.monotonic)
+    _completed_monotonic: Optional[float] = PrivateAttr(default=None)
     
     def get_completion_percentage(self) -> float:
         """Get completion percentage (0-100)."""
@@ -53,8 +67,25 @@ class ExecutionProgress(BaseModel):
             return 100.0
         return (self.completed_items / self.total_items) * 100.0
     
+    def mark_completed(self) -> None:
+        """Record the completion time of the execution."""
+        self._completed_monotonic = time.monotonic()
+        self.completed_at = datetime.now(timezone.utc)
+    
+    def get_duration_seconds(self) -> Optional[float]:
+        """Get execution duration in seconds, or None if not completed."""
+        if self._completed_monotonic is not None:
+            return self._completed_monotonic - self._started_monotonic
+        if self.completed_at is not None:
+            return (self.completed_at - self.started_at).total_seconds()
+        return None
+    
     def add_error(self, error: str, context: Optional[Dict[str, Any]] = None) -> None:
         """Add an error to the progress tracking."""
+        if len(self.errors) >= _MAX_PROGRESS_MESSAGES:
+            self.error_overflow += 1
+            return
+        
         error_msg = error
         if context:
             error_msg += f" (Context: {context})"
@@ -62,6 +93,10 @@ class ExecutionProgress(BaseModel):
     
     def add_warning(self, warning: str) -> None:
         """Add a warning to the progress tracking."""
+        if len(self.warnings) >= _MAX_PROGRESS_MESSAGES:
+            self.warning_overflow += 1
+            return
+        
         self.warnings.append(warning)
     
     def start_phase(self, phase_name: str) -> None:
@@ -71,15 +106,16 @@ class ExecutionProgress(BaseModel):
     
     def update_org_progress(self, org_name: str, action: str, increment: int = 1) -> None:
         """Update progress for a specific organization."""
-        if org_name not in self.org_progress:
-            self.org_progress[org_name] = {
+        counts = self.org_progress.get(org_name)
+        if counts is None:
+            counts = self.org_progress[org_name] = {
                 "completed": 0,
                 "failed": 0,
                 "skipped": 0,
             }
         
-        if action in self.org_progress[org_name]:
-            self.org_progress[org_name][action] += increment
+        if action in counts:
+            counts[action] += increment
 
 
 class SyncExecutor:
@@ -111,6 +147,14 @@ class SyncExecutor:
         self.progress_callback = progress_callback
         self.config = config
         
+        # Sync results are audited by a background task while a plan executes
+        self._audit_queue: Optional[asyncio.Queue] = None
+        self._audit_drain_task: Optional[asyncio.Task] = None
+        
+        # Item completions wake a notifier task instead of calling back inline
+        self._progress_event: Optional[asyncio.Event] = None
+        self._progress_task: Optional[asyncio.Task] = None
+        
         # Initialize resource syncers
         # Extract group assignment configuration if available
         group_assignment_config = {}
@@ -188,11 +232,17 @@ class SyncExecutor:
         
         # Start audit logging for this execution
         audit_summary = self.audit_logger.start_execution_audit(execution_id)
+        self._start_audit_drain()
+        self._start_progress_notifier(progress)
         
         try:
-            # Log all plan items for audit trail
-            for item in plan.get_all_items():
-                self.audit_logger.log_sync_plan_item(item, execution_id, "planning")
+            # Log all plan items for audit trail, in get_all_items() order
+            # without building the concatenated list
+            self.audit_logger.log_sync_plan_items(
+                itertools.chain(plan.user_items, plan.group_items, plan.role_items, plan.acl_items),
+                execution_id,
+                "planning",
+            )
             
             # Initialization phase
             progress.start_phase("initializing")
@@ -200,28 +250,11 @@ class SyncExecutor:
             
             await self._initialize_execution(plan, progress)
             
-            # Execute user sync phase
-            if plan.user_items:
-                progress.start_phase("users")
-                self._notify_progress(progress)
-                
-                await self._execute_resource_phase(
-                    items=plan.user_items,
-                    syncer=self.user_syncer,
-                    progress=progress,
-                    dry_run=dry_run,
-                    continue_on_error=continue_on_error,
-                    max_concurrent=max_concurrent_operations,
-                )
-            
-            # Execute group sync phase
-            if plan.group_items:
-                progress.start_phase("groups")
-                self._notify_progress(progress)
-                
-                await self._execute_resource_phase(
-                    items=plan.group_items,
-                    syncer=self.group_syncer,
+            # Execute user and group sync phases, each org's groups
+            # starting as soon as that org's users are done
+            if plan.user_items or plan.group_items:
+                await self._execute_user_group_phases(
+                    plan=plan,
                     progress=progress,
                     dry_run=dry_run,
                     continue_on_error=continue_on_error,
@@ -248,7 +281,7 @@ class SyncExecutor:
             
             # Mark as completed
             progress.start_phase("completed")
-            progress.completed_at = datetime.now(timezone.utc)
+            progress.mark_completed()
             
             self._logger.info(
                 "Sync plan execution completed",
@@ -257,17 +290,18 @@ class SyncExecutor:
                 completed_items=progress.completed_items,
                 failed_items=progress.failed_items,
                 skipped_items=progress.skipped_items,
-                duration_seconds=(progress.completed_at - progress.started_at).total_seconds(),
+                duration_seconds=progress.get_duration_seconds(),
             )
             
             # Complete audit logging successfully
+            await self._stop_audit_drain()
             final_audit_summary = self.audit_logger.complete_execution_audit(
                 success=True
             )
             
         except Exception as e:
             progress.start_phase("failed")
-            progress.completed_at = datetime.now(timezone.utc)
+            progress.mark_completed()
             progress.add_error(f"Sync execution failed: {e}")
             
             self._logger.error(
@@ -278,16 +312,119 @@ class SyncExecutor:
             )
             
             # Complete audit logging with failure
+            await self._stop_audit_drain()
             final_audit_summary = self.audit_logger.complete_execution_audit(
                 success=False,
                 error_message=str(e)
             )
         
         finally:
+            await self._stop_audit_drain()
+            await self._stop_progress_notifier()
             self._notify_progress(progress)
         
         return progress
     
+    def _start_audit_drain(self) -> None:
+        """Start the background task that writes queued sync results to the audit log."""
+        self._audit_queue = asyncio.Queue(maxsize=_AUDIT_QUEUE_SIZE)
+        self._audit_drain_task = asyncio.create_task(self._drain_audit_queue(self._audit_queue))
+    
+    async def _drain_audit_queue(self, queue: asyncio.Queue) -> None:
+        """Write queued sync results to the audit log in batches until a None sentinel.
+        
+        Args:
+            queue: Queue of SyncResults, terminated by None
+        """
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < _AUDIT_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            # The sentinel is always the last item ever queued
+            stop = batch[-1] is None
+            results = batch[:-1] if stop else batch
+            try:
+                self.audit_logger.log_sync_results(results)
+            except Exception as e:
+                self._logger.error("Failed to write audit batch", results=len(results), error=str(e))
+            
+            if stop:
+                return
+    
+    async def _stop_audit_drain(self) -> None:
+        """Flush queued sync results to the audit log and stop the drain task."""
+        if self._audit_drain_task is None:
+            return
+        
+        queue, drain_task = self._audit_queue, self._audit_drain_task
+        self._audit_queue = None
+        self._audit_drain_task = None
+        await queue.put(None)
+        await drain_task
+    
+    async def _audit_sync_result(self, result: SyncResult) -> None:
+        """Queue a sync result for the audit log, or log it directly outside a plan run.
+        
+        Args:
+            result: Sync result to audit
+        """
+        if self._audit_queue is None:
+            self.audit_logger.log_sync_result(result)
+        else:
+            await self._audit_queue.put(result)
+    
+    def _start_progress_notifier(self, progress: ExecutionProgress) -> None:
+        """Start the task that reports item progress to the progress callback.
+        
+        Args:
+            progress: Progress tracker reported on each notification
+        """
+        if not self.progress_callback:
+            return
+        self._progress_event = asyncio.Event()
+        self._progress_task = asyncio.create_task(
+            self._run_progress_notifier(progress, self._progress_event)
+        )
+    
+    async def _run_progress_notifier(
+        self,
+        progress: ExecutionProgress,
+        event: asyncio.Event,
+    ) -> None:
+        """Notify the progress callback each time the progress event is set.
+        
+        Changes made while the callback is pending are reported together by
+        the next notification, which always sees the latest progress.
+        
+        Args:
+            progress: Progress tracker to report
+            event: Event set whenever progress changes
+        """
+        while True:
+            await event.wait()
+            event.clear()
+            self._notify_progress(progress)
+    
+    async def _stop_progress_notifier(self) -> None:
+        """Stop the progress notifier task."""
+        if self._progress_task is None:
+            return
+        
+        progress_task = self._progress_task
+        self._progress_event = None
+        self._progress_task = None
+        progress_task.cancel()
+        try:
+            await progress_task
+        except asyncio.CancelledError:
+            pass
+    
+    def _progress_changed(self) -> None:
+        """Signal the progress notifier that an item finished."""
+        if self._progress_event is not None:
+            self._progress_event.set()
+    
     async def _initialize_execution(
         self,
         plan: SyncPlan,
@@ -317,8 +454,8 @@ class SyncExecutor:
                 "target_organizations": plan.target_organizations,
             })
             
-            # Save initial state
-            self.state_manager.save_sync_state(current_state)
+            # Save initial state off the event loop so queued audit writes keep draining
+            await asyncio.to_thread(self.state_manager.save_sync_state, current_state)
             
             self._logger.debug(
                 "Initialized sync execution",
@@ -330,6 +467,85 @@ class SyncExecutor:
             progress.add_error(f"Initialization failed: {e}")
             raise
     
+    async def _execute_user_group_phases(
+        self,
+        plan: SyncPlan,
+        progress: ExecutionProgress,
+        dry_run: bool,
+        continue_on_error: bool,
+        max_concurrent: int,
+    ) -> None:
+        """Execute user and group items, pipelining groups behind users per org.
+        
+        Groups only depend on the users of their own organization, so an
+        org's group items start once its user items finish instead of
+        waiting for every org's users. All orgs share one semaphore, so the
+        overall concurrency limit is unchanged.
+        
+        Args:
+            plan: Sync plan with user and group items
+            progress: Progress tracker to update
+            dry_run: Whether to perform dry run
+            continue_on_error: Whether to continue on individual failures
+            max_concurrent: Maximum concurrent operations across all orgs
+        """
+        semaphore = asyncio.BoundedSemaphore(max_concurrent)
+        
+        user_items_by_org: Dict[str, List[Any]] = {}
+        for item in plan.user_items:
+            user_items_by_org.setdefault(item.braintrust_org, []).append(item)
+        group_items_by_org: Dict[str, List[Any]] = {}
+        for item in plan.group_items:
+            group_items_by_org.setdefault(item.braintrust_org, []).append(item)
+        
+        if plan.user_items:
+            progress.start_phase("users")
+            self._notify_progress(progress)
+        
+        async def execute_org(org_name: str) -> None:
+            await self._execute_resource_phase(
+                items=user_items_by_org.get(org_name, []),
+                syncer=self.user_syncer,
+                progress=progress,
+                dry_run=dry_run,
+                continue_on_error=continue_on_error,
+                max_concurrent=max_concurrent,
+                semaphore=semaphore,
+            )
+            
+            group_items = group_items_by_org.get(org_name)
+            if not group_items:
+                return
+            # The first org to reach its groups moves the overall phase on
+            if progress.current_phase != "groups":
+                progress.start_phase("groups")
+                self._notify_progress(progress)
+            await self._execute_resource_phase(
+                items=group_items,
+                syncer=self.group_syncer,
+                progress=progress,
+                dry_run=dry_run,
+                continue_on_error=continue_on_error,
+                max_concurrent=max_concurrent,
+                semaphore=semaphore,
+            )
+        
+        org_names = list(dict.fromkeys([*user_items_by_org, *group_items_by_org]))
+        try:
+            # A failing org cancels the others instead of letting them run on
+            async with asyncio.TaskGroup() as task_group:
+                for org_name in org_names:
+                    task_group.create_task(execute_org(org_name))
+        except ExceptionGroup as eg:
+            # Re-raise the first failure; log any others so they are not lost
+            for other_error in eg.exceptions[1:]:
+                self._logger.error(
+                    "Additional user/group phase failure",
+                    error=str(other_error),
+                    error_type=type(other_error).__name__,
+                )
+            raise eg.exceptions[0]
+    
     async def _execute_resource_phase(
         self,
         items: List[Any],  # SyncPlanItem but avoiding circular import
@@ -338,6 +554,7 @@ class SyncExecutor:
         dry_run: bool,
         continue_on_error: bool,
         max_concurrent: int,
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> None:
         """Execute a phase of resource synchronization.
         
@@ -348,6 +565,8 @@ class SyncExecutor:
             dry_run: Whether to perform dry run
             continue_on_error: Whether to continue on individual failures
             max_concurrent: Maximum concurrent operations
+            semaphore: Semaphore shared with concurrently running phases
+                (a new one bounded by ``max_concurrent`` if not provided)
         """
         if not items:
             return
@@ -361,26 +580,16 @@ class SyncExecutor:
         )
         
         # Create semaphore for concurrency control
-        semaphore = asyncio.Semaphore(max_concurrent)
-        
-        async def execute_item(item):
-            async with semaphore:
-                return await self._execute_single_item(
-                    item, syncer, progress, dry_run, continue_on_error
-                )
+        if semaphore is None:
+            semaphore = asyncio.BoundedSemaphore(max_concurrent)
         
-        # Execute items with controlled concurrency
-        results = await asyncio.gather(
-            *[execute_item(item) for item in items],
-            return_exceptions=True
-        )
-        
-        # Process results
-        for i, result in enumerate(results):
+        def record_result(index: int, result: Any) -> None:
+            # Account for an outcome as soon as it lands so the result
+            # itself is not held until the phase completes
             if isinstance(result, Exception):
                 progress.add_error(
                     f"Failed to execute {resource_type} item: {result}",
-                    {"item_index": i, "item_id": items[i].okta_resource_id}
+                    {"item_index": index, "item_id": items[index].okta_resource_id}
                 )
                 progress.failed_items += 1
             elif result:
@@ -392,9 +601,44 @@ class SyncExecutor:
                     progress.failed_items += 1
                     progress.update_org_progress(result.braintrust_org, "failed")
             
-            # Notify progress periodically
-            if i % 10 == 0:
-                self._notify_progress(progress)
+            self._progress_changed()
+        
+        # Indexes of items that got past the semaphore and reached the syncer
+        started: Set[int] = set()
+        
+        async def execute_item(index, item):
+            async with semaphore:
+                started.add(index)
+                try:
+                    result = await self._execute_single_item(
+                        item, syncer, progress, dry_run, continue_on_error
+                    )
+                except Exception as e:
+                    record_result(index, e)
+                    return e
+            record_result(index, result)
+            return None
+        
+        # Execute items with controlled concurrency
+        tasks = [asyncio.create_task(execute_item(i, item)) for i, item in enumerate(items)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                error = await next_done
+                if error is not None and not continue_on_error:
+                    # Stop the phase: cancel items still queued, but let items
+                    # already calling the syncer finish so their results are
+                    # counted and audited
+                    for index, task in enumerate(tasks):
+                        if index not in started:
+                            task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    raise error
+        finally:
+            # Cancel whatever is left (e.g. when this phase itself is
+            # cancelled) and wait for it to unwind before returning
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
         
         self._logger.info(
             f"Completed {resource_type} sync phase",
@@ -424,7 +668,9 @@ class SyncExecutor:
             Sync result if successful, None if failed and continue_on_error is False
         """
         try:
-            progress.current_item = f"{syncer.resource_type}:{item.okta_resource_id}"
+            # current_item is only read by progress callbacks
+            if self.progress_callback:
+                progress.current_item = f"{syncer.resource_type}:{item.okta_resource_id}"
             
             self._logger.debug(
                 "Executing sync item",
@@ -440,7 +686,7 @@ class SyncExecutor:
             
             if result:
                 # Log audit event for this sync operation
-                self.audit_logger.log_sync_result(result)
+                await self._audit_sync_result(result)
                 
                 if result.success:
                     self._logger.debug(
@@ -514,12 +760,16 @@ class SyncExecutor:
                 else:
                     current_state.mark_failed(f"{progress.failed_items} items failed")
                 
-                # Save final state
-                self.state_manager.save_sync_state(current_state)
-                
-                # Create checkpoint
                 checkpoint_name = f"execution_{progress.execution_id}_completed"
-                self.state_manager.create_checkpoint(checkpoint_name)
+                
+                def persist_final_state() -> None:
+                    # Save final state, then checkpoint it reusing the file just saved when possible
+                    saved = self.state_manager.save_sync_state(current_state)
+                    self.state_manager.create_checkpoint(checkpoint_name, from_saved=saved)
+                
+                # Persist off the event loop in one hop; no item tasks are
+                # running anymore, so nothing mutates the state meanwhile
+                await asyncio.to_thread(persist_final_state)
             
             # Generate execution summary
             execution_summary = {
@@ -530,13 +780,13 @@ class SyncExecutor:
                 "failed_items": progress.failed_items,
                 "skipped_items": progress.skipped_items,
                 "completion_percentage": progress.get_completion_percentage(),
-                "duration_seconds": (
-                    progress.completed_at - progress.started_at
-                ).total_seconds() if progress.completed_at else None,
+                "duration_seconds": progress.get_duration_seconds(),
                 "dry_run": dry_run,
                 "organizations": progress.org_progress,
                 "errors": progress.errors,
                 "warnings": progress.warnings,
+                "error_overflow": progress.error_overflow,
+                "warning_overflow": progress.warning_overflow,
             }
             
             self._logger.info(
@@ -778,23 +1028,31 @@ class SyncExecutor:
                 if org_name not in self.braintrust_clients:
                     errors.append(f"No Braintrust client configured for organization: {org_name}")
             
-            # Validate API connectivity
-            try:
-                okta_healthy = await self.okta_client.health_check()
-                if not okta_healthy:
-                    errors.append("Okta API is not accessible")
-            except Exception as e:
-                errors.append(f"Okta API health check failed: {e}")
+            # Validate API connectivity, running all health checks concurrently
+            checked_orgs = [
+                org_name for org_name in plan.target_organizations
+                if org_name in self.braintrust_clients
+            ]
+            okta_result, *org_results = await asyncio.gather(
+                self.okta_client.health_check(),
+                *[self.braintrust_clients[org_name].health_check() for org_name in checked_orgs],
+                return_exceptions=True,
+            )
+            for result in (okta_result, *org_results):
+                # Only ordinary errors become messages; cancellation still propagates
+                if isinstance(result, BaseException) and not isinstance(result, Exception):
+                    raise result
             
-            for org_name in plan.target_organizations:
-                if org_name in self.braintrust_clients:
-                    try:
-                        client = self.braintrust_clients[org_name]
-                        bt_healthy = await client.health_check()
-                        if not bt_healthy:
-                            errors.append(f"Braintrust API not accessible for org: {org_name}")
-                    except Exception as e:
-                        errors.append(f"Braintrust API health check failed for org {org_name}: {e}")
+            if isinstance(okta_result, Exception):
+                errors.append(f"Okta API health check failed: {okta_result}")
+            elif not okta_result:
+                errors.append("Okta API is not accessible")
+            
+            for org_name, bt_result in zip(checked_orgs, org_results):
+                if isinstance(bt_result, Exception):
+                    errors.append(f"Braintrust API health check failed for org {org_name}: {bt_result}")
+                elif not bt_result:
+                    errors.append(f"Braintrust API not accessible for org: {org_name}")
             
             # Validate state management
             current_state = self.state_manager.get_current_state()
@@ -9,6 +9,7 @@ from pydantic import BaseModel, Field
 from sync.clients.braintrust import BraintrustClient
 from sync.clients.okta import OktaClient
 from sync.config.models import SyncConfig
+from sync.config.role_project_models import ROLE_PERMISSIONS_ADAPTER
 from sync.core.enhanced_state import StateManager
 from sync.resources.base import SyncPlanItem, SyncAction
 from sync.resources.users import UserSyncer
@@ -557,7 +558,7 @@ class SyncPlanner:
                                 okta_resource={
                                     "name": role_def.name,
                                     "description": role_def.description,
-                                    "permissions": [p.model_dump() for p in role_def.member_permissions],
+                                    "permissions": ROLE_PERMISSIONS_ADAPTER.dump_python(role_def.member_permissions),
                                 },
                                 braintrust_org=org_name,
                                 action=SyncAction.UPDATE,
@@ -577,7 +578,7 @@ class SyncPlanner:
                                 okta_resource={
                                     "name": role_def.name,
                                     "description": role_def.description,
-                                    "permissions": [p.model_dump() for p in role_def.member_permissions],
+                                    "permissions": ROLE_PERMISSIONS_ADAPTER.dump_python(role_def.member_permissions),
                                 },
                                 braintrust_org=org_name,
                                 action=SyncAction.CREATE,
@@ -687,6 +688,12 @@ class SyncPlanner:
                     projects_checked=len(all_projects),
                 )
                 
+                # Resolve name-based project matches for all assignments at once
+                name_matches = role_manager._match_project_names(
+                    config.project_name_index,
+                    all_projects,
+                )
+                
                 # Process each group assignment to generate ACL items
                 for assignment in config.group_assignments:
                     if not assignment.enabled:
@@ -698,6 +705,7 @@ class SyncPlanner:
                         project_match=assignment.project_match,
                         braintrust_org=org_name,
                         cached_projects=all_projects,  # Pass cached projects
+                        name_matched=name_matches.get(id(assignment), set()),
                     )
                     
                     # Create ACL plan item for each project, but only if it doesn't already exist
@@ -688,19 +688,20 @@ class BaseResourceSyncer(ABC, Generic[OktaResourceType, BraintrustResourceType])
                 return managed_resources
             
             # Look through resource mappings for this org and resource type
-            # Structure: resource_mappings[org_name][resource_type] = [list of mappings]
+            # Structure: resource_mappings[org_name][resource_type][okta_id] = mapping
             if braintrust_org in current_state.resource_mappings:
                 org_mappings = current_state.resource_mappings[braintrust_org]
                 if self.resource_type in org_mappings:
                     type_mappings = org_mappings[self.resource_type]
-                    if isinstance(type_mappings, list):
-                        for mapping in type_mappings:
+                    if isinstance(type_mappings, dict):
+                        for mapping in type_mappings.values():
                             if isinstance(mapping, dict) and 'okta_id' in mapping and 'braintrust_id' in mapping:
                                 managed_resources[mapping['braintrust_id']] = mapping['okta_id']
             
             # Also check managed_resources collection if available
             if hasattr(current_state, 'managed_resources'):
-                for resource_id, resource in current_state.managed_resources.items():
+                for resource in current_state.managed_resources.values():
+                    resource_id = resource.resource_id
                     if (resource.resource_type == self.resource_type and 
                         resource.braintrust_org == braintrust_org and
                         resource.created_by_sync):
@@ -1077,12 +1078,13 @@ class BaseResourceSyncer(ABC, Generic[OktaResourceType, BraintrustResourceType])
         current_state = self.state_manager.get_current_state()
         if current_state:
             # Find and remove the mapping
-            mapping_key = f"{plan_item.okta_resource_id}:{plan_item.braintrust_org}:{self.resource_type}"
-            if mapping_key in current_state.resource_mappings:
-                del current_state.resource_mappings[mapping_key]
+            if current_state.remove_mapping(
+                plan_item.okta_resource_id, plan_item.braintrust_org, self.resource_type
+            ):
                 self._logger.debug(
                     "Removed resource mapping from state",
-                    mapping_key=mapping_key,
+                    okta_resource_id=plan_item.okta_resource_id,
+                    braintrust_org=plan_item.braintrust_org,
                 )
         
         operation.mark_completed()
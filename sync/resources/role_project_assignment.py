@@ -1,6 +1,6 @@
 """Role-project assignment manager for Groups → Roles → Projects workflow."""
 
-import re
+import asyncio
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 import structlog
@@ -11,7 +11,9 @@ from sync.config.role_project_models import (
     RoleDefinition,
     GroupRoleAssignment,
     ProjectMatchRule,
+    ProjectNameIndex,
     STANDARD_ROLES,
+    permissions_to_api_format,
 )
 from sync.core.enhanced_state import StateManager, ResourceType
 
@@ -115,6 +117,7 @@ class RoleProjectAssignmentManager:
                 braintrust_org=braintrust_org,
                 assignments=config.group_assignments,
                 dry_run=results["dry_run"],
+                project_index=config.project_name_index,
             )
             results.update(assignment_results)
             
@@ -277,15 +280,7 @@ class RoleProjectAssignmentManager:
         
         # Check permissions
         existing_perms = existing_role.get("member_permissions", [])
-        desired_perms = []
-        
-        for perm in role_def.member_permissions:
-            perm_dict = {"permission": perm.permission.value}
-            if perm.restrict_object_type:
-                perm_dict["restrict_object_type"] = perm.restrict_object_type.value
-            else:
-                perm_dict["restrict_object_type"] = None
-            desired_perms.append(perm_dict)
+        desired_perms = permissions_to_api_format(role_def.member_permissions)
         
         # Compare permission sets (order doesn't matter)
         existing_set = {
@@ -305,6 +300,7 @@ class RoleProjectAssignmentManager:
         braintrust_org: str,
         assignments: List[GroupRoleAssignment],
         dry_run: bool,
+        project_index: Optional[ProjectNameIndex] = None,
     ) -> Dict[str, Any]:
         """Process group role assignments to projects.
         
@@ -313,6 +309,7 @@ class RoleProjectAssignmentManager:
             braintrust_org: Braintrust organization name
             assignments: List of group role assignments
             dry_run: Whether to preview changes only
+            project_index: Optional prebuilt name index over the assignments
             
         Returns:
             Dictionary with assignment processing results
@@ -342,6 +339,12 @@ class RoleProjectAssignmentManager:
             results["assignment_errors"].append(f"Failed to fetch projects: {str(e)}")
             return results
         
+        # Resolve name-based matches for all assignments in one pass over the projects
+        name_matches = self._match_project_names(
+            project_index or ProjectNameIndex(assignments),
+            all_projects,
+        )
+        
         # ========== Optimization: Batch all ACL operations ==========
         # Collect all ACL entries from all assignments, then batch them into a single API call
         all_acl_entries = []
@@ -360,6 +363,7 @@ class RoleProjectAssignmentManager:
                     project_match=assignment.project_match,
                     braintrust_org=braintrust_org,
                     cached_projects=all_projects,  # Pass cached projects
+                    name_matched=name_matches.get(id(assignment), set()),
                 )
                 
                 # Track discovered projects in enhanced state
@@ -371,7 +375,7 @@ class RoleProjectAssignmentManager:
                         matched_patterns=[
                             pattern for pattern in [
                                 assignment.project_match.name_pattern,
-                                assignment.project_match.name_contains,
+                                *(assignment.project_match.name_contains or ()),
                                 assignment.project_match.name_starts_with,
                                 assignment.project_match.name_ends_with,
                             ] if pattern
@@ -603,6 +607,7 @@ class RoleProjectAssignmentManager:
         project_match: ProjectMatchRule,
         braintrust_org: str,
         cached_projects: Optional[List[Dict[str, Any]]] = None,
+        name_matched: Optional[Set[str]] = None,
     ) -> List[Dict[str, Any]]:
         """Find projects that match the given rules.
         
@@ -611,6 +616,8 @@ class RoleProjectAssignmentManager:
             project_match: Project matching rules
             braintrust_org: Braintrust organization name
             cached_projects: Optional pre-fetched project list to avoid API calls
+            name_matched: Optional project names already known to match the
+                rule's name criteria (see _match_project_names)
             
         Returns:
             List of matching project objects
@@ -632,9 +639,22 @@ class RoleProjectAssignmentManager:
         
         matching_projects = []
         
+        # Patterns are compiled once on the rule; report any that failed to compile
+        for invalid_pattern in project_match.invalid_patterns:
+            self._logger.warning(
+                "Invalid regex pattern",
+                pattern=invalid_pattern,
+            )
+        for risky_pattern in project_match.backtracking_patterns:
+            self._logger.warning(
+                "Regex pattern has nested quantifiers and may backtrack excessively",
+                pattern=risky_pattern,
+            )
+        
         # ========== Explicit project lists ==========
         if project_match.project_names:
-            for project_name in project_match.project_names:
+            # Sorted so the resulting project order is stable across runs
+            for project_name in sorted(project_match.project_names):
                 project = await client.get_project_by_name(project_name, braintrust_org)
                 if project:
                     matching_projects.append(project)
@@ -646,20 +666,20 @@ class RoleProjectAssignmentManager:
                     )
         
         if project_match.project_ids:
-            for project_id in project_match.project_ids:
-                # Find project by ID in all_projects list
-                project = next(
-                    (p for p in all_projects if p.get("id") == project_id),
-                    None
-                )
-                if project:
+            # One pass over the project list with O(1) membership checks
+            found_ids = set()
+            for project in all_projects:
+                project_id = project.get("id")
+                if project_id in project_match.project_ids:
                     matching_projects.append(project)
-                else:
-                    self._logger.warning(
-                        "Project not found by ID",
-                        project_id=project_id,
-                        braintrust_org=braintrust_org,
-                    )
+                    found_ids.add(project_id)
+            
+            for project_id in sorted(project_match.project_ids - found_ids):
+                self._logger.warning(
+                    "Project not found by ID",
+                    project_id=project_id,
+                    braintrust_org=braintrust_org,
+                )
         
         # ========== Pattern-based matching ==========
         if any([
@@ -669,15 +689,19 @@ class RoleProjectAssignmentManager:
             project_match.name_ends_with,
             project_match.all_projects,
         ]):
+            explicit_ids = {project.get("id") for project in matching_projects}
             for project in all_projects:
                 project_name = project.get("name", "")
                 
                 # Check if already added from explicit lists
-                if project in matching_projects:
+                if project.get("id") in explicit_ids:
                     continue
                 
-                # Apply pattern matching
-                matches = self._project_matches_patterns(project_name, project_match)
+                # Apply pattern matching, reusing precomputed name matches if given
+                if name_matched is not None:
+                    matches = project_name in name_matched
+                else:
+                    matches = self._project_matches_patterns(project_name, project_match)
                 if matches:
                     matching_projects.append(project)
                     # Project matched (reduced logging for cleaner output)
@@ -688,26 +712,17 @@ class RoleProjectAssignmentManager:
             filtered_projects = []
             for project in matching_projects:
                 project_name = project.get("name", "")
-                excluded = False
                 
-                for exclude_pattern in project_match.exclude_patterns:
-                    try:
-                        if re.match(exclude_pattern, project_name):
-                            excluded = True
-                            self._logger.debug(
-                                "Project excluded by pattern",
-                                project_name=project_name,
-                                exclude_pattern=exclude_pattern,
-                            )
-                            break
-                    except re.error:
-                        self._logger.warning(
-                            "Invalid exclude pattern",
-                            pattern=exclude_pattern,
-                        )
+                exclude_pattern = project_match.find_exclude_pattern(project_name)
+                if exclude_pattern is not None:
+                    self._logger.debug(
+                        "Project excluded by pattern",
+                        project_name=project_name,
+                        exclude_pattern=exclude_pattern,
+                    )
+                    continue
                 
-                if not excluded:
-                    filtered_projects.append(project)
+                filtered_projects.append(project)
             
             matching_projects = filtered_projects
         
@@ -728,6 +743,27 @@ class RoleProjectAssignmentManager:
         
         return unique_projects
     
+    def _match_project_names(
+        self,
+        project_index: ProjectNameIndex,
+        projects: List[Dict[str, Any]],
+    ) -> Dict[int, Set[str]]:
+        """Match every project against all indexed assignments in one pass.
+        
+        Args:
+            project_index: Name index over the group assignments
+            projects: Projects to match
+            
+        Returns:
+            Matching project names keyed by id() of each matching assignment
+        """
+        name_matches: Dict[int, Set[str]] = {}
+        for project in projects:
+            project_name = project.get("name", "")
+            for assignment in project_index.match(project_name):
+                name_matches.setdefault(id(assignment), set()).add(project_name)
+        return name_matches
+    
     def _project_matches_patterns(
         self,
         project_name: str,
@@ -746,34 +782,28 @@ class RoleProjectAssignmentManager:
         if project_match.all_projects:
             return True
         
-        # Regex pattern matching
-        if project_match.name_pattern:
-            try:
-                if re.match(project_match.name_pattern, project_name):
-                    return True
-            except re.error:
-                self._logger.warning(
-                    "Invalid regex pattern",
-                    pattern=project_match.name_pattern,
-                )
+        # The criteria are OR'ed together, so cheap literal checks run first and
+        # the regex is only evaluated when none of them match
+        lowered_name = project_name.lower()
         
         # Contains matching (OR logic)
         if project_match.name_contains:
             for contains_str in project_match.name_contains:
-                if contains_str.lower() in project_name.lower():
+                if contains_str.lower() in lowered_name:
                     return True
         
         # Starts with matching
         if project_match.name_starts_with:
-            if project_name.lower().startswith(project_match.name_starts_with.lower()):
+            if lowered_name.startswith(project_match.name_starts_with.lower()):
                 return True
         
         # Ends with matching
         if project_match.name_ends_with:
-            if project_name.lower().endswith(project_match.name_ends_with.lower()):
+            if lowered_name.endswith(project_match.name_ends_with.lower()):
                 return True
         
-        return False
+        # Regex pattern matching
+        return project_match.matches_name_pattern(project_name)
     
     async def _create_group_role_acls(
         self,
@@ -939,30 +969,41 @@ class RoleProjectAssignmentManager:
         }
         
         try:
+            # The three listings are independent, so issue them concurrently
+            roles, projects, acls = await asyncio.gather(
+                client.list_roles(),
+                client.list_projects(org_name=braintrust_org),
+                client.list_org_acls(org_name=braintrust_org, object_type="project"),
+                return_exceptions=True,
+            )
+            
             # Get current roles
-            roles = await client.list_roles()
+            if isinstance(roles, BaseException):
+                raise roles
             status["roles"] = {
                 "total_count": len(roles),
                 "roles": [{"name": r.get("name"), "id": r.get("id")} for r in roles],
             }
             
             # Get current projects
-            projects = await client.list_projects(org_name=braintrust_org)
+            if isinstance(projects, BaseException):
+                raise projects
             status["projects"] = {
                 "total_count": len(projects),
                 "projects": [{"name": p.get("name"), "id": p.get("id")} for p in projects],
             }
             
             # Get current ACLs (if we have read_acls permission)
-            try:
-                acls = await client.list_org_acls(org_name=braintrust_org, object_type="project")
+            if isinstance(acls, Exception):
                 status["assignments"] = {
-                    "total_acl_count": len(acls),
-                    "project_acls": len([a for a in acls if a.get("object_type") == "project"]),
+                    "error": "Cannot read ACLs - insufficient permissions"
                 }
-            except Exception:
+            elif isinstance(acls, BaseException):
+                raise acls
+            else:
                 status["assignments"] = {
-                    "error": "Cannot read ACLs - insufficient permissions"
+                    "total_acl_count": len(acls),
+                    "project_acls": len([a for a in acls if a.get("object_type") == "project"]),
                 }
             
             if config:
@@ -0,0 +1,140 @@
+"""Tests for batched audit logging and the executor's audit queue."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from sync.audit.logger import AuditLogger
+from sync.core.executor import SyncExecutor
+from sync.resources.base import SyncPlanItem, SyncAction, SyncResult
+
+
+def make_result(index: int) -> SyncResult:
+    """Create a successful sync result with a distinct operation ID."""
+    return SyncResult(
+        operation_id=f"op-{index}",
+        okta_resource_id=f"user{index}@example.com",
+        braintrust_org="org1",
+        action=SyncAction.CREATE,
+        success=True,
+    )
+
+
+def read_events(path):
+    """Read all JSON Lines events from an audit file."""
+    with open(path, "r") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.fixture
+def audit_logger(tmp_path):
+    """Create AuditLogger instance with temporary directory."""
+    return AuditLogger(audit_dir=tmp_path, structured_logging=True)
+
+
+@pytest.fixture
+def executor(audit_logger):
+    """Create a SyncExecutor with mock clients and a real audit logger."""
+    return SyncExecutor(
+        okta_client=MagicMock(),
+        braintrust_clients={"org1": MagicMock()},
+        state_manager=MagicMock(),
+        audit_logger=audit_logger,
+    )
+
+
+class TestAuditLoggerBatches:
+    """Test logging several events with one write."""
+
+    def test_log_sync_results_batch(self, audit_logger):
+        """Test logging a batch of sync results in order."""
+        summary = audit_logger.start_execution_audit("test-exec-123")
+        initial_count = summary.total_events
+
+        audit_logger.log_sync_results([make_result(i) for i in range(3)])
+
+        assert summary.total_events == initial_count + 3
+        result_events = [
+            event for event in read_events(audit_logger.current_file)
+            if event["event_type"] == "sync_result"
+        ]
+        assert [event["event_id"] for event in result_events] == [
+            "op-0_result", "op-1_result", "op-2_result"
+        ]
+
+    def test_log_sync_plan_items_accepts_iterables(self, audit_logger):
+        """Test plan items can be logged from a generator."""
+        audit_logger.start_execution_audit("test-exec-123")
+
+        items = (
+            SyncPlanItem(
+                okta_resource_id=f"user{i}@example.com",
+                okta_resource_type="user",
+                braintrust_org="org1",
+                action=SyncAction.CREATE,
+                reason="New user",
+            )
+            for i in range(2)
+        )
+        audit_logger.log_sync_plan_items(items, "test-exec-123")
+
+        plan_events = [
+            event for event in read_events(audit_logger.current_file)
+            if event["event_type"] == "sync_plan_planning"
+        ]
+        assert [event["resource_id"] for event in plan_events] == [
+            "user0@example.com", "user1@example.com"
+        ]
+
+    def test_log_events_empty_batch_is_noop(self, audit_logger):
+        """Test an empty batch writes nothing."""
+        summary = audit_logger.start_execution_audit("test-exec-123")
+        initial_count = summary.total_events
+
+        audit_logger.log_events([])
+
+        assert summary.total_events == initial_count
+
+
+class TestExecutorAuditQueue:
+    """Test the executor's background audit drain."""
+
+    @pytest.mark.asyncio
+    async def test_drain_writes_all_results_in_order_before_completion(
+        self, executor, audit_logger
+    ):
+        """Test results queued before the sentinel are written before the audit completes."""
+        audit_logger.start_execution_audit("test-exec-123")
+        audit_file = audit_logger.current_file
+
+        executor._start_audit_drain()
+        # More than one batch, so the drain has to loop
+        for i in range(600):
+            await executor._audit_sync_result(make_result(i))
+        await executor._stop_audit_drain()
+        audit_logger.complete_execution_audit(success=True)
+
+        events = read_events(audit_file)
+        assert [event["event_type"] for event in events] == (
+            ["sync_start"] + ["sync_result"] * 600 + ["sync_complete"]
+        )
+        assert [event["event_id"] for event in events[1:-1]] == [
+            f"op-{i}_result" for i in range(600)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stop_drain_is_idempotent(self, executor, audit_logger):
+        """Test stopping twice is safe and later results are logged directly."""
+        summary = audit_logger.start_execution_audit("test-exec-123")
+
+        executor._start_audit_drain()
+        await executor._audit_sync_result(make_result(0))
+        await executor._stop_audit_drain()
+        await executor._stop_audit_drain()
+
+        # With no drain running, results go straight to the audit logger
+        await executor._audit_sync_result(make_result(1))
+
+        assert executor._audit_drain_task is None
+        assert summary.total_events == 3
@@ -0,0 +1,721 @@
+"""Tests for enhanced state management."""
+
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from sync.core import enhanced_state
+from sync.core.enhanced_state import (
+    DriftWarning,
+    EnhancedSyncState,
+    ManagedResource,
+    ManagementStatus,
+    ResourceType,
+    StateManager,
+    hash_config,
+    hash_role_permissions,
+)
+
+
+@pytest.fixture
+def temp_state_dir():
+    """Create a temporary directory for state files."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+@pytest.fixture
+def state_manager(temp_state_dir):
+    """Create a state manager with temporary directory."""
+    return StateManager(state_dir=temp_state_dir)
+
+
+@pytest.fixture
+def sync_state():
+    """Create an empty enhanced sync state."""
+    return EnhancedSyncState(sync_id="sync_test")
+
+
+class TestConfigHash:
+    """Test config hashing used for drift detection."""
+
+    def test_hash_is_order_independent(self):
+        """Test dict key order does not change the hash."""
+        first = {"name": "Viewer", "member_permissions": [{"permission": "read"}]}
+        second = {"member_permissions": [{"permission": "read"}], "name": "Viewer"}
+
+        assert hash_config(first) == hash_config(second)
+        assert len(hash_config(first)) == 16
+
+    def test_hash_distinguishes_configs(self):
+        """Test different configs produce different hashes."""
+        assert hash_config({"a": 1}) != hash_config({"a": 2})
+        assert hash_config(["a", "b"]) != hash_config(["b", "a"])
+        # A mapping must not collide with a list of its pairs
+        assert hash_config({"a": 1}) != hash_config([["a", 1]])
+
+    def test_calculate_config_hash_uses_shared_helper(self):
+        """Test ManagedResource hashes configs with hash_config."""
+        config = {"description": "Read only", "member_permissions": [{"permission": "read"}]}
+        resource = ManagedResource(
+            resource_id="res-1",
+            resource_type=ResourceType.ROLE,
+            braintrust_org="org1",
+            management_status=ManagementStatus.SYNC_MANAGED,
+        )
+
+        assert resource.calculate_config_hash(config) == hash_config(config)
+
+    def test_role_permission_hash(self):
+        """Test role permission hashing ignores order and null restrictions."""
+        stored = [
+            {"permission": "read", "restrict_object_type": None},
+            {"permission": "update", "restrict_object_type": "project"},
+        ]
+        from_api = [
+            {"permission": "update", "restrict_object_type": "project"},
+            {"permission": "read"},
+        ]
+
+        assert hash_role_permissions(stored) == hash_role_permissions(from_api)
+        assert hash_role_permissions(stored) != hash_role_permissions(stored[:1])
+        assert hash_role_permissions(None) == hash_role_permissions([])
+
+    def test_hash_is_stable_across_runs(self):
+        """Test the digest is deterministic (not seeded per process)."""
+        assert hash_config({"a": [1, "x"]}) == "0bbea51b7889a644"
+
+
+def _add_acl(state, acl_id, org, permissions=("read",)):
+    """Track an ACL with fixed group/role/project fields."""
+    return state.add_acl_state(
+        acl_id=acl_id,
+        group_id="group-1",
+        group_name="Engineers",
+        role_id="role-1",
+        role_name="Viewer",
+        project_id="project-1",
+        project_name="Project One",
+        braintrust_org=org,
+        permissions=list(permissions),
+    )
+
+
+class TestDetectDrift:
+    """Test drift detection against current Braintrust resources."""
+
+    def test_only_scans_requested_org(self, sync_state):
+        """Test resources tracked for other orgs are not reported."""
+        sync_state.add_role_state("role-1", "Viewer", "org1", {}, created_by_sync=True)
+        sync_state.add_role_state("role-2", "Viewer", "org2", {}, created_by_sync=True)
+        _add_acl(sync_state, "acl-1", "org1")
+        _add_acl(sync_state, "acl-2", "org2")
+
+        warnings = sync_state.detect_drift([], [], "org1")
+
+        assert {(w.resource_type, w.resource_id, w.drift_type) for w in warnings} == {
+            (ResourceType.ROLE, "role-1", "deleted"),
+            (ResourceType.ACL, "acl-1", "deleted"),
+        }
+
+    def test_role_modification_detected(self, sync_state):
+        """Test role drift compares stored and current member permissions."""
+        definition = {"name": "Viewer", "member_permissions": [{"permission": "read"}]}
+        sync_state.add_role_state("role-1", "Viewer", "org1", definition, created_by_sync=True)
+
+        unchanged = sync_state.detect_drift(
+            [{"id": "role-1", "member_permissions": [{"permission": "read", "restrict_object_type": None}]}],
+            [],
+            "org1",
+        )
+        changed = sync_state.detect_drift(
+            [{"id": "role-1", "member_permissions": [{"permission": "delete"}]}],
+            [],
+            "org1",
+        )
+
+        assert unchanged == []
+        assert [w.drift_type for w in changed] == ["modified"]
+
+    def test_permission_change_detected(self, sync_state):
+        """Test changed ACL permissions produce a warning."""
+        _add_acl(sync_state, "acl-1", "org1", permissions=("read", "update"))
+
+        unchanged = sync_state.detect_drift([], [{"id": "acl-1", "permissions": ["update", "read"]}], "org1")
+        changed = sync_state.detect_drift([], [{"id": "acl-1", "permissions": ["read"]}], "org1")
+
+        assert unchanged == []
+        assert [w.drift_type for w in changed] == ["permission_changed"]
+
+    def test_repeated_scans_do_not_duplicate_warnings(self, sync_state):
+        """Test the same unresolved drift is stored once per issue."""
+        sync_state.add_role_state("role-1", "Viewer", "org1", {}, created_by_sync=True)
+
+        sync_state.detect_drift([], [], "org1")
+        sync_state.detect_drift([], [], "org1")
+
+        assert [w.resource_id for w in sync_state.drift_warning_list] == ["role-1"]
+
+    def test_drift_warnings_serialize_as_list(self, sync_state):
+        """Test drift warnings keep their list shape on disk."""
+        sync_state.add_role_state("role-1", "Viewer", "org1", {}, created_by_sync=True)
+        sync_state.detect_drift([], [], "org1")
+
+        data = sync_state.model_dump(mode="json")
+        reloaded = EnhancedSyncState.model_validate(data)
+
+        assert [w["resource_id"] for w in data["drift_warnings"]] == ["role-1"]
+        assert list(reloaded.drift_warnings) == [("role", "role-1", "deleted")]
+
+    def test_add_drift_warning_normalizes_resource_type(self, sync_state):
+        """Test warnings built without validation still carry the enum type."""
+        sync_state.add_drift_warning("acl", "acl-1", "deleted", "ACL was deleted")
+
+        [warning] = sync_state.drift_warning_list
+        assert warning.resource_type is ResourceType.ACL
+        assert sync_state.model_dump(mode="json")["drift_warnings"][0]["resource_type"] == "acl"
+
+    def test_add_drift_warnings_bulk_records_each_issue(self, sync_state):
+        """Test bulk-added warnings are keyed per issue like single adds."""
+        acl = sync_state.add_managed_resource(
+            "acl-1", ResourceType.ACL, "org1", created_by_sync=True
+        )
+        other_org_acl = sync_state.add_managed_resource(
+            "acl-1", ResourceType.ACL, "org2", created_by_sync=True
+        )
+        warnings = [
+            DriftWarning(resource_type=ResourceType.ACL, resource_id="acl-1",
+                         drift_type="deleted", details="gone"),
+            DriftWarning(resource_type=ResourceType.ROLE, resource_id="role-1",
+                         drift_type="modified", details="changed"),
+            DriftWarning(resource_type=ResourceType.ACL, resource_id="acl-1",
+                         drift_type="deleted", details="still gone"),
+        ]
+
+        sync_state.add_drift_warnings_bulk(warnings)
+
+        assert list(sync_state.drift_warnings) == [
+            (ResourceType.ACL, "acl-1", "deleted"),
+            (ResourceType.ROLE, "role-1", "modified"),
+        ]
+        assert sync_state.drift_warnings[(ResourceType.ACL, "acl-1", "deleted")].details == "still gone"
+        # The tracked resource is marked once with the details of both warnings
+        assert acl.external_modifications_detected is True
+        assert acl.drift_details == ["gone", "still gone"]
+        assert acl.management_status == ManagementStatus.SYNC_MANAGED
+        # Without an org, the id is matched in every org
+        assert other_org_acl.drift_details == ["gone", "still gone"]
+
+    def test_add_drift_warning_marks_resource_in_given_org(self, sync_state):
+        """Test a warning with an org only marks that org's resource."""
+        role = sync_state.add_managed_resource("role-1", ResourceType.ROLE, "org1")
+        other_org_role = sync_state.add_managed_resource("role-1", ResourceType.ROLE, "org2")
+
+        sync_state.add_drift_warning(
+            "role", "role-1", "modified", "permissions changed", braintrust_org="org1"
+        )
+
+        assert role.external_modifications_detected is True
+        assert role.drift_details == ["permissions changed"]
+        assert other_org_role.external_modifications_detected is False
+
+    def test_org_index_rebuilt_on_load(self, state_manager, sync_state):
+        """Test drift detection works for a state loaded from disk."""
+        sync_state.add_role_state("role-1", "Viewer", "org1", {}, created_by_sync=True)
+        state_manager.save_sync_state(sync_state)
+
+        loaded = state_manager.load_sync_state("sync_test")
+        warnings = loaded.detect_drift([], [], "org1")
+
+        assert [w.resource_id for w in warnings] == ["role-1"]
+
+
+class TestStateKeys:
+    """Test tuple keys on the managed resource dicts."""
+
+    def test_tuple_keys_serialize_as_strings(self, sync_state):
+        """Test tuple keys are written in the colon-joined file format."""
+        sync_state.add_managed_resource("u1", ResourceType.USER, "org1")
+        sync_state.add_role_state("role-1", "Viewer", "org1", {})
+        _add_acl(sync_state, "acl-1", "org1")
+        sync_state.track_project("p1", "Project", "org1")
+
+        data = sync_state.model_dump(mode="json")
+
+        assert list(data["managed_resources"]) == ["user:u1:org1"]
+        assert list(data["managed_roles"]) == ["role-1:org1"]
+        assert list(data["managed_acls"]) == ["acl-1:org1"]
+        assert list(data["discovered_projects"]) == ["p1:org1"]
+
+    def test_round_trip_restores_tuple_keys(self, state_manager, sync_state):
+        """Test saved state loads back with the same tuple keys."""
+        sync_state.add_managed_resource("u1", ResourceType.USER, "org1")
+        sync_state.add_role_state("role-1", "Viewer", "org1", {})
+        state_manager.save_sync_state(sync_state)
+
+        loaded = state_manager.load_sync_state("sync_test")
+
+        assert list(loaded.managed_resources) == [("user", "u1", "org1")]
+        assert list(loaded.managed_roles) == [("role-1", "org1")]
+
+    def test_legacy_enum_repr_keys_load(self):
+        """Test keys written as "ResourceType.USER:id:org" are re-keyed."""
+        state = EnhancedSyncState.model_validate({
+            "sync_id": "sync_legacy",
+            "managed_resources": {
+                "ResourceType.USER:u1:org1": {
+                    "resource_id": "u1",
+                    "resource_type": "user",
+                    "braintrust_org": "org1",
+                    "management_status": "sync_managed",
+                },
+            },
+        })
+
+        assert list(state.managed_resources) == [("user", "u1", "org1")]
+
+
+class TestSyncTimestamps:
+    """Test epoch-backed sync timestamps."""
+
+    def test_legacy_datetime_fields_load(self):
+        """Test state written with last_synced_at/last_seen_at still loads."""
+        state = EnhancedSyncState.model_validate({
+            "sync_id": "sync_legacy",
+            "managed_resources": {
+                "user:u1:org1": {
+                    "resource_id": "u1",
+                    "resource_type": "user",
+                    "braintrust_org": "org1",
+                    "management_status": "sync_managed",
+                    "last_synced_at": "2024-01-01T00:00:00Z",
+                },
+            },
+            "discovered_projects": {
+                "p1:org1": {
+                    "project_id": "p1",
+                    "project_name": "Project",
+                    "braintrust_org": "org1",
+                    "last_seen_at": "2024-01-01T00:00:00+00:00",
+                },
+            },
+        })
+
+        resource = state.managed_resources[("user", "u1", "org1")]
+        assert resource.last_synced_epoch == datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()
+        assert resource.last_synced_at == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert state.discovered_projects[("p1", "org1")].last_seen_epoch == resource.last_synced_epoch
+
+    def test_round_trip_keeps_datetime_in_output(self, sync_state):
+        """Test serialized resources still expose last_synced_at."""
+        sync_state.add_managed_resource("u1", ResourceType.USER, "org1")
+
+        data = sync_state.model_dump(mode="json")
+        [resource_data] = data["managed_resources"].values()
+        reloaded = EnhancedSyncState.model_validate(data)
+
+        assert "last_synced_at" in resource_data
+        assert list(data["managed_resources"]) == ["user:u1:org1"]
+        assert [r.last_synced_epoch for r in reloaded.managed_resources.values()] == [
+            r.last_synced_epoch for r in sync_state.managed_resources.values()
+        ]
+
+    def test_cleanup_stale_resources(self, sync_state):
+        """Test stale resources and projects are removed by epoch cutoff."""
+        fresh = sync_state.add_managed_resource("u1", ResourceType.USER, "org1")
+        stale = sync_state.add_managed_resource("u2", ResourceType.USER, "org1")
+        stale.last_synced_epoch = time.time() - 40 * 86400
+        project = sync_state.track_project("p1", "Project", "org1")
+        project.last_seen_at = datetime.now(timezone.utc) - timedelta(days=40)
+
+        removed = sync_state.cleanup_stale_resources(max_age_days=30)
+
+        assert removed == 2
+        assert list(sync_state.managed_resources.values()) == [fresh]
+        assert sync_state.discovered_projects == {}
+
+
+class TestACLState:
+    """Test ACL state helpers."""
+
+    def test_acl_ids_tracked_on_role(self, sync_state):
+        """Test ACLs are recorded once on their role and saved sorted."""
+        sync_state.add_role_state("role-1", "Viewer", "org1", {})
+        _add_acl(sync_state, "acl-b", "org1")
+        _add_acl(sync_state, "acl-a", "org1")
+        _add_acl(sync_state, "acl-b", "org1")
+
+        role = sync_state.managed_roles[("role-1", "org1")]
+        assert role.acl_ids == {"acl-a", "acl-b"}
+        assert role.model_dump(mode="json")["acl_ids"] == ["acl-a", "acl-b"]
+
+    def test_permission_set_follows_reassignment(self, sync_state):
+        """Test the cached permission set is rebuilt when permissions change."""
+        acl = _add_acl(sync_state, "acl-1", "org1", permissions=("read",))
+        assert acl.permission_set == frozenset({"read"})
+        assert acl.permission_set is acl.permission_set
+
+        _add_acl(sync_state, "acl-1", "org1", permissions=("read", "update"))
+
+        assert acl.permission_set == frozenset({"read", "update"})
+
+
+class TestManagedResourceSummary:
+    """Test the memoized managed resource summary."""
+
+    def test_summary_tracks_changes(self, sync_state):
+        """Test the cached summary is refreshed after tracking calls."""
+        assert sync_state.get_managed_resource_summary()["managed_roles"] == 0
+
+        sync_state.add_role_state("role-1", "Viewer", "org1", {}, created_by_sync=True)
+        assert sync_state.get_managed_resource_summary()["managed_roles"] == 1
+
+        sync_state.detect_drift([], [], "org1")
+        summary = sync_state.get_managed_resource_summary()
+        assert summary["drift_warnings"] == 1
+        assert summary["last_drift_check"] is not None
+
+    def test_summary_is_cached(self, sync_state, monkeypatch):
+        """Test repeated calls reuse the cached summary."""
+        sync_state.get_managed_resource_summary()
+        monkeypatch.setattr(
+            EnhancedSyncState,
+            "_build_managed_resource_summary",
+            lambda self: pytest.fail("summary should be cached"),
+        )
+
+        summary = sync_state.get_managed_resource_summary()
+        summary["managed_roles"] = 99
+
+        assert sync_state.get_managed_resource_summary()["managed_roles"] == 0
+
+
+class TestBraintrustIdLookup:
+    """Test Okta to Braintrust ID lookups."""
+
+    def test_lookup_from_managed_resources(self, sync_state):
+        """Test managed resources are matched by enum type and org."""
+        sync_state.add_managed_resource("bt-1", ResourceType.USER, "org1", resource_name="okta-1")
+
+        assert sync_state.get_braintrust_id("okta-1", "org1", "user") == "bt-1"
+        assert sync_state.get_braintrust_id("okta-1", "org2", "user") is None
+        assert sync_state.get_braintrust_id("okta-1", "org1", "group") is None
+        assert sync_state.get_braintrust_id("okta-1", "org1", "unknown") is None
+
+    def test_name_index_drops_cleaned_up_resources(self, sync_state):
+        """Test a stale resource removed by cleanup is no longer found by name."""
+        stale = sync_state.add_managed_resource("bt-1", ResourceType.USER, "org1", resource_name="okta-1")
+        stale.last_synced_epoch = 0.0
+
+        sync_state.cleanup_stale_resources()
+
+        assert sync_state.get_braintrust_id("okta-1", "org1", "user") is None
+
+    def test_type_shard_follows_cleanup_and_load(self, state_manager, sync_state):
+        """Test the per-type shard is rebuilt after cleanup and on load."""
+        sync_state.add_managed_resource("bt-1", ResourceType.USER, "org1", resource_name="okta-1")
+        stale = sync_state.add_managed_resource("bt-2", ResourceType.GROUP, "org1", resource_name="okta-2")
+        stale.last_synced_epoch = 0.0
+
+        sync_state.cleanup_stale_resources()
+        state_manager.save_sync_state(sync_state)
+        loaded = state_manager.load_sync_state("sync_test")
+
+        assert list(sync_state.iter_managed_resources(ResourceType.GROUP)) == []
+        assert [r.resource_id for r in loaded.iter_managed_resources("user")] == ["bt-1"]
+        assert state_manager.get_braintrust_id("okta-1", "user") == "bt-1"
+
+    def test_state_manager_lookup_keeps_first_match_across_orgs(self, state_manager):
+        """Test the manager lookup returns the earliest resource with the name."""
+        state = state_manager.create_sync_state("sync_test")
+        state.add_managed_resource("bt-1", ResourceType.USER, "org1", resource_name="okta-1")
+        state.add_managed_resource("bt-2", ResourceType.USER, "org2", resource_name="okta-1")
+
+        assert state_manager.get_braintrust_id("okta-1", "user") == "bt-1"
+        assert state.get_managed_resource_by_name("user", "okta-2") is None
+
+    def test_state_manager_lookup_accepts_enum(self, state_manager):
+        """Test the manager lookup takes enum members as well as strings."""
+        state = state_manager.create_sync_state("sync_test")
+        state.add_managed_resource("bt-1", ResourceType.GROUP, "org1", resource_name="okta-1")
+        state.add_mapping("okta-2", "bt-2", "org1", ResourceType.USER)
+
+        assert state_manager.get_braintrust_id("okta-1", ResourceType.GROUP) == "bt-1"
+        assert state_manager.get_braintrust_id("okta-2", ResourceType.USER) == "bt-2"
+        assert state_manager.get_braintrust_id("okta-1", ResourceType.USER) is None
+
+
+class TestStateManagerPersistence:
+    """Test saving and loading state files."""
+
+    def test_save_writes_readable_json(self, state_manager, sync_state, temp_state_dir):
+        """Test the saved file is indented JSON that loads back."""
+        sync_state.add_role_state("role-1", "Viewer", "org1", {})
+
+        assert state_manager.save_sync_state(sync_state)
+        raw = (temp_state_dir / "sync_test.json").read_text(encoding="utf-8")
+        loaded = state_manager.load_sync_state("sync_test")
+
+        assert json.loads(raw)["sync_id"] == "sync_test"
+        assert raw.startswith('{\n  "sync_id"')
+        assert list(loaded.managed_roles) == [("role-1", "org1")]
+
+    def test_json_round_trip_validates_directly(self, sync_state):
+        """Test model_dump_json output validates without the fallback path."""
+        sync_state.add_managed_resource("u1", ResourceType.USER, "org1")
+        sync_state.add_role_state("role-1", "Viewer", "org1", {}, created_by_sync=True)
+        _add_acl(sync_state, "acl-1", "org1")
+        sync_state.track_project("p1", "Project", "org1")
+        sync_state.detect_drift([], [], "org1")
+
+        loaded = EnhancedSyncState.model_validate_json(sync_state.model_dump_json())
+
+        assert loaded.model_dump() == sync_state.model_dump()
+
+    def test_save_omits_unset_optional_fields(self, state_manager, sync_state, temp_state_dir):
+        """Test None-valued optional fields are left out and restored on load."""
+        sync_state.add_managed_resource("u1", ResourceType.USER, "org1")
+        sync_state.add_role_state("role-1", "Viewer", "org1", {}, created_by_sync=True)
+        _add_acl(sync_state, "acl-1", "org1")
+        sync_state.track_project("p1", "Project", "org1")
+        sync_state.detect_drift([], [], "org1")
+
+        state_manager.save_sync_state(sync_state)
+        raw = json.loads((temp_state_dir / "sync_test.json").read_text(encoding="utf-8"))
+        loaded = state_manager.load_sync_state("sync_test")
+
+        assert "parent_resource_id" not in raw["managed_resources"]["user:u1:org1"]
+        assert "completed_at" not in raw
+        assert raw["started_at"]
+        assert loaded.model_dump() == sync_state.model_dump()
+
+    def test_load_summary_skips_resources(self, state_manager, sync_state):
+        """Test the summary carries metadata and leaves the current state alone."""
+        sync_state.add_role_state("role-1", "Viewer", "org1", {})
+        sync_state.stats["users_synced"] = 3
+        state_manager.save_sync_state(sync_state)
+
+        summary = state_manager.load_sync_state_summary("sync_test")
+
+        assert summary.sync_id == "sync_test"
+        assert summary.status == "in_progress"
+        assert summary.started_at == sync_state.started_at
+        assert summary.stats == {"users_synced": 3}
+        assert state_manager.get_current_state() is None
+        assert state_manager.load_sync_state_summary("missing") is None
+
+    def test_cleanup_old_states_keeps_newest(self, state_manager, temp_state_dir):
+        """Test the oldest state files and their backups are removed."""
+        for age, name in enumerate(["sync_3.json", "sync_2.json.gz", "sync_1.json"]):
+            path = temp_state_dir / name
+            path.write_text("{}", encoding="utf-8")
+            os.utime(path, (1000 - age, 1000 - age))
+        (temp_state_dir / "sync_1.json.backup").write_text("{}", encoding="utf-8")
+        (temp_state_dir / "other.json").write_text("{}", encoding="utf-8")
+
+        assert state_manager.cleanup_old_states(keep_count=1) == 2
+        assert sorted(p.name for p in temp_state_dir.iterdir()) == ["other.json", "sync_3.json"]
+
+    def test_checkpoint_loads_as_state(self, state_manager, temp_state_dir):
+        """Test a checkpoint file holds the current state in the state format."""
+        state = state_manager.create_sync_state("sync_test")
+        state.add_role_state("role-1", "Viewer", "org1", {}, created_by_sync=True)
+        state.detect_drift([], [], "org1")
+
+        assert state_manager.create_checkpoint("mid")
+        raw = (temp_state_dir / "sync_test_mid.json").read_bytes()
+
+        assert EnhancedSyncState.model_validate_json(raw).model_dump() == state.model_dump()
+        assert b"\n" not in raw
+        assert not (temp_state_dir / "sync_test_mid.json.tmp").exists()
+
+    def test_checkpoint_from_saved_links_state_file(self, state_manager, temp_state_dir):
+        """Test a checkpoint taken right after saving reuses the saved file."""
+        state = state_manager.create_sync_state("sync_test")
+        state_manager.save_sync_state(state)
+
+        assert state_manager.create_checkpoint("done", from_saved=True)
+        checkpoint = temp_state_dir / "sync_test_done.json"
+        assert checkpoint.samefile(temp_state_dir / "sync_test.json")
+
+        state.add_role_state("role-1", "Viewer", "org1", {})
+        state_manager.save_sync_state(state)
+
+        assert EnhancedSyncState.model_validate_json(checkpoint.read_bytes()).managed_roles == {}
+
+    def test_checkpoint_from_saved_serializes_unsaved_state(self, state_manager, temp_state_dir):
+        """Test from_saved falls back to serializing when nothing was saved."""
+        state_manager.create_sync_state("sync_test")
+
+        assert state_manager.create_checkpoint("done", from_saved=True)
+        assert EnhancedSyncState.model_validate_json(
+            (temp_state_dir / "sync_test_done.json").read_bytes()
+        ).sync_id == "sync_test"
+
+    def test_pretty_checkpoint_is_indented(self, state_manager, temp_state_dir):
+        """Test pretty checkpoints keep the indented layout for debugging."""
+        state_manager.create_sync_state("sync_test")
+
+        assert state_manager.create_checkpoint("debug", pretty=True)
+        assert (temp_state_dir / "sync_test_debug.json").read_text(encoding="utf-8").startswith('{\n  "sync_id"')
+
+    def test_compressed_save_round_trips(self, temp_state_dir, sync_state):
+        """Test compressed state files are written as .json.gz and load back."""
+        manager = StateManager(state_dir=temp_state_dir, compress=True)
+        sync_state.add_role_state("role-1", "Viewer", "org1", {})
+
+        assert manager.save_sync_state(sync_state)
+        assert (temp_state_dir / "sync_test.json.gz").exists()
+        assert not (temp_state_dir / "sync_test.json").exists()
+        assert manager.list_sync_states() == ["sync_test"]
+        assert list(manager.load_sync_state("sync_test").managed_roles) == [("role-1", "org1")]
+
+    def test_compressed_manager_loads_plain_state(self, state_manager, temp_state_dir, sync_state):
+        """Test enabling compression still loads states saved uncompressed."""
+        state_manager.save_sync_state(sync_state)
+        manager = StateManager(state_dir=temp_state_dir, compress=True)
+
+        assert manager.load_sync_state("sync_test").sync_id == "sync_test"
+
+    def test_save_keeps_previous_file_as_backup(self, state_manager, sync_state, temp_state_dir):
+        """Test saving again keeps the previous contents as a backup."""
+        state_manager.save_sync_state(sync_state)
+        sync_state.add_role_state("role-1", "Viewer", "org1", {})
+        state_manager.save_sync_state(sync_state)
+
+        backup = json.loads((temp_state_dir / "sync_test.json.backup").read_text(encoding="utf-8"))
+        current = json.loads((temp_state_dir / "sync_test.json").read_text(encoding="utf-8"))
+
+        assert backup["managed_roles"] == {}
+        assert list(current["managed_roles"]) == ["role-1:org1"]
+        assert not (temp_state_dir / "sync_test.json.tmp").exists()
+
+    def test_failed_save_leaves_previous_file(self, state_manager, sync_state, temp_state_dir, monkeypatch):
+        """Test a failure while swapping in the new file keeps the old one intact."""
+        state_manager.save_sync_state(sync_state)
+        original = (temp_state_dir / "sync_test.json").read_bytes()
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(enhanced_state.os, "replace", fail_replace)
+        sync_state.add_role_state("role-1", "Viewer", "org1", {})
+
+        assert state_manager.save_sync_state(sync_state, keep_backup=False) is False
+        assert (temp_state_dir / "sync_test.json").read_bytes() == original
+        assert not (temp_state_dir / "sync_test.json.tmp").exists()
+
+    def test_load_invalid_json_returns_none(self, state_manager, temp_state_dir):
+        """Test a corrupt state file is reported rather than raised."""
+        (temp_state_dir / "sync_bad.json").write_text("{not json", encoding="utf-8")
+
+        assert state_manager.load_sync_state("sync_bad") is None
+
+
+class TestResourceMappings:
+    """Test Okta to Braintrust resource mappings."""
+
+    def test_add_mapping_replaces_by_okta_id(self, sync_state):
+        """Test re-adding a mapping for the same Okta ID replaces it."""
+        sync_state.add_mapping("okta-1", "bt-1", "org1", "user")
+        sync_state.add_mapping("okta-1", "bt-2", "org1", "user")
+
+        assert list(sync_state.resource_mappings["org1"]["user"]) == ["okta-1"]
+        assert sync_state.get_braintrust_id("okta-1", "org1", "user") == "bt-2"
+        assert sync_state.get_mapping("okta-1", "org1", "user").braintrust_id == "bt-2"
+        assert sync_state.get_mapping("okta-1", "org2", "user") is None
+
+    def test_legacy_list_mappings_migrate_on_load(self):
+        """Test per-type mapping lists from older state files become dicts."""
+        state = EnhancedSyncState.model_validate({
+            "sync_id": "sync_legacy",
+            "resource_mappings": {
+                "org1": {"user": [{"okta_id": "okta-1", "braintrust_id": "bt-1"}]},
+            },
+        })
+
+        assert state.resource_mappings["org1"]["user"] == {
+            "okta-1": {"okta_id": "okta-1", "braintrust_id": "bt-1"},
+        }
+        assert state.get_braintrust_id("okta-1", "org1", "user") == "bt-1"
+
+    def test_remove_mapping(self, sync_state):
+        """Test mappings can be removed by Okta ID."""
+        sync_state.add_mapping("okta-1", "bt-1", "org1", "user")
+
+        assert sync_state.remove_mapping("okta-1", "org1", "user") is True
+        assert sync_state.remove_mapping("okta-1", "org1", "user") is False
+        assert sync_state.get_braintrust_id("okta-1", "org1", "user") is None
+
+    def test_state_manager_mapping_helpers(self, state_manager):
+        """Test StateManager delegates mapping writes to the current state."""
+        state_manager.create_sync_state("sync_test")
+        state_manager.add_mapping("org1", "group", "okta-g", "bt-g")
+
+        assert state_manager.get_braintrust_id("okta-g", "group") == "bt-g"
+        assert state_manager.get_braintrust_id("okta-g", "user") is None
+
+
+class TestFailedOperations:
+    """Test failure bookkeeping in sync stats."""
+
+    def test_failure_records_are_bounded(self, state_manager, monkeypatch):
+        """Test only the newest records are kept while counters keep the total."""
+        monkeypatch.setattr(enhanced_state, "_MAX_FAILED_OPERATIONS", 2)
+        state = state_manager.create_sync_state("sync_test")
+
+        for i in range(3):
+            state_manager.mark_failed(f"u{i}", "user", "boom")
+
+        assert [r["resource_id"] for r in state.stats["failed_operations"]] == ["u1", "u2"]
+        assert state.stats["failed_users"] == 3
+        assert state.model_dump(mode="json")["stats"]["failed_operations"][0]["resource_id"] == "u1"
+
+    def test_loaded_failure_list_is_extended(self, state_manager):
+        """Test failures recorded before a reload are kept alongside new ones."""
+        state = state_manager.create_sync_state("sync_test")
+        state_manager.mark_failed("u0", "user", "boom")
+        state_manager.save_sync_state(state)
+        state_manager.load_sync_state("sync_test")
+
+        state_manager.mark_failed("u1", "user", "boom")
+
+        failures = state_manager.get_current_state().stats["failed_operations"]
+        assert [r["resource_id"] for r in failures] == ["u0", "u1"]
+
+
+class TestClock:
+    """Test the coarse state clock."""
+
+    def test_now_reuses_datetime_within_resolution(self, monkeypatch):
+        """Test reads within the resolution share one datetime."""
+        ticks = iter([1000.0, 1000.01, 1000.2])
+        monkeypatch.setattr(enhanced_state.time, "monotonic", lambda: next(ticks))
+        monkeypatch.setattr(enhanced_state, "_clock_cache", (float("-inf"), datetime.now(timezone.utc)))
+
+        first = enhanced_state._now()
+        second = enhanced_state._now()
+        third = enhanced_state._now()
+
+        assert first is second
+        assert third is not first
+        assert first.tzinfo is timezone.utc
+
+    def test_now_iso_formats_once_per_tick(self, monkeypatch):
+        """Test ISO strings are reused while the clock tick is unchanged."""
+        ticks = iter([1000.0, 1000.01, 1000.2])
+        monkeypatch.setattr(enhanced_state.time, "monotonic", lambda: next(ticks))
+        monkeypatch.setattr(enhanced_state, "_clock_cache", (float("-inf"), datetime.now(timezone.utc)))
+
+        first = enhanced_state._now_iso()
+        second = enhanced_state._now_iso()
+        third = enhanced_state._now_iso()
+
+        assert first is second
+        assert third is not first
+        assert datetime.fromisoformat(first).tzinfo == timezone.utc
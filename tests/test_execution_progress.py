@@ -0,0 +1,71 @@
+"""Tests for ExecutionProgress tracking."""
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from sync.core.executor import ExecutionProgress
+
+
+@pytest.fixture
+def progress():
+    """Create an empty execution progress tracker."""
+    return ExecutionProgress(
+        execution_id="test-exec-123",
+        plan_id="test-plan-123",
+        started_at=datetime.now(timezone.utc),
+        total_items=5,
+    )
+
+
+class TestExecutionDuration:
+    """Test execution duration tracking."""
+
+    def test_duration_uses_monotonic_clock(self):
+        """Test that duration ignores wall clock changes after start."""
+        progress = ExecutionProgress(
+            execution_id="test-exec-123",
+            plan_id="test-plan-123",
+            # A started_at far in the past must not inflate the duration
+            started_at=datetime(2000, 1, 1, tzinfo=timezone.utc),
+            total_items=5,
+        )
+
+        assert progress.get_duration_seconds() is None
+
+        progress.mark_completed()
+
+        assert progress.completed_at is not None
+        assert 0 <= progress.get_duration_seconds() < 60
+
+    def test_duration_falls_back_to_assigned_completed_at(self, progress):
+        """Test completed_at assigned directly still yields a wall clock duration."""
+        progress.started_at = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        progress.completed_at = datetime(2024, 1, 1, 12, 0, 30, tzinfo=timezone.utc)
+
+        assert progress.get_duration_seconds() == 30.0
+
+
+class TestMessageLimits:
+    """Test the bound on stored error and warning messages."""
+
+    def test_add_error_past_limit_is_counted(self, progress):
+        """Test that errors past the message limit are counted, not stored."""
+        with patch("sync.core.executor._MAX_PROGRESS_MESSAGES", 2):
+            for i in range(5):
+                progress.add_error(f"Error {i}")
+
+        assert progress.errors == ["Error 0", "Error 1"]
+        assert progress.error_overflow == 3
+
+    def test_add_warning_past_limit_is_counted(self, progress):
+        """Test that warnings past the message limit are counted, not stored."""
+        with patch("sync.core.executor._MAX_PROGRESS_MESSAGES", 2):
+            for i in range(4):
+                progress.add_warning(f"Warning {i}")
+
+        assert progress.warnings == ["Warning 0", "Warning 1"]
+        assert progress.warning_overflow == 2
+        # Errors have their own budget
+        assert progress.error_overflow == 0
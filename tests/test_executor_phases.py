@@ -0,0 +1,328 @@
+"""Tests for SyncExecutor resource phase execution."""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from sync.audit.logger import AuditLogger
+from sync.core.executor import SyncExecutor, ExecutionProgress
+from sync.resources.base import SyncPlanItem, SyncAction, SyncResult
+
+
+class FakeSyncer:
+    """Syncer stand-in that records calls and shares a concurrency tracker."""
+
+    def __init__(
+        self,
+        resource_type: str,
+        tracker: Dict[str, Any],
+        delays: Optional[Dict[str, float]] = None,
+        raise_ids: tuple = (),
+        fail_ids: tuple = (),
+    ):
+        self.resource_type = resource_type
+        self.tracker = tracker
+        self.delays = delays or {}
+        self.raise_ids = raise_ids
+        self.fail_ids = fail_ids
+        self.started: List[str] = []
+        self.finished: List[str] = []
+
+    async def _execute_plan_item(self, item: SyncPlanItem, dry_run: bool = False) -> SyncResult:
+        resource_id = item.okta_resource_id
+        self.started.append(resource_id)
+        self.tracker["log"].append(("start", resource_id))
+        self.tracker["running"] += 1
+        self.tracker["max_running"] = max(self.tracker["max_running"], self.tracker["running"])
+        try:
+            await asyncio.sleep(self.delays.get(resource_id, 0.001))
+        finally:
+            self.tracker["running"] -= 1
+        self.finished.append(resource_id)
+        self.tracker["log"].append(("finish", resource_id))
+
+        if resource_id in self.raise_ids:
+            raise RuntimeError(f"boom {resource_id}")
+        return SyncResult(
+            operation_id=f"op-{resource_id}",
+            okta_resource_id=resource_id,
+            braintrust_org=item.braintrust_org,
+            action=item.action,
+            success=resource_id not in self.fail_ids,
+            error_message="rejected" if resource_id in self.fail_ids else None,
+        )
+
+
+def make_items(resource_type: str, ids: List[str], org: str = "org1") -> List[SyncPlanItem]:
+    """Create plan items for the given resource ids."""
+    return [
+        SyncPlanItem(
+            okta_resource_id=resource_id,
+            okta_resource_type=resource_type,
+            braintrust_org=org,
+            action=SyncAction.CREATE,
+            reason="test",
+        )
+        for resource_id in ids
+    ]
+
+
+@pytest.fixture
+def tracker():
+    """Shared counters and start/finish log for fake syncer calls."""
+    return {"running": 0, "max_running": 0, "log": []}
+
+
+@pytest.fixture
+def audit_logger(tmp_path):
+    """Create an AuditLogger writing to a temporary directory."""
+    logger = AuditLogger(audit_dir=tmp_path)
+    logger.start_execution_audit("exec-test")
+    return logger
+
+
+@pytest.fixture
+def executor(audit_logger):
+    """Create a SyncExecutor with mock clients and a real audit logger."""
+    return SyncExecutor(
+        okta_client=MagicMock(),
+        braintrust_clients={"org1": MagicMock(), "org2": MagicMock()},
+        state_manager=MagicMock(),
+        audit_logger=audit_logger,
+    )
+
+
+@pytest.fixture
+def progress():
+    """Create an empty execution progress tracker."""
+    return ExecutionProgress(
+        execution_id="exec-test",
+        plan_id="plan-test",
+        started_at=datetime.now(timezone.utc),
+    )
+
+
+class TestResourcePhaseFailFast:
+    """Test stopping a phase on the first failure."""
+
+    @pytest.mark.asyncio
+    async def test_stops_on_first_failure_without_continue_on_error(
+        self, executor, audit_logger, progress, tracker
+    ):
+        """Test later items are not executed and the original exception propagates."""
+        ids = [f"user{i}" for i in range(50)]
+        syncer = FakeSyncer("user", tracker, raise_ids=("user7",))
+
+        with pytest.raises(RuntimeError, match="boom user7"):
+            await executor._execute_resource_phase(
+                items=make_items("user", ids),
+                syncer=syncer,
+                progress=progress,
+                dry_run=False,
+                continue_on_error=False,
+                max_concurrent=5,
+            )
+
+        # Only items that got a semaphore slot before the failure were started
+        assert len(syncer.started) < len(ids)
+        assert "user49" not in syncer.started
+        # Items already in flight finished and were all accounted for
+        assert sorted(syncer.finished) == sorted(syncer.started)
+        assert progress.completed_items + progress.failed_items == len(syncer.started)
+        assert audit_logger.current_summary.total_events == 1 + progress.completed_items
+        assert tracker["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_runs_every_item_with_continue_on_error(self, executor, progress, tracker):
+        """Test failures are counted without stopping the phase."""
+        ids = [f"user{i}" for i in range(20)]
+        syncer = FakeSyncer("user", tracker, raise_ids=("user3",), fail_ids=("user9",))
+
+        await executor._execute_resource_phase(
+            items=make_items("user", ids),
+            syncer=syncer,
+            progress=progress,
+            dry_run=False,
+            continue_on_error=True,
+            max_concurrent=5,
+        )
+
+        assert sorted(syncer.started) == sorted(ids)
+        assert progress.completed_items == 18
+        # Raised errors are reported as errors; failed results are counted
+        assert progress.failed_items == 1
+        assert any("user3" in error for error in progress.errors)
+
+
+class TestUserGroupPipelining:
+    """Test per-org pipelining of user and group phases."""
+
+    @pytest.mark.asyncio
+    async def test_org_groups_start_while_other_org_users_run(self, executor, progress, tracker):
+        """Test an org's groups start once its own users finish, within the shared bound."""
+        executor.user_syncer = FakeSyncer(
+            "user", tracker, delays={"b-user1": 0.05, "b-user2": 0.05}
+        )
+        executor.group_syncer = FakeSyncer("group", tracker)
+        plan = MagicMock()
+        plan.user_items = make_items("user", ["a-user1"], "org1") + make_items(
+            "user", ["b-user1", "b-user2"], "org2"
+        )
+        plan.group_items = make_items("group", ["a-group1"], "org1") + make_items(
+            "group", ["b-group1"], "org2"
+        )
+
+        await executor._execute_user_group_phases(
+            plan=plan,
+            progress=progress,
+            dry_run=False,
+            continue_on_error=True,
+            max_concurrent=3,
+        )
+
+        log = tracker["log"]
+        # org1's groups start while org2's users are still in flight
+        assert log.index(("start", "a-group1")) < log.index(("finish", "b-user1"))
+        # org2's groups still wait for org2's own users
+        assert log.index(("start", "b-group1")) > log.index(("finish", "b-user1"))
+        assert log.index(("start", "b-group1")) > log.index(("finish", "b-user2"))
+        assert tracker["max_running"] <= 3
+        assert progress.completed_items == 5
+        assert progress.current_phase == "groups"
+
+    @pytest.mark.asyncio
+    async def test_shared_semaphore_bounds_all_orgs(self, executor, progress, tracker):
+        """Test the concurrency bound applies across orgs, not per org."""
+        executor.user_syncer = FakeSyncer("user", tracker, delays={
+            f"{org}-user{i}": 0.01 for org in ("a", "b") for i in range(5)
+        })
+        executor.group_syncer = FakeSyncer("group", tracker)
+        plan = MagicMock()
+        plan.user_items = make_items("user", [f"a-user{i}" for i in range(5)], "org1") + make_items(
+            "user", [f"b-user{i}" for i in range(5)], "org2"
+        )
+        plan.group_items = []
+
+        await executor._execute_user_group_phases(
+            plan=plan,
+            progress=progress,
+            dry_run=False,
+            continue_on_error=True,
+            max_concurrent=2,
+        )
+
+        assert tracker["max_running"] == 2
+        assert progress.completed_items == 10
+
+    @pytest.mark.asyncio
+    async def test_concurrent_org_failures_are_all_reported(self, executor, progress, tracker):
+        """Test the first org failure propagates and the others are logged."""
+        executor.user_syncer = FakeSyncer(
+            "user", tracker, raise_ids=("a-user1", "b-user1")
+        )
+        executor.group_syncer = FakeSyncer("group", tracker)
+        executor._logger = MagicMock()
+        plan = MagicMock()
+        plan.user_items = make_items("user", ["a-user1"], "org1") + make_items(
+            "user", ["b-user1"], "org2"
+        )
+        plan.group_items = make_items("group", ["a-group1"], "org1")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await executor._execute_user_group_phases(
+                plan=plan,
+                progress=progress,
+                dry_run=False,
+                continue_on_error=False,
+                max_concurrent=5,
+            )
+
+        additional = [
+            call for call in executor._logger.error.call_args_list
+            if call.args == ("Additional user/group phase failure",)
+        ]
+        assert len(additional) == 1
+        assert "boom" in additional[0].kwargs["error"]
+        assert executor.group_syncer.started == []
+
+
+class TestResourcePhaseProgress:
+    """Test progress accounting as items complete."""
+
+    @pytest.mark.asyncio
+    async def test_errors_are_attributed_to_the_failing_item(self, executor, progress, tracker):
+        """Test error context names the failing item even when items finish out of order."""
+        ids = [f"user{i}" for i in range(10)]
+        # Later items finish first, so completion order is the reverse of item order
+        syncer = FakeSyncer(
+            "user", tracker,
+            delays={resource_id: (10 - i) * 0.005 for i, resource_id in enumerate(ids)},
+            raise_ids=("user7",),
+        )
+
+        with pytest.raises(RuntimeError):
+            await executor._execute_resource_phase(
+                items=make_items("user", ids),
+                syncer=syncer,
+                progress=progress,
+                dry_run=False,
+                continue_on_error=False,
+                max_concurrent=10,
+            )
+
+        # The phase records the failure with the item's index and ID as context
+        [phase_error] = [error for error in progress.errors if "(Context:" in error]
+        assert "'item_index': 7" in phase_error
+        assert "'item_id': 'user7'" in phase_error
+        # user8 and user9 finished before user7 and were already counted
+        assert progress.completed_items >= 2
+
+    @pytest.mark.asyncio
+    async def test_progress_callback_sees_incremental_counts(self, executor, progress, tracker):
+        """Test the callback fires while items are still running, with growing counts."""
+        ids = [f"user{i}" for i in range(6)]
+        syncer = FakeSyncer(
+            "user", tracker,
+            delays={resource_id: (i + 1) * 0.01 for i, resource_id in enumerate(ids)},
+        )
+        snapshots = []
+        executor.progress_callback = lambda p: snapshots.append(
+            (p.completed_items, tracker["running"])
+        )
+
+        executor._start_progress_notifier(progress)
+        try:
+            await executor._execute_resource_phase(
+                items=make_items("user", ids),
+                syncer=syncer,
+                progress=progress,
+                dry_run=False,
+                continue_on_error=True,
+                max_concurrent=6,
+            )
+            # Let the notifier report the last completion
+            await asyncio.sleep(0)
+        finally:
+            await executor._stop_progress_notifier()
+
+        counts = [completed for completed, _ in snapshots]
+        assert counts == sorted(counts)
+        assert counts[-1] == len(ids)
+        # At least one notification arrived while other items were still running
+        assert any(running > 0 for _, running in snapshots)
+        assert len(set(counts)) > 1
+        assert progress.org_progress["org1"]["completed"] == len(ids)
+
+    @pytest.mark.asyncio
+    async def test_no_notifier_without_callback(self, executor, progress):
+        """Test the notifier task only runs when a callback is registered."""
+        executor.progress_callback = None
+
+        executor._start_progress_notifier(progress)
+
+        assert executor._progress_task is None
+        # Signalling progress without a notifier is a no-op
+        executor._progress_changed()
@@ -0,0 +1,337 @@
+"""Tests for role-project configuration models."""
+
+import re
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from sync.config import role_project_models
+from sync.config.role_project_models import (
+    ADMIN_ROLE,
+    DATA_SCIENTIST_ROLE,
+    STANDARD_ROLES,
+    VIEWER_ROLE,
+    BraintrustObjectType,
+    BraintrustOrgRoleConfig,
+    BraintrustPermission,
+    GroupRoleAssignment,
+    ProjectMatchRule,
+    ProjectNameIndex,
+    RoleDefinition,
+    RoleProjectConfig,
+    RoleProjectRules,
+    compile_project_pattern,
+    permissions_to_api_format,
+    shared_permission,
+    validate_predefined_roles,
+)
+
+
+class TestPredefinedRoles:
+    """Test the predefined role constants."""
+
+    def test_predefined_roles_are_valid(self):
+        """Test that the trusted predefined roles pass full validation."""
+        validate_predefined_roles()
+
+    @pytest.mark.parametrize("role", STANDARD_ROLES, ids=lambda r: r.name)
+    def test_predefined_role_round_trip(self, role):
+        """Test that predefined roles survive a validate/dump round trip."""
+        validated = RoleDefinition.model_validate(role.model_dump())
+
+        assert validated == role
+
+    def test_predefined_permissions_use_enums(self):
+        """Test that predefined permissions keep enum values for API conversion."""
+        permission = ADMIN_ROLE.member_permissions[0]
+
+        assert permission.permission is BraintrustPermission.CREATE
+        assert permission.permission.value == "create"
+        assert permission.restrict_object_type is None
+
+    def test_predefined_roles_share_permissions(self):
+        """Test that identical permissions across roles are one instance."""
+        assert ADMIN_ROLE.member_permissions[1] is VIEWER_ROLE.member_permissions[0]
+
+    def test_loaded_roles_share_permissions(self):
+        """Test that validated roles reuse the shared permission instances."""
+        role = RoleDefinition(
+            name="Reader",
+            member_permissions=[{"permission": "read"}, {"permission": "create", "restrict_object_type": "dataset"}],
+        )
+
+        assert role.member_permissions[0] is shared_permission(BraintrustPermission.READ)
+        assert role.member_permissions[1] is shared_permission("create", "dataset")
+        assert role.member_permissions[1].restrict_object_type is BraintrustObjectType.DATASET
+
+
+class TestProjectMatchRule:
+    """Test ProjectMatchRule criteria and compiled regex matching."""
+
+    def test_rule_requires_a_criterion(self):
+        """Test that an empty match rule is rejected."""
+        with pytest.raises(ValidationError, match="At least one project matching rule"):
+            ProjectMatchRule(exclude_patterns=["tmp-.*"])
+
+    def test_explicit_lists_are_immutable_sets(self):
+        """Test that explicit lists are stored for O(1) membership checks."""
+        rule = ProjectMatchRule(
+            project_names=["api", "web", "api"],
+            project_ids=["id-1", "id-2"],
+            name_contains=["ml", "ai"],
+        )
+
+        assert rule.project_names == frozenset({"api", "web"})
+        assert "id-2" in rule.project_ids
+        assert rule.name_contains == ("ml", "ai")
+        assert sorted(rule.model_dump(mode="json")["project_ids"]) == ["id-1", "id-2"]
+
+    def test_name_pattern_compiled_once(self):
+        """Test that name_pattern is compiled at validation time."""
+        rule = ProjectMatchRule(name_pattern="ml-.*")
+
+        assert rule._compiled_name_pattern is not None
+        assert rule.matches_name_pattern("ml-training")
+        assert not rule.matches_name_pattern("prod-ml-training")
+
+    def test_exclude_patterns(self):
+        """Test that the first matching exclude pattern is reported."""
+        rule = ProjectMatchRule(all_projects=True, exclude_patterns=["test-.*", "tmp"])
+
+        assert rule.find_exclude_pattern("test-project") == "test-.*"
+        assert rule.find_exclude_pattern("tmp-scratch") == "tmp"
+        assert rule.find_exclude_pattern("production") is None
+
+    def test_invalid_patterns_are_reported(self):
+        """Test that invalid regexes never match and are surfaced."""
+        rule = ProjectMatchRule(name_pattern="(unclosed", exclude_patterns=["[bad", "ok"])
+
+        assert not rule.matches_name_pattern("(unclosed")
+        assert rule.invalid_patterns == ["(unclosed", "[bad"]
+
+    @pytest.mark.parametrize(
+        ("pattern", "rewritten", "use_search"),
+        [
+            ("(?i).*ml.*|.*machine.learning.*", "(?i)ml|machine.learning", True),
+            (".*-prod", "-prod", True),
+            ("ml-.*", "ml-", False),
+            ("ml.*|.*ai", "ml|.*ai", False),
+            (r"v1\.*", r"v1\.*", False),
+            ("[.*|]x|.*y", "[.*|]x|.*y", False),
+        ],
+    )
+    def test_wildcards_are_stripped(self, pattern, rewritten, use_search):
+        """Test that redundant leading/trailing wildcards are removed."""
+        compiled = compile_project_pattern(pattern)
+
+        assert compiled.regex.pattern == rewritten
+        assert compiled.use_search is use_search
+
+    @pytest.mark.parametrize(
+        "pattern",
+        ["(?i).*ml.*|.*machine.learning.*", ".*-prod", "ml-.*", "ml.*|.*ai", r"v1\.*", ".*"],
+    )
+    @pytest.mark.parametrize(
+        "name",
+        ["ml-service", "ML-Service", "core-ml", "machine-learning", "api-prod", "v1...", "x-ai", ""],
+    )
+    def test_rewritten_patterns_match_like_re_match(self, pattern, name):
+        """Test that the rewrite never changes the match result."""
+        compiled = compile_project_pattern(pattern)
+
+        assert compiled.matches(name) == bool(re.match(pattern, name))
+
+    def test_nested_quantifiers_are_flagged(self, monkeypatch):
+        """Test that patterns prone to catastrophic backtracking are reported."""
+        monkeypatch.setattr(role_project_models, "_re2", None)
+        rule = ProjectMatchRule(name_pattern="(a+)+b", exclude_patterns=["tmp-.*"])
+
+        assert rule.backtracking_patterns == ["(a+)+b"]
+
+    def test_linear_time_engine_is_preferred(self, monkeypatch):
+        """Test that an available re2 engine is used and clears backtracking warnings."""
+        fake_re2 = MagicMock()
+        fake_re2.compile.side_effect = re.compile
+        monkeypatch.setattr(role_project_models, "_re2", fake_re2)
+
+        rule = ProjectMatchRule(name_pattern="(a+)+b")
+
+        fake_re2.compile.assert_called_once_with("(a+)+b")
+        assert rule.matches_name_pattern("aab")
+        assert rule.backtracking_patterns == []
+
+    def test_unsupported_re2_syntax_falls_back(self, monkeypatch):
+        """Test that patterns re2 rejects still compile with the re module."""
+        fake_re2 = MagicMock()
+        fake_re2.compile.side_effect = ValueError("unsupported")
+        monkeypatch.setattr(role_project_models, "_re2", fake_re2)
+
+        rule = ProjectMatchRule(name_pattern=r"(a)\1")
+
+        assert rule.matches_name_pattern("aa")
+        assert rule.invalid_patterns == []
+
+
+class TestRoleProjectRules:
+    """Test per-org config resolution."""
+
+    @staticmethod
+    def _config(role_name):
+        return RoleProjectConfig(
+            group_assignments=[
+                GroupRoleAssignment(
+                    group_name="Engineering",
+                    role_name=role_name,
+                    project_match=ProjectMatchRule(all_projects=True),
+                )
+            ]
+        )
+
+    def test_get_config_for_org(self):
+        """Test that org configs override the global config when enabled."""
+        global_config = self._config("Viewer")
+        prod_config = self._config("Engineer")
+        rules = RoleProjectRules(
+            global_config=global_config,
+            org_configs=[
+                BraintrustOrgRoleConfig(braintrust_org="prod", role_project_config=prod_config),
+                BraintrustOrgRoleConfig(
+                    braintrust_org="staging",
+                    role_project_config=self._config("Admin"),
+                    enabled=False,
+                ),
+                BraintrustOrgRoleConfig(braintrust_org="prod", role_project_config=self._config("Admin")),
+            ],
+        )
+
+        assert rules.get_config_for_org("prod") is prod_config
+        assert rules.get_config_for_org("staging") is global_config
+        assert rules.get_config_for_org("unknown") is global_config
+
+    def test_names_are_interned(self):
+        """Test that org, group and role names are interned at validation time."""
+        org_config = BraintrustOrgRoleConfig(
+            braintrust_org="".join(["pr", "od"]),
+            role_project_config=self._config("".join(["Eng", "ineer"])),
+        )
+
+        assert org_config.braintrust_org is sys.intern("prod")
+        assignment = org_config.role_project_config.group_assignments[0]
+        assert assignment.role_name is sys.intern("Engineer")
+
+    def test_config_models_are_immutable(self):
+        """Test that loaded configs reject mutation and unknown keys."""
+        config = self._config("Viewer")
+
+        with pytest.raises(ValidationError):
+            config.dry_run = True
+        with pytest.raises(ValidationError):
+            ProjectMatchRule(all_projects=True, name_regex="typo")
+
+
+class TestProjectMatchRuleTags:
+    """Test tag-based matching criteria."""
+
+    def test_required_tags_accept_mapping(self):
+        """Test that the documented mapping form is stored as sorted pairs."""
+        rule = ProjectMatchRule(required_tags={"team": "ml", "environment": "production"})
+
+        assert rule.required_tags == (("environment", "production"), ("team", "ml"))
+        assert hash(rule.required_tags) == hash(
+            ProjectMatchRule(required_tags={"environment": "production", "team": "ml"}).required_tags
+        )
+
+    def test_required_tags_dump_as_mapping(self):
+        """Test that dumps keep the configuration format."""
+        rule = ProjectMatchRule(required_tags={"team": "ml"})
+
+        assert rule.model_dump(mode="json")["required_tags"] == {"team": "ml"}
+        assert ProjectMatchRule.model_validate(rule.model_dump()) == rule
+
+    def test_matches_tags(self):
+        """Test that every required tag must be present on the project."""
+        rule = ProjectMatchRule(required_tags={"team": "ml", "environment": "production"})
+
+        assert rule.matches_tags({"team": "ml", "environment": "production", "tier": "1"})
+        assert not rule.matches_tags({"team": "ml"})
+        assert not ProjectMatchRule(all_projects=True).matches_tags({"team": "ml"})
+
+
+class TestProjectNameIndex:
+    """Test the combined name-matching index over group assignments."""
+
+    @staticmethod
+    def _assignment(**match):
+        return GroupRoleAssignment(
+            group_name="Engineering",
+            role_name="Engineer",
+            project_match=ProjectMatchRule(**match),
+        )
+
+    def test_match_project(self):
+        """Test that each kind of name criterion is matched through the index."""
+        assignments = [
+            self._assignment(name_starts_with="ML-"),
+            self._assignment(name_ends_with="-prod"),
+            self._assignment(name_contains=["api", "service"]),
+            self._assignment(name_pattern=".*beta.*"),
+            self._assignment(all_projects=True),
+            self._assignment(project_names=["ml-training"]),
+            self._assignment(name_contains=["API"]),
+        ]
+        config = RoleProjectConfig(group_assignments=assignments)
+
+        matched = config.match_project("ml-api-prod")
+
+        assert matched == [assignments[i] for i in (0, 1, 2, 4, 6)]
+        assert config.match_project("beta") == [assignments[3], assignments[4]]
+
+    def test_index_is_built_once(self):
+        """Test that the index is cached on the config instance."""
+        config = RoleProjectConfig(group_assignments=[self._assignment(all_projects=True)])
+
+        assert config.project_name_index is config.project_name_index
+
+    @pytest.mark.parametrize("name", ["", "m", "ml-", "x-prod", "prod", "Service-ML-", "abc"])
+    def test_short_names(self, name):
+        """Test names shorter than the configured literals."""
+        assignments = [
+            self._assignment(name_starts_with="ml-"),
+            self._assignment(name_ends_with="-prod"),
+            self._assignment(name_contains=["service"]),
+        ]
+        index = ProjectNameIndex(assignments)
+        lowered = name.lower()
+        expected = [
+            assignments[0] if lowered.startswith("ml-") else None,
+            assignments[1] if lowered.endswith("-prod") else None,
+            assignments[2] if "service" in lowered else None,
+        ]
+
+        assert index.match(name) == [a for a in expected if a is not None]
+
+
+class TestPermissionsApiFormat:
+    """Test conversion of permissions to the Braintrust API format."""
+
+    def test_permissions_to_api_format(self):
+        """Test that permissions serialize to plain API payload dicts."""
+        payload = permissions_to_api_format(DATA_SCIENTIST_ROLE.member_permissions[:2])
+
+        assert payload == [
+            {"permission": "read", "restrict_object_type": None},
+            {"permission": "create", "restrict_object_type": "experiment"},
+        ]
+
+    def test_permissions_to_api_format_accepts_dicts(self):
+        """Test that already-dumped permission dicts are accepted."""
+        payload = permissions_to_api_format([{"permission": "update", "restrict_object_type": "dataset"}])
+
+        assert payload == [{"permission": "update", "restrict_object_type": "dataset"}]
+
+    def test_invalid_permission_is_rejected(self):
+        """Test that unknown permissions fail validation."""
+        with pytest.raises(ValidationError):
+            permissions_to_api_format([{"permission": "superuser"}])
@@ -0,0 +1,55 @@
+"""Tests for synchronization configuration models."""
+
+import sys
+from pathlib import Path
+
+from sync.config import base_models
+from sync.config.base_models import IdentityMappingStrategy, config_field
+from sync.config.sync_models import GroupSyncMapping, IdentityMappingConfig, UserSyncMapping
+
+
+class TestIdentityMappingConfig:
+    """Test identity mapping configuration."""
+
+    def test_mapping_file_accepts_path(self):
+        """Test that Path objects are still accepted for mapping_file."""
+        config = IdentityMappingConfig(
+            strategy=IdentityMappingStrategy.MAPPING_FILE,
+            mapping_file=Path("mappings/users.csv"),
+        )
+
+        assert config.mapping_file == str(Path("mappings/users.csv"))
+
+
+class TestSyncMappings:
+    """Test user and group sync mapping rules."""
+
+    def test_org_names_are_interned(self):
+        """Test that mapping org names are interned at validation time."""
+        user_mapping = UserSyncMapping(okta_filter='status eq "ACTIVE"', braintrust_orgs=["".join(["org", "1"])])
+        group_mapping = GroupSyncMapping(okta_group_filter='type eq "OKTA_GROUP"', braintrust_orgs=["".join(["org", "1"])])
+
+        assert user_mapping.braintrust_orgs == ["org1"]
+        assert user_mapping.braintrust_orgs[0] is sys.intern("org1")
+        assert group_mapping.braintrust_orgs[0] is user_mapping.braintrust_orgs[0]
+
+
+class TestConfigField:
+    """Test the config_field helper used by configuration models."""
+
+    def test_descriptions_kept_by_default(self):
+        """Test that descriptions are kept unless stripping is enabled."""
+        field = config_field(True, description="Whether sync is enabled")
+
+        assert field.description == "Whether sync is enabled"
+        assert field.default is True
+
+    def test_descriptions_stripped_when_enabled(self, monkeypatch):
+        """Test that BTSYNC_STRIP_DOCS drops descriptions."""
+        monkeypatch.setattr(base_models, "_STRIP_FIELD_DOCS", True)
+
+        field = config_field(default_factory=list, description="Mapping rules", min_length=1)
+
+        assert field.description is None
+        assert field.default_factory is list
+        assert field.is_required() is False